@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""End-to-end UI latency benchmark.
+
+Runs SystemMonitorApp headless under Textual's run_test() pilot with
+synthetic, high-cardinality data sources and measures:
+
+- keypress-to-repaint latency for g (next GPU), n (next interface) and
+  l (log panel): from the key press to the end of the first frame that
+  starts after the key's action has run
+- frames per second delivered while the keys are being pressed, and the
+  time each frame takes to compose and render to terminal output
+- peak RSS of each run
+
+The sources are stand-in `nvidia-smi`, `ip` and `docker` executables put
+first on PATH, so the collectors' real subprocess, parsing and rendering
+paths are all exercised.  Each run is a fresh interpreter (peak RSS is a
+per-process high-water mark); the report's metrics, aggregated over all
+runs, are compared against a checked-in baseline.  Exits 1 if any metric
+regressed beyond the tolerance.
+
+    python3 benchmarks/ui_latency.py                    # 3 runs, ui-latency-report.json, compare
+    python3 benchmarks/ui_latency.py --update-baseline  # accept the current numbers
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import math
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "system-info-textual-tui.py")
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+LOAD = {"gpus": 16, "processes": 1000, "interfaces": 500, "containers": 500}
+KEYS = {"g": "next_gpu", "n": "next_interface", "l": "toggle_log_panel"}
+VARIANTS = 4            # distinct outputs per tool, picked by the tool's PID, so values keep changing
+SCREEN_SIZE = (160, 50)
+FRAME_TIMEOUT = 5.0     # seconds to wait for the repaint after a key before counting it as missed
+
+# Metrics where a bigger number is better; everything else regresses upward
+HIGHER_IS_BETTER = {"fps"}
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SYNTHETIC SOURCES - Stand-in nvidia-smi, ip and docker executables
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def write_sources(directory, load=LOAD, seed=0):
+    """Write fake tools and their canned output to `directory`; returns the bin dir for PATH.
+
+    The tools are /bin/sh scripts that only cat or echo, so a spawn costs
+    about what the real binaries' fork/exec does (the network collector
+    calls `ip` twice per interface).
+    """
+    rng = random.Random(seed)
+    data = os.path.join(directory, "data")
+    bin_dir = os.path.join(directory, "bin")
+    os.makedirs(data)
+    os.makedirs(bin_dir)
+
+    def write(name, text):
+        with open(os.path.join(data, name), "w") as f:
+            f.write(text)
+
+    gpus, processes = load["gpus"], load["processes"]
+    write("gpu-count", f"{gpus}\n" * gpus)
+    for variant in range(VARIANTS):
+        write(f"gpu-query.{variant}", "".join(
+            f"{i}, NVIDIA H100 80GB HBM3, {rng.randint(35, 88)}, {rng.randint(1000, 80000)}, 81559, "
+            f"{rng.randint(0, 100)}, {rng.uniform(80, 700):.2f}, 700.00, {rng.randint(1100, 1980)}, 1980, 2619, 5, 16, "
+            f"0x{rng.choice((0, 0x1, 0x4, 0x20)):016X}, {rng.randint(0, 3)}, 0\n"
+            for i in range(gpus)))
+        sections = []
+        for i in range(gpus):
+            sections.append(f"GPU 00000000:{i + 1:02X}:00.0\n    Product Name : NVIDIA H100 80GB HBM3\n    PCI\n"
+                            f"        Tx Throughput : {rng.randint(0, 25000000)} KB/s\n"
+                            f"        Rx Throughput : {rng.randint(0, 25000000)} KB/s\n    Processes\n")
+            for pid in range(i, processes, gpus):      # spread the processes round-robin
+                sections.append(
+                    f"        GPU instance ID : N/A\n"
+                    f"        Process ID : {4000000 + pid}\n"
+                    f"            Type : C\n"
+                    f"            Name : /usr/bin/python3 worker_{pid}.py\n"
+                    f"            Used GPU Memory : {rng.randint(100, 8000)} MiB\n")
+        write(f"gpu-q.{variant}", "".join(sections))
+
+    write("links", "".join(
+        f"{i + 2}: eth{i}: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1500 qdisc mq state UP mode DEFAULT group default qlen 1000\n"
+        f"    link/ether 02:00:00:00:{i // 256:02x}:{i % 256:02x} brd ff:ff:ff:ff:ff:ff\n"
+        for i in range(load["interfaces"])))
+
+    containers = load["containers"]
+    write("ps", "".join(json.dumps({
+        "ID": f"{i:064x}", "Names": f"svc-{i}", "Image": f"registry.local/app{i % 20}:latest",
+        "State": "running" if i % 10 else "exited", "Ports": f"0.0.0.0:{8000 + i}->80/tcp" if i % 3 == 0 else "",
+    }) + "\n" for i in range(containers)))
+    for variant in range(VARIANTS):
+        write(f"stats.{variant}", "".join(json.dumps({
+            "ID": f"{i:064x}", "Name": f"svc-{i}", "CPUPerc": f"{rng.uniform(0, 200):.2f}%",
+            "MemUsage": f"{rng.uniform(10, 900):.1f}MiB / 62.7GiB", "MemPerc": f"{rng.uniform(0, 5):.2f}%",
+        }) + "\n" for i in range(containers) if i % 10))
+
+    scripts = {
+        "nvidia-smi": f"""case "$*" in
+    *--query-gpu=count*) exec cat {data}/gpu-count ;;
+    *--query-gpu=*) exec cat {data}/gpu-query.$(($$ % {VARIANTS})) ;;
+    *-q*) exec cat {data}/gpu-q.$(($$ % {VARIANTS})) ;;
+esac
+exit 1
+""",
+        "ip": f"""case "$1 $2" in
+    "link show")
+        [ -z "$3" ] && exec cat {data}/links
+        echo "2: $3: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1500 qdisc mq state UP mode DEFAULT" ;;
+    "addr show")
+        echo "2: $3: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1500 qdisc mq state UP"
+        echo "    inet 10.0.0.2/24 brd 10.0.0.255 scope global $3" ;;
+    *) exit 1 ;;
+esac
+""",
+        "docker": f"""case "$1" in
+    ps) exec cat {data}/ps ;;
+    stats) exec cat {data}/stats.$(($$ % {VARIANTS})) ;;
+    inspect) shift 3; for id; do echo "$id 0"; done ;;
+    *) exit 1 ;;
+esac
+""",
+    }
+    for name, body in scripts.items():
+        path = os.path.join(bin_dir, name)
+        with open(path, "w") as f:
+            f.write("#!/bin/sh\n" + body)
+        os.chmod(path, 0o755)
+    return bin_dir
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SINGLE RUN - One headless app session in this interpreter
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def load_app_module():
+    spec = importlib.util.spec_from_file_location("system_info_textual_tui", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def instrumented(app_class):
+    """Subclass of the app that timestamps frames and key actions.
+
+    A frame is timed from the start of the screen's compositor refresh to
+    the end of turning its update into terminal output.  Headless Textual
+    skips that last step, so _display() does it here; otherwise the cost
+    of a large repaint would be missing from the numbers.
+    """
+    from textual.screen import Screen
+
+    class BenchApp(app_class):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.frames = []            # (start, end) perf_counter of each displayed frame
+            self.handled = None         # perf_counter when the last key action returned
+            self.displayed = False      # set when a refresh produced output
+
+        def _display(self, screen, renderable):
+            if renderable is not None and not self._batch_count:
+                if hasattr(renderable, "render_segments"):
+                    renderable.render_segments(self.console)
+                self.displayed = True
+            super()._display(screen, renderable)
+
+    def timed(action):
+        def run(self, *args):
+            getattr(app_class, action)(self, *args)
+            self.handled = time.perf_counter()
+        return run
+
+    for name in KEYS.values():
+        setattr(BenchApp, f"action_{name}", timed(f"action_{name}"))
+
+    compositor_refresh = Screen._compositor_refresh
+
+    def timed_refresh(screen):
+        app = screen.app
+        start = time.perf_counter()
+        app.displayed = False
+        compositor_refresh(screen)
+        if app.displayed:
+            app.frames.append((start, time.perf_counter()))
+
+    Screen._compositor_refresh = timed_refresh
+    return BenchApp
+
+
+async def drive(app, presses, settle, warmup):
+    """Wait for live data, then press each key `presses` times; returns the run's metrics"""
+    async with app.run_test(size=SCREEN_SIZE) as pilot:
+        deadline = time.perf_counter() + warmup
+        while time.perf_counter() < deadline and not all(panel.collected for panel in app.collectors.values()):
+            await pilot.pause(0.05)
+        missing = [name for name, panel in app.collectors.items() if not panel.collected]
+
+        latencies = {key: [] for key in KEYS}
+        missed = {key: 0 for key in KEYS}
+        first_frame = len(app.frames)
+        started = time.perf_counter()
+        for _ in range(presses):
+            for key in KEYS:
+                app.handled = None
+                pressed = time.perf_counter()
+                await pilot.press(key)
+                repaint = None
+                deadline = pressed + FRAME_TIMEOUT
+                while repaint is None and time.perf_counter() < deadline:
+                    if app.handled is not None:
+                        repaint = next((end for start, end in reversed(app.frames) if start >= app.handled), None)
+                    if repaint is None:
+                        await pilot.pause(0.001)
+                if repaint is None:
+                    missed[key] += 1
+                else:
+                    latencies[key].append((repaint - pressed) * 1000)
+                await pilot.pause(settle)
+        elapsed = time.perf_counter() - started
+        frames = app.frames[first_frame:]
+
+    samples = {f"latency_ms.{key}": values for key, values in latencies.items()}
+    samples["frame_ms"] = [(end - start) * 1000 for start, end in frames]
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return {
+        "samples": samples,
+        "fps": len(frames) / elapsed,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / (1024 * 1024),
+        "missed_frames": missed,
+        "collectors_without_data": missing,
+    }
+
+
+def run_once(args):
+    module = load_app_module()
+    app = instrumented(module.SystemMonitorApp)(css_path=os.path.join(ROOT, "styles.css"))
+    result = asyncio.run(drive(app, args.presses, args.settle, args.warmup))
+    module.process_runner.shutdown()
+    json.dump(result, sys.stdout)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# REPORT - Aggregate runs and compare against the baseline
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def aggregate(runs):
+    """Report metrics for a set of runs.
+
+    Latency and frame-time percentiles are taken over the samples of all
+    runs pooled together (a p95 of one run's handful of presses is mostly
+    its worst press); FPS is the median run and RSS the highest.
+    """
+    metrics = {}
+    for name in sorted({name for run in runs for name in run["samples"]}):
+        values = [value for run in runs for value in run["samples"].get(name, ())]
+        if values:
+            metrics[f"{name}.p50"] = round(percentile(values, 0.50), 3)
+            metrics[f"{name}.p95"] = round(percentile(values, 0.95), 3)
+    metrics["fps"] = round(statistics.median(run["fps"] for run in runs), 3)
+    metrics["peak_rss_mb"] = round(max(run["peak_rss_mb"] for run in runs), 3)
+    return metrics
+
+
+def compare(metrics, baseline, tolerance):
+    """Metrics that moved the wrong way by more than `tolerance` (a fraction of the baseline)"""
+    regressions = []
+    for name, expected in baseline.items():
+        actual = metrics.get(name)
+        if actual is None or not expected:
+            continue
+        change = (actual - expected) / expected
+        if name in HIGHER_IS_BETTER:
+            change = -change
+        if change > tolerance:
+            regressions.append({"metric": name, "baseline": expected, "actual": actual,
+                                "change": round(change, 3)})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=3, help="fresh app sessions to run (default: %(default)s)")
+    parser.add_argument("--presses", type=int, default=10, help="presses of each key per run (default: %(default)s)")
+    parser.add_argument("--settle", type=float, default=0.05,
+                        help="seconds to wait between presses (default: %(default)s)")
+    parser.add_argument("--warmup", type=float, default=30,
+                        help="max seconds to wait for every collector's first data (default: %(default)s)")
+    parser.add_argument("--output", default="ui-latency-report.json",
+                        help="where to write the JSON report (default: %(default)s)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="allowed change relative to the baseline before flagging (default: %(default)s)")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--run-once", action="store_true", help=argparse.SUPPRESS)  # child process mode
+    args = parser.parse_args()
+
+    if args.run_once:
+        run_once(args)
+        return 0
+
+    with tempfile.TemporaryDirectory(prefix="ui-latency-") as directory:
+        env = dict(os.environ, PATH=write_sources(directory) + os.pathsep + os.environ.get("PATH", ""))
+        child = [sys.executable, os.path.abspath(__file__), "--run-once", "--presses", str(args.presses),
+                 "--settle", str(args.settle), "--warmup", str(args.warmup)]
+        runs = []
+        for number in range(1, args.runs + 1):
+            print(f"run {number}/{args.runs} ...", file=sys.stderr, flush=True)
+            # Run in a scratch cwd so the app's warm-start snapshot and logs stay out of the tree
+            completed = subprocess.run(child, env=env, cwd=directory, stdout=subprocess.PIPE, text=True, check=True)
+            runs.append(json.loads(completed.stdout))
+
+    import textual
+
+    metrics = aggregate(runs)
+    report = {
+        "load": LOAD,
+        "keys": KEYS,
+        "runs": args.runs,
+        "presses": args.presses,
+        "screen": list(SCREEN_SIZE),
+        "python": platform.python_version(),
+        "textual": getattr(textual, "__version__", None),
+        "machine": platform.machine(),
+        "metrics": metrics,
+        "per_run": runs,
+    }
+
+    baseline = None
+    if not args.update_baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)["metrics"]
+    report["regressions"] = compare(metrics, baseline, args.tolerance) if baseline else []
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump({key: report[key] for key in ("load", "runs", "presses", "screen", "python",
+                                                    "textual", "machine", "metrics")}, f, indent=2)
+            f.write("\n")
+
+    width = max(map(len, metrics))
+    for name, value in metrics.items():
+        reference = f"  (baseline {baseline[name]:.2f})" if baseline and name in baseline else ""
+        print(f"{name.ljust(width)}  {value:10.2f}{reference}")
+    for run in runs:
+        if run["collectors_without_data"]:
+            print(f"warning: no data from {', '.join(run['collectors_without_data'])} before the key presses")
+        if any(run["missed_frames"].values()):
+            print(f"warning: presses with no repaint within {FRAME_TIMEOUT:.0f}s: {run['missed_frames']}")
+    if report["regressions"]:
+        print(f"\n{len(report['regressions'])} regression(s) beyond {args.tolerance:.0%}:")
+        for regression in report["regressions"]:
+            print(f"  {regression['metric']}: {regression['baseline']} -> {regression['actual']} "
+                  f"({regression['change']:+.0%})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
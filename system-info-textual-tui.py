@@ -1,17 +1,33 @@
 
-import textual
+import time
+PROCESS_START = time.perf_counter()  # reference point for --bench-startup (includes imports)
+
 from textual.app import App, ComposeResult
-from textual.containers import Container, Horizontal, Vertical
-from textual.widgets import Static, Button, Header, Footer, Log, DataTable
+from textual.containers import Container, Horizontal
+from textual.widgets import Static, Footer, Log, DataTable
 from textual.reactive import reactive
-from textual import events
+from textual.screen import Screen
+from rich.style import Style
+from rich.text import Text
+import argparse
+import asyncio
 import subprocess
-import time
 import threading
 import re
-import json
-import webbrowser
+import math
+import operator
+import os
+import shlex
+import signal
+import socket
+import struct
+import sys
+from array import array
+from collections import Counter, deque
+from fnmatch import fnmatchcase, translate
+from functools import lru_cache, partial, wraps
 from datetime import datetime
+from typing import NamedTuple, Optional, Tuple
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # SYMBOL CONSTANTS - Customize the visual symbols used throughout the interface
@@ -22,6 +38,7 @@ class Symbols:
     PROGRESS_FILLED = "█"      # Filled portion of progress bars
     PROGRESS_EMPTY = "░"       # Empty portion of progress bars
     PROGRESS_MEDIUM = "▒"      # Medium fill (used in network graph)
+    SPARKLINE = "▁▂▃▄▅▆▇█"     # Sparkline levels, lowest to highest
     
     # Status indicators
     STATUS_HIGH = "🔴"         # High usage/critical status (red circle)
@@ -34,6 +51,10 @@ class Symbols:
     GRAPH_ICON = "📊"          # Graph panel title
     DOCKER_ICON = "🐳"         # Docker panel title
     LOG_ICON = "📋"            # Log panel title
+    CPU_ICON = "🧮"            # CPU/memory panel title
+    DISK_ICON = "💽"           # Disk panel title and device rows
+    CONNECTIONS_ICON = "🔌"    # Connections panel title
+    RDMA_ICON = "🔀"           # RDMA panel title
     
     # Header icons
     CALENDAR_ICON = "📅"       # Date display
@@ -54,6 +75,8 @@ class Symbols:
     # General status icons
     ERROR_ICON = "❌"          # Error indicator
     NO_DATA_ICON = "❌"        # No data available
+    PENDING_ICON = "⏳"        # Waiting for the first reading / showing cached data
+    THROTTLE_ICON = "⚠"        # GPU clocks held back (power cap, thermal, ...)
     
     # Box drawing characters (for graphs)
     BOX_TOP_LEFT = "┌"         # Top-left corner
@@ -69,81 +92,2363 @@ class Symbols:
 
 class Colors:
 
-    # Progress bar colors (Textual rich markup)
-    PROGRESS_HIGH = "red"      # High usage progress bars (80%+)
-    PROGRESS_MEDIUM = "yellow" # Medium usage progress bars (60-80%)
-    PROGRESS_LOW = "green"     # Low usage progress bars (0-60%)
-    PROGRESS_BACKGROUND = "grey37"  # Empty/background portion
-    
-    # Alternative color schemes (uncomment to use)
-    # Modern theme
-    # PROGRESS_HIGH = "bright_red"
-    # PROGRESS_MEDIUM = "orange1" 
-    # PROGRESS_LOW = "bright_green"
-    # PROGRESS_BACKGROUND = "grey37"
-    
-    # Cyberpunk theme
-    # PROGRESS_HIGH = "magenta"
-    # PROGRESS_MEDIUM = "cyan"
-    # PROGRESS_LOW = "bright_green"
-    # PROGRESS_BACKGROUND = "grey11"
-    
-    # Thermal theme (for temperature bars)
-    TEMP_CRITICAL = "bright_red"    # 80°C+
-    TEMP_WARNING = "orange1"        # 60-80°C  
-    TEMP_NORMAL = "bright_blue"     # <60°C
-    
-    # Memory usage colors
-    MEM_CRITICAL = "bright_red"     # 90%+ memory usage
-    MEM_HIGH = "red"                # 70-90% memory usage
-    MEM_MEDIUM = "yellow"           # 50-70% memory usage
-    MEM_LOW = "green"               # <50% memory usage
-    
-    # Network activity colors
-    NET_HIGH_ACTIVITY = "bright_green"   # High network throughput
-    NET_MED_ACTIVITY = "yellow"          # Medium network throughput  
-    NET_LOW_ACTIVITY = "dim cyan"        # Low network throughput
-    
-    # Text colors
-    TEXT_PRIMARY = "white"          # Primary text
-    TEXT_SECONDARY = "grey70"       # Secondary/dim text
-    TEXT_SUCCESS = "green"          # Success messages
-    TEXT_WARNING = "yellow"         # Warning messages
-    TEXT_ERROR = "red"              # Error messages
-    
-    # Header icons
-    CALENDAR_ICON = "📅"       # Date display
-    CLOCK_ICON = "🕐"          # Time display
-    
-    # Network interface icons
-    ETHERNET_ICON = "🌐"       # Ethernet interface
-    WIFI_ICON = "📶"           # WiFi interface
-    IP_ICON = "📍"             # IP address indicator
-    TRAFFIC_ICON = "📊"        # Traffic statistics
-    TOTAL_ICON = "📈"          # Total traffic
-    
-    # Docker status icons
-    CONTAINER_RUNNING = "📦"   # Running container
-    CONTAINER_STOPPED = "⏹️"   # Stopped container
-    CONTAINER_ERROR = "❌"     # Container error/exited
-    
-    # General status icons
-    ERROR_ICON = "❌"          # Error indicator
-    NO_DATA_ICON = "❌"        # No data available
-    
-    # Box drawing characters (for graphs)
-    BOX_TOP_LEFT = "┌"         # Top-left corner
-    BOX_TOP_RIGHT = "┐"        # Top-right corner
-    BOX_BOTTOM_LEFT = "└"      # Bottom-left corner
-    BOX_BOTTOM_RIGHT = "┘"     # Bottom-right corner
-    BOX_HORIZONTAL = "─"       # Horizontal line
-    BOX_VERTICAL = "│"         # Vertical line
-    
-    # Traffic direction arrows
-    DOWNLOAD_ARROW = "↓"       # Download traffic
-    UPLOAD_ARROW = "↑"         # Upload traffic
+    # Progress bar colors (Textual rich markup)
+    PROGRESS_HIGH = "red"      # High usage progress bars (80%+)
+    PROGRESS_MEDIUM = "yellow" # Medium usage progress bars (60-80%)
+    PROGRESS_LOW = "green"     # Low usage progress bars (0-60%)
+    PROGRESS_BACKGROUND = "grey37"  # Empty/background portion
+    
+    # Alternative color schemes (uncomment to use)
+    # Modern theme
+    # PROGRESS_HIGH = "bright_red"
+    # PROGRESS_MEDIUM = "orange1" 
+    # PROGRESS_LOW = "bright_green"
+    # PROGRESS_BACKGROUND = "grey37"
+    
+    # Cyberpunk theme
+    # PROGRESS_HIGH = "magenta"
+    # PROGRESS_MEDIUM = "cyan"
+    # PROGRESS_LOW = "bright_green"
+    # PROGRESS_BACKGROUND = "grey11"
+    
+    # Thermal theme (for temperature bars)
+    TEMP_CRITICAL = "bright_red"    # 80°C+
+    TEMP_WARNING = "orange1"        # 60-80°C  
+    TEMP_NORMAL = "bright_blue"     # <60°C
+    
+    # Memory usage colors
+    MEM_CRITICAL = "bright_red"     # 90%+ memory usage
+    MEM_HIGH = "red"                # 70-90% memory usage
+    MEM_MEDIUM = "yellow"           # 50-70% memory usage
+    MEM_LOW = "green"               # <50% memory usage
+    
+    # Per-core heatmap (busy cores reuse the progress bar colors)
+    CORE_IDLE = "grey50"            # <5% core utilization
+    
+    # Network activity colors
+    NET_HIGH_ACTIVITY = "bright_green"   # High network throughput
+    NET_MED_ACTIVITY = "yellow"          # Medium network throughput  
+    NET_LOW_ACTIVITY = "dim cyan"        # Low network throughput
+    
+    # Text colors
+    TEXT_PRIMARY = "white"          # Primary text
+    TEXT_SECONDARY = "grey70"       # Secondary/dim text
+    TEXT_SUCCESS = "green"          # Success messages
+    TEXT_WARNING = "yellow"         # Warning messages
+    TEXT_ERROR = "red"              # Error messages
+    
+    # Header icons
+    CALENDAR_ICON = "📅"       # Date display
+    CLOCK_ICON = "🕐"          # Time display
+    
+    # Network interface icons
+    ETHERNET_ICON = "🌐"       # Ethernet interface
+    WIFI_ICON = "📶"           # WiFi interface
+    IP_ICON = "📍"             # IP address indicator
+    TRAFFIC_ICON = "📊"        # Traffic statistics
+    TOTAL_ICON = "📈"          # Total traffic
+    
+    # Docker status icons
+    CONTAINER_RUNNING = "📦"   # Running container
+    CONTAINER_STOPPED = "⏹️"   # Stopped container
+    CONTAINER_ERROR = "❌"     # Container error/exited
+    
+    # General status icons
+    ERROR_ICON = "❌"          # Error indicator
+    NO_DATA_ICON = "❌"        # No data available
+    
+    # Box drawing characters (for graphs)
+    BOX_TOP_LEFT = "┌"         # Top-left corner
+    BOX_TOP_RIGHT = "┐"        # Top-right corner
+    BOX_BOTTOM_LEFT = "└"      # Bottom-left corner
+    BOX_BOTTOM_RIGHT = "┘"     # Bottom-right corner
+    BOX_HORIZONTAL = "─"       # Horizontal line
+    BOX_VERTICAL = "│"         # Vertical line
+    
+    # Traffic direction arrows
+    DOWNLOAD_ARROW = "↓"       # Download traffic
+    UPLOAD_ARROW = "↑"         # Upload traffic
+
+class Thresholds:
+    """Progress bar bands per bar type: (minimum fraction of max, color, status icon), highest first"""
+
+    TEMPERATURE = (
+        (0.89, Colors.TEMP_CRITICAL, Symbols.STATUS_HIGH),      # 80°C+ for 90°C max
+        (0.67, Colors.TEMP_WARNING, Symbols.STATUS_MEDIUM),     # 60°C+
+        (0.0, Colors.TEMP_NORMAL, Symbols.STATUS_LOW),
+    )
+    MEMORY = (
+        (0.9, Colors.MEM_CRITICAL, Symbols.STATUS_HIGH),
+        (0.7, Colors.MEM_HIGH, Symbols.STATUS_HIGH),
+        (0.5, Colors.MEM_MEDIUM, Symbols.STATUS_MEDIUM),
+        (0.0, Colors.MEM_LOW, Symbols.STATUS_LOW),
+    )
+    GENERIC = (
+        (0.8, Colors.PROGRESS_HIGH, Symbols.STATUS_HIGH),
+        (0.6, Colors.PROGRESS_MEDIUM, Symbols.STATUS_MEDIUM),
+        (0.0, Colors.PROGRESS_LOW, Symbols.STATUS_LOW),
+    )
+    BANDS = {"temperature": TEMPERATURE, "memory": MEMORY, "generic": GENERIC}
+
+    @classmethod
+    def band(cls, bar_type, fraction):
+        """(color, status icon) for a bar filled to `fraction`"""
+        for minimum, color, icon in cls.BANDS.get(bar_type, cls.GENERIC):
+            if fraction >= minimum:
+                return color, icon
+        return color, icon
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SNAPSHOT MODEL - Typed, slotted samples shared by every panel
+# ═══════════════════════════════════════════════════════════════════════════════
+# Collectors parse command output straight into these records and keep the
+# numbers as numbers.  Unit suffixes and padding are only added in render().
+# Missing readings ("[N/A]", "[Not Supported]", no stats) are stored as None.
+
+class GPUSample(NamedTuple):
+    """One nvidia-smi reading for a single GPU"""
+    index: int
+    name: str
+    temperature: Optional[float] = None   # °C
+    memory_used: Optional[float] = None   # MB
+    memory_total: Optional[float] = None  # MB
+    utilization: Optional[float] = None   # %
+    power_draw: Optional[float] = None    # W
+    power_limit: Optional[float] = None   # W
+    sm_clock: Optional[float] = None      # MHz
+    sm_clock_max: Optional[float] = None  # MHz
+    memory_clock: Optional[float] = None  # MHz
+    pcie_gen: Optional[float] = None
+    pcie_width: Optional[float] = None    # lanes
+    throttle: Optional[int] = None        # clocks_throttle_reasons.active bitmask
+    ecc_corrected: Optional[float] = None     # volatile (since the last driver load)
+    ecc_uncorrected: Optional[float] = None
+    pcie_rx: Optional[float] = None       # KB/s, from the nvidia-smi -q process scan
+    pcie_tx: Optional[float] = None       # KB/s
+
+class GPUProcess(NamedTuple):
+    """A process holding memory on a GPU, with host-side details from /proc"""
+    pid: int
+    name: str = "Unknown Process"
+    memory: Optional[int] = None          # MB of GPU memory
+    user: Optional[str] = None
+    container_id: Optional[str] = None    # full Docker container ID
+    container: Optional[str] = None       # container name, matched on the UI thread
+    cpu: Optional[float] = None           # host CPU percent (100 = one core)
+    rss: Optional[float] = None           # MB of host memory
+
+class InterfaceSample(NamedTuple):
+    """Link state, addresses and byte counters for one network interface"""
+    name: str
+    kind: str = "Unknown"
+    status: str = "DOWN"
+    addresses: Tuple[Tuple[str, str], ...] = ()   # (address, cidr)
+    rx_bytes: int = 0
+    tx_bytes: int = 0
+    rx_errors: int = 0
+
+class NetworkSample(NamedTuple):
+    """Totals across all interfaces at a point in time (used for graphing)"""
+    time: float
+    total_rx: int
+    total_tx: int
+
+class CPUSample(NamedTuple):
+    total: float                 # utilization of all CPUs, percent
+    cores: Tuple[float, ...]     # per-core utilization, percent, in /proc/stat order
+    iowait: float                # share of time idle waiting on I/O, percent
+
+class MemorySample(NamedTuple):
+    total: float                 # MB
+    available: float             # MB
+    swap_total: float            # MB
+    swap_free: float             # MB
+
+class DiskSample(NamedTuple):
+    name: str
+    read_bytes: float            # bytes/s
+    write_bytes: float           # bytes/s
+    reads: float                 # completed reads/s
+    writes: float                # completed writes/s
+    utilization: float           # percent of time with I/O in flight
+
+class ContainerSample(NamedTuple):
+    """One Docker container as reported by docker ps / docker stats"""
+    container_id: str
+    name: str
+    image: str
+    status: str
+    cpu: Optional[float] = None           # %
+    memory: Optional[float] = None        # MB
+    ports: str = "-"
+    net_rx: Optional[float] = None        # bytes/s, all interfaces in the container's namespace
+    net_tx: Optional[float] = None        # bytes/s
+    block_read: Optional[float] = None    # bytes/s, from the cgroup's io.stat
+    block_write: Optional[float] = None   # bytes/s
+    memory_percent: Optional[float] = None  # % of the container's memory limit
+
+class ContainerProcess(NamedTuple):
+    """A process in a container's cgroup, for the container drilldown"""
+    pid: int
+    command: str
+    threads: Optional[int] = None
+    cpu: Optional[float] = None           # host CPU percent (100 = one core)
+    rss: Optional[float] = None           # MB
+    gpu_memory: Optional[int] = None      # MB across all GPUs, from the GPU process scan
+
+class RdmaPortSample(NamedTuple):
+    """One InfiniBand/RoCE port from /sys/class/infiniband/<device>/ports/<port>"""
+    name: str                             # "<device>/<port>", e.g. "mlx5_0/1"
+    state: str = "DOWN"                   # ACTIVE, INIT, ARMED, DOWN
+    rate: str = ""                        # link speed as sysfs reports it, e.g. "200 Gb/sec (4X HDR)"
+    link_layer: str = ""                  # "InfiniBand", or "Ethernet" for RoCE
+    rx_rate: Optional[float] = None       # bytes/s
+    tx_rate: Optional[float] = None       # bytes/s
+    errors: int = 0                       # sum of the port's error counters
+    error_rate: Optional[float] = None    # new errors per second
+
+class ConnectionSample(NamedTuple):
+    """TCP sockets by state plus the busiest peers and ports, from /proc/net/tcp{,6} and sockstat"""
+    states: Tuple[Tuple[str, int], ...]          # (state, sockets), most sockets first
+    remote_hosts: Tuple[Tuple[str, int], ...]    # (address, connections), most first (TopK)
+    host_error: int                              # remote host counts may be this much too low
+    local_ports: Tuple[Tuple[int, int], ...]     # (port, connections), listening sockets excluded
+    sockets: int                                 # every socket in use, any protocol (sockstat)
+    orphans: int                                 # TCP sockets no longer attached to a process
+    udp: int                                     # UDP sockets, IPv4 and IPv6
+    scan_time: Optional[float] = None            # seconds spent reading tcp/tcp6; None if reused
+
+def parse_number(value):
+    """Parse a numeric field from command output, returning None for N/A markers"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+_SIZE_UNITS_MB = {
+    "B": 1 / (1024 * 1024), "KB": 1 / 1024, "KIB": 1 / 1024,
+    "MB": 1.0, "MIB": 1.0, "GB": 1024.0, "GIB": 1024.0,
+    "TB": 1024.0 * 1024, "TIB": 1024.0 * 1024,
+}
+_SIZE_RE = re.compile(r'([\d.]+)\s*([KMGT]?i?B)', re.IGNORECASE)
+
+def parse_size_mb(value):
+    """Convert a Docker size string like '12.5MiB' or '1.9GiB' to MB"""
+    match = _SIZE_RE.search(value or "")
+    if not match:
+        return None
+    return float(match.group(1)) * _SIZE_UNITS_MB.get(match.group(2).upper(), 1.0)
+
+def cached_note(timestamp):
+    """Status line for a panel still showing warm-start data from the snapshot cache"""
+    return f"{Symbols.PENDING_ICON} Last known data from {datetime.fromtimestamp(timestamp).strftime('%X')}, refreshing..."
+
+def escape(text):
+    """Make an error message safe to embed in markup (commands echoed as "['nvidia-smi', ...]")"""
+    return str(text).replace("[", "\\[")
+
+class PanelText:
+    """Pre-built panel content returned from render().
+
+    Rich renders it straight to segments; a bare Text would instead be
+    converted span by span into Textual styles on every refresh, which
+    costs more than it saves on span-heavy panels like the core heatmap.
+    """
+
+    def __init__(self, text):
+        self.text = text
+
+    def __rich_console__(self, console, options):
+        yield self.text
+
+    def __str__(self):
+        return str(self.text)
+
+def panel_text(lines):
+    """Join panel lines into one PanelText for render().
+
+    Lines are plain strings or pre-styled Text; plain strings are taken
+    literally, so Textual has no markup to parse on each refresh.
+    """
+    return PanelText(Text("\n").join(line if isinstance(line, Text) else Text(line) for line in lines))
+
+def format_rate(bytes_per_second):
+    """Format a throughput in B/s, KB/s or MB/s"""
+    if bytes_per_second is None:
+        return "N/A"
+    if bytes_per_second > 1024*1024:
+        return f"{bytes_per_second/(1024*1024):.1f} MB/s"
+    if bytes_per_second > 1024:
+        return f"{bytes_per_second/1024:.1f} KB/s"
+    return f"{bytes_per_second:.0f} B/s"
+
+def format_size_mb(value_mb):
+    """Format a size in MB the way the panels display it (MB below 1 GB, GB above)"""
+    if value_mb is None:
+        return "N/A"
+    if value_mb > 1024:
+        return f"{value_mb / 1024:.1f}GB"
+    return f"{value_mb:.0f}MB"
+
+def create_progress_bar(value, max_value, width=30, label="", bar_type="generic"):
+    """Create a progress bar line as Text: label, colored bar, status icon and percentage"""
+    if value is None or max_value is None:
+        return Text(f"{label}: N/A")
+    
+    try:
+        percentage = min(float(value) / float(max_value), 1.0)
+        filled = int(percentage * width)
+        
+        fill_color, status_icon = Thresholds.band(bar_type, percentage)
+
+        return Text.assemble(f"{label}: ", bar_cells(filled, width, fill_color), f" {status_icon} {percentage*100:.1f}%")
+    except (ValueError, ZeroDivisionError):
+        return Text(f"{label}: N/A")
+
+@lru_cache(maxsize=256)
+def bar_cells(filled, width, fill_color):
+    """The styled cells of a progress bar. Cached: a panel only ever shows a few
+    hundred distinct bars, so most frames reuse them. Don't modify the result."""
+    bar = Text(Symbols.PROGRESS_FILLED * filled, style=fill_color)
+    bar.append(Symbols.PROGRESS_EMPTY * (width - filled), Colors.PROGRESS_BACKGROUND)
+    return bar
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# HISTORY - Fixed-size numeric ring buffers for time series
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class RingBuffer:
+    """Fixed-capacity circular buffer of floats backed by a preallocated array.
+
+    Appending never allocates, so memory stays constant however long the
+    monitor runs.  Missing readings are stored as NaN.
+    """
+    __slots__ = ("_data", "_capacity", "_start", "_size")
+
+    def __init__(self, capacity):
+        self._data = array('d', [math.nan]) * capacity
+        self._capacity = capacity
+        self._start = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, value):
+        value = math.nan if value is None else value
+        if self._size < self._capacity:
+            self._data[(self._start + self._size) % self._capacity] = value
+            self._size += 1
+        else:
+            self._data[self._start] = value
+            self._start = (self._start + 1) % self._capacity
+
+    def replace_latest(self, value):
+        """Overwrite the most recent value in place (used for open rollup buckets)"""
+        if self._size:
+            self._data[(self._start + self._size - 1) % self._capacity] = math.nan if value is None else value
+
+    def latest(self):
+        """Most recent value, or None if empty or missing"""
+        if not self._size:
+            return None
+        value = self._data[(self._start + self._size - 1) % self._capacity]
+        return None if math.isnan(value) else value
+
+    def last(self, count):
+        """The newest `count` values, oldest first"""
+        count = min(count, self._size)
+        first = (self._start + self._size - count) % self._capacity
+        end = first + count
+        if end <= self._capacity:
+            return self._data[first:end].tolist()
+        return self._data[first:].tolist() + self._data[:end - self._capacity].tolist()
+
+def sparkline(values, width, maximum=None):
+    """Render the newest `width` values as a one-line block sparkline.
+
+    Values are scaled to `maximum` (or the largest value shown).  NaN
+    entries render as blanks and the line is left-padded to `width`.
+    """
+    values = values[-width:] if width > 0 else []
+    present = [v for v in values if not math.isnan(v)]
+    top = maximum if maximum else (max(present) if present else 0)
+    levels = Symbols.SPARKLINE
+    chars = []
+    for value in values:
+        if math.isnan(value):
+            chars.append(" ")
+        elif top <= 0:
+            chars.append(levels[0])
+        else:
+            chars.append(levels[min(int(value / top * (len(levels) - 1) + 0.5), len(levels) - 1)])
+    return "".join(chars).rjust(width)
+
+def io_graph(first, second, width, height):
+    """Draw a boxed two-direction throughput graph (RX/TX, read/write).
+
+    Each column stacks the two rates and is shaded by the dominant one:
+    solid for `first`, medium for `second`, light when equal.  NaN columns
+    (no samples) are blank.  Returns (lines, maximum); maximum is None and
+    the box is filled with light shade when no column has data.
+    """
+    totals = [a + b for a, b in zip(first, second)]
+    present = [total for total in totals if not math.isnan(total)]
+
+    lines = [Symbols.BOX_TOP_LEFT + Symbols.BOX_HORIZONTAL * width + Symbols.BOX_TOP_RIGHT]
+    if not present:
+        for _ in range(height):
+            lines.append(Symbols.BOX_VERTICAL + Symbols.PROGRESS_EMPTY * width + Symbols.BOX_VERTICAL)
+        lines.append(Symbols.BOX_BOTTOM_LEFT + Symbols.BOX_HORIZONTAL * width + Symbols.BOX_BOTTOM_RIGHT)
+        return lines, None
+
+    # Normalize values for graph
+    maximum = max(present) or 1
+
+    # Shade per column doesn't depend on the row; work it out once
+    columns = []
+    for total, a, b in zip(totals, first, second):
+        if math.isnan(total):
+            columns.append((None, " "))     # No samples in this bucket
+        elif a > b:
+            columns.append((min(total / maximum, 1.0), Symbols.PROGRESS_FILLED))   # first dominant - solid block
+        elif b > a:
+            columns.append((min(total / maximum, 1.0), Symbols.PROGRESS_MEDIUM))   # second dominant - medium shade
+        else:
+            columns.append((min(total / maximum, 1.0), Symbols.PROGRESS_EMPTY))    # Equal - light shade
+
+    # Create the graph from top to bottom
+    for row in range(height):
+        threshold = (height - row) / height
+        content = "".join(shade if level is not None and level >= threshold else " " for level, shade in columns)
+        # Ensure exact width and add borders
+        lines.append(Symbols.BOX_VERTICAL + content.ljust(width)[:width] + Symbols.BOX_VERTICAL)
+
+    lines.append(Symbols.BOX_BOTTOM_LEFT + Symbols.BOX_HORIZONTAL * width + Symbols.BOX_BOTTOM_RIGHT)
+    return lines, maximum
+
+class Rollup:
+    """One RRD tier: min/avg/max of fixed-width time buckets.
+
+    Only the open bucket's running min/max/sum/count are kept, so each
+    insert is O(1) and closed buckets are never revisited.
+    """
+    __slots__ = ("step", "capacity", "mins", "avgs", "maxs", "_bucket", "_min", "_max", "_sum", "_count")
+
+    def __init__(self, step, capacity):
+        self.step = step
+        self.capacity = capacity
+        self.mins = RingBuffer(capacity)
+        self.avgs = RingBuffer(capacity)
+        self.maxs = RingBuffer(capacity)
+        self._bucket = None
+
+    def add(self, timestamp, value):
+        bucket = int(timestamp // self.step)
+        if self._bucket is None or bucket > self._bucket:
+            if self._bucket is not None:
+                # Leave a visible gap for buckets with no samples (e.g. suspend)
+                for _ in range(min(bucket - self._bucket - 1, self.capacity)):
+                    self.mins.append(None)
+                    self.avgs.append(None)
+                    self.maxs.append(None)
+            self._bucket = bucket
+            self._min = self._max = self._sum = value
+            self._count = 1
+            self.mins.append(value)
+            self.avgs.append(value)
+            self.maxs.append(value)
+        else:
+            self._min = min(self._min, value)
+            self._max = max(self._max, value)
+            self._sum += value
+            self._count += 1
+            self.mins.replace_latest(self._min)
+            self.avgs.replace_latest(self._sum / self._count)
+            self.maxs.replace_latest(self._max)
+
+class TieredHistory:
+    """Raw recent samples plus min/avg/max rollups at coarser resolutions.
+
+    Memory is fixed by the tier capacities: with the defaults, about five
+    minutes of raw 5 s samples, a day of 1 min buckets, a week of 15 min
+    buckets and a month of 1 h buckets.
+    """
+
+    # (label, bucket seconds or None for raw samples, capacity)
+    TIERS = (("raw", None, 60), ("1m", 60, 1440), ("15m", 900, 672), ("1h", 3600, 720))
+
+    def __init__(self, tiers=TIERS):
+        self.labels = tuple(label for label, _, _ in tiers)
+        self.raw = RingBuffer(tiers[0][2])
+        self.rollups = tuple(Rollup(step, capacity) for _, step, capacity in tiers[1:])
+
+    def add(self, timestamp, value):
+        self.raw.append(value)
+        for rollup in self.rollups:
+            rollup.add(timestamp, value)
+
+    def series(self, tier, count, field="avg"):
+        """The newest `count` points of a tier, oldest first (NaN for gaps)"""
+        if tier == 0:
+            return self.raw.last(count)
+        rollup = self.rollups[tier - 1]
+        return {"min": rollup.mins, "avg": rollup.avgs, "max": rollup.maxs}[field].last(count)
+
+class QuantileSketch:
+    """Log-bucketed histogram of positive values (DDSketch-style).
+
+    Quantiles are within `accuracy` relative error.  Buckets only hold
+    counts, so values can be removed again as they leave a window and two
+    sketches merge by adding their counts.
+    """
+    __slots__ = ("_log_gamma", "_gamma", "_counts", "_zeros", "count")
+
+    ZERO = 1e-9     # values at or below this share one bucket
+
+    def __init__(self, accuracy=0.01):
+        self._gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._counts = {}       # bucket key -> count
+        self._zeros = 0
+        self.count = 0
+
+    def add(self, value, count=1):
+        if value <= self.ZERO:
+            self._zeros += count
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            total = self._counts.get(key, 0) + count
+            if total:
+                self._counts[key] = total
+            else:
+                del self._counts[key]
+        self.count += count
+
+    def remove(self, value):
+        self.add(value, -1)
+
+    def merge(self, other):
+        self._zeros += other._zeros
+        for key, count in other._counts.items():
+            self._counts[key] = self._counts.get(key, 0) + count
+        self.count += other.count
+
+    def quantile(self, q):
+        """Approximate q-quantile (0..1, nearest rank), or None if empty"""
+        if self.count <= 0:
+            return None
+        rank = max(math.ceil(q * self.count) - 1, 0)   # 0-based index of the wanted value
+        seen = self._zeros
+        if rank < seen:
+            return 0.0
+        for key in sorted(self._counts):
+            seen += self._counts[key]
+            if rank < seen:
+                return 2 * self._gamma ** key / (self._gamma + 1)
+        return 2 * self._gamma ** max(self._counts) / (self._gamma + 1)
+
+class WindowSummary:
+    """Min/avg/max and quantiles of the newest `capacity` samples.
+
+    Each sample costs O(1) amortized: monotonic deques track the window
+    minimum and maximum, a running sum the average, and a QuantileSketch
+    has the expiring sample subtracted.  Reading a summary never rescans
+    the window.  Missing readings (None) take a slot but are not counted.
+    """
+    __slots__ = ("_values", "_capacity", "_seq", "_sum", "_mins", "_maxs", "_sketch", "_quantiles")
+
+    def __init__(self, capacity):
+        self._values = array('d', [math.nan]) * capacity
+        self._capacity = capacity
+        self._seq = 0           # samples added so far
+        self._sum = 0.0
+        self._mins = deque()    # (seq, value), values increasing from the left
+        self._maxs = deque()    # (seq, value), values decreasing from the left
+        self._sketch = QuantileSketch()
+        self._quantiles = {}    # q -> value, cleared on every add
+
+    def __len__(self):
+        return self._sketch.count
+
+    def add(self, value):
+        slot = self._seq % self._capacity
+        expired = self._values[slot]
+        if not math.isnan(expired):
+            self._sum -= expired
+            self._sketch.remove(expired)
+        oldest = self._seq - self._capacity     # sequence number leaving the window
+        while self._mins and self._mins[0][0] <= oldest:
+            self._mins.popleft()
+        while self._maxs and self._maxs[0][0] <= oldest:
+            self._maxs.popleft()
+
+        value = math.nan if value is None else value
+        self._values[slot] = value
+        if not math.isnan(value):
+            while self._mins and self._mins[-1][1] >= value:
+                self._mins.pop()
+            self._mins.append((self._seq, value))
+            while self._maxs and self._maxs[-1][1] <= value:
+                self._maxs.pop()
+            self._maxs.append((self._seq, value))
+            self._sum += value
+            self._sketch.add(value)
+        if not self._sketch.count:
+            self._sum = 0.0     # drop accumulated rounding error whenever the window empties
+        self._seq += 1
+        self._quantiles.clear()
+
+    @property
+    def min(self):
+        return self._mins[0][1] if self._mins else None
+
+    @property
+    def max(self):
+        return self._maxs[0][1] if self._maxs else None
+
+    @property
+    def avg(self):
+        return self._sum / self._sketch.count if self._sketch.count else None
+
+    def quantile(self, q):
+        """Approximate q-quantile (0..1) of the window, clamped to its min/max"""
+        if q not in self._quantiles:
+            value = self._sketch.quantile(q)
+            if value is not None:
+                value = min(max(value, self.min), self.max)
+            self._quantiles[q] = value
+        return self._quantiles[q]
+
+class RollingSummaries:
+    """One WindowSummary per named time window over a fixed-interval series"""
+
+    # (label, seconds) shown by the panels: recent p95 and the peak of the last hour
+    WINDOWS = (("5m", 300), ("1h", 3600))
+
+    def __init__(self, interval, windows=WINDOWS):
+        self.windows = {label: WindowSummary(max(int(seconds // interval), 1)) for label, seconds in windows}
+
+    def add(self, value):
+        for summary in self.windows.values():
+            summary.add(value)
+
+    def __getitem__(self, label):
+        return self.windows[label]
+
+class TopK:
+    """The heaviest keys of a stream in bounded memory (a mergeable Misra-Gries summary).
+
+    Batches are merged with update(), which takes keys (one per
+    occurrence) or a mapping of counts like Counter.update().  Once more than twice
+    `capacity` keys are held, only the top `capacity` survive and the
+    next-largest count is subtracted from each of them.  A reported count
+    is then at most `error` below the true one, and every key seen more
+    than total / (capacity + 1) times is kept.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.counts = Counter()
+        self.error = 0
+
+    def update(self, keys):
+        self.counts.update(keys)
+        if len(self.counts) > 2 * self.capacity:
+            kept = self.counts.most_common(self.capacity + 1)
+            floor = kept.pop()[1]
+            self.counts = Counter({key: count - floor for key, count in kept if count > floor})
+            self.error += floor
+
+    def discard(self, key):
+        self.counts.pop(key, None)
+
+    def most_common(self, n=None):
+        return self.counts.most_common(n)
+
+class GPUHistory:
+    """Per-device ring buffers of utilization, memory, temperature and power"""
+
+    METRICS = ("utilization", "memory", "temperature", "power")
+
+    def __init__(self, capacity, interval=1):
+        self.capacity = capacity
+        self.interval = interval
+        self._series = {}       # gpu index -> {metric: RingBuffer}
+        self._summaries = {}    # gpu index -> {metric: RollingSummaries}
+
+    def add(self, gpu):
+        series = self._series.get(gpu.index)
+        if series is None:
+            series = self._series[gpu.index] = {metric: RingBuffer(self.capacity) for metric in self.METRICS}
+        summaries = self._summaries.get(gpu.index)
+        if summaries is None:
+            summaries = self._summaries[gpu.index] = {metric: RollingSummaries(self.interval) for metric in self.METRICS}
+        for metric, value in zip(self.METRICS, (gpu.utilization, gpu.memory_used, gpu.temperature, gpu.power_draw)):
+            series[metric].append(value)
+            summaries[metric].add(value)
+
+    def series(self, index, metric):
+        """Ring buffer for one GPU metric (empty if the GPU has not been seen)"""
+        series = self._series.get(index)
+        return series[metric] if series else RingBuffer(1)
+
+    def set_interval(self, interval):
+        """Change the sampling interval; the rolling summaries start over sized for it"""
+        self.interval = interval
+        self._summaries.clear()
+
+    def summary(self, index, metric, window):
+        """WindowSummary of one GPU metric over a RollingSummaries window, or None"""
+        summaries = self._summaries.get(index)
+        return summaries[metric][window] if summaries else None
+
+class DiskHistory:
+    """Per-device ring buffers of read/write throughput, IOPS and utilization, plus all-device totals"""
+
+    METRICS = ("read_bytes", "write_bytes", "iops", "utilization")
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._series = {}   # device name -> {metric: RingBuffer}
+        self.total_read = RingBuffer(capacity)
+        self.total_write = RingBuffer(capacity)
+
+    def add(self, disks):
+        for disk in disks:
+            series = self._series.get(disk.name)
+            if series is None:
+                series = self._series[disk.name] = {metric: RingBuffer(self.capacity) for metric in self.METRICS}
+            series["read_bytes"].append(disk.read_bytes)
+            series["write_bytes"].append(disk.write_bytes)
+            series["iops"].append(disk.reads + disk.writes)
+            series["utilization"].append(disk.utilization)
+        self.total_read.append(sum(disk.read_bytes for disk in disks))
+        self.total_write.append(sum(disk.write_bytes for disk in disks))
+
+    def series(self, name, metric):
+        """Ring buffer for one device metric (empty if the device has not been seen)"""
+        series = self._series.get(name)
+        return series[metric] if series else RingBuffer(1)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PERSISTENCE - Optional SQLite metrics store (enabled with --history-db)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class MetricsStore:
+    """Batches numeric samples from every collector and writes them to SQLite.
+
+    record() only appends to an in-memory batch under a lock, so the UI
+    thread never waits on disk.  A background thread owns the write
+    connection and commits one transaction every `flush_interval` seconds.
+    Reads use their own connection; WAL mode lets them run alongside the
+    writer.  If the writer hits an error (unwritable path, full disk,
+    locked database) it stops, sets `error` and later samples are dropped.
+    """
+
+    FLUSH_INTERVAL = 5               # seconds between write transactions
+    RETENTION = 7 * 24 * 3600        # seconds of history kept on disk
+    DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".local", "share",
+                                "system-info-textual-tui", "history.db")
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS metrics (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE)",
+        "CREATE TABLE IF NOT EXISTS samples (metric_id INTEGER NOT NULL, ts REAL NOT NULL, value REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS samples_metric_ts ON samples (metric_id, ts)",
+    )
+    INSERT_SAMPLE = "INSERT INTO samples (metric_id, ts, value) VALUES (?, ?, ?)"
+    INSERT_METRIC = "INSERT OR IGNORE INTO metrics (name) VALUES (?)"
+    SELECT_METRIC = "SELECT id FROM metrics WHERE name = ?"
+
+    def __init__(self, path=DEFAULT_PATH, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._pending = []          # (metric, timestamp, value)
+        self.error = None           # why the writer stopped, if it has
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._writer, name="metrics-store", daemon=True)
+        self._thread.start()
+
+    def record(self, timestamp, samples):
+        """Queue a {metric: value} batch; None values are dropped"""
+        rows = [(metric, timestamp, value) for metric, value in samples.items() if value is not None]
+        with self._lock:
+            if self.error is None:
+                self._pending.extend(rows)
+
+    def close(self):
+        """Flush whatever is queued and stop the writer thread"""
+        self._stop.set()
+        self._thread.join(timeout=self.flush_interval + 5)
+
+    def _writer(self):
+        import sqlite3
+
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                with conn:
+                    for statement in self.SCHEMA:
+                        conn.execute(statement)
+                metric_ids = dict((name, metric_id) for metric_id, name in conn.execute("SELECT id, name FROM metrics"))
+                last_prune = 0
+                while True:
+                    stopping = self._stop.wait(self.flush_interval)
+                    with self._lock:
+                        batch, self._pending = self._pending, []
+                    if batch:
+                        with conn:
+                            for metric, _, _ in batch:
+                                if metric not in metric_ids:
+                                    conn.execute(self.INSERT_METRIC, (metric,))
+                                    metric_ids[metric] = conn.execute(self.SELECT_METRIC, (metric,)).fetchone()[0]
+                            # Same SQL every time, so sqlite3 reuses the prepared statement
+                            conn.executemany(self.INSERT_SAMPLE,
+                                             ((metric_ids[metric], ts, value) for metric, ts, value in batch))
+                    now = time.time()
+                    if now - last_prune > 3600:
+                        with conn:
+                            conn.execute("DELETE FROM samples WHERE ts < ?", (now - self.RETENTION,))
+                        last_prune = now
+                    if stopping:
+                        break
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error) as e:
+            with self._lock:
+                self.error = str(e)
+                self._pending = []
+
+    def _connect_reader(self):
+        import sqlite3
+        from urllib.parse import quote
+
+        return sqlite3.connect(f"file:{quote(self.path)}?mode=ro", uri=True)
+
+    def metric_names(self):
+        """All metric names with stored samples (call from a worker thread)"""
+        import sqlite3
+
+        try:
+            conn = self._connect_reader()
+        except sqlite3.OperationalError:
+            return []
+        try:
+            return [name for (name,) in conn.execute("SELECT name FROM metrics ORDER BY name")]
+        except sqlite3.OperationalError:
+            return []
+        finally:
+            conn.close()
+
+    def query(self, metric, start, end, buckets):
+        """Min/avg/max of `metric` in `buckets` equal slices of [start, end).
+
+        The range scan runs on the (metric_id, ts) index.  Returns a list of
+        (min, avg, max) with None for empty slices.  Call from a worker thread.
+        """
+        import sqlite3
+
+        width = (end - start) / buckets
+        result = [None] * buckets
+        try:
+            conn = self._connect_reader()
+        except sqlite3.OperationalError:
+            return result
+        try:
+            rows = conn.execute(
+                "SELECT CAST((s.ts - ?) / ? AS INTEGER) AS bucket, MIN(s.value), AVG(s.value), MAX(s.value) "
+                "FROM samples s JOIN metrics m ON m.id = s.metric_id "
+                "WHERE m.name = ? AND s.ts >= ? AND s.ts < ? GROUP BY bucket",
+                (start, width, metric, start, end))
+            for bucket, low, mean, high in rows:
+                if 0 <= bucket < buckets:
+                    result[bucket] = (low, mean, high)
+        except sqlite3.OperationalError:
+            pass
+        finally:
+            conn.close()
+        return result
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ALERTS - Threshold rules checked as collectors publish metrics
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class AlertRule(NamedTuple):
+    """One compiled rule, e.g. "gpu.*.temperature > 80 for 30s" """
+    text: str
+    pattern: str            # metric name or glob
+    rate: bool              # compare the per-second rate of change, not the value
+    op: str
+    threshold: float
+    clear: float            # level the value must cross back over to resolve
+    duration: float         # seconds the condition must hold before firing
+
+class Alert(NamedTuple):
+    """A rule firing or resolving for one metric"""
+    state: str              # "firing" or "resolved"
+    rule: str
+    metric: str
+    value: float
+    time: float
+
+class AlertEngine:
+    """Evaluates threshold rules against published metric batches.
+
+    Rule syntax: `METRIC [rate] OP THRESHOLD[%] [clear LEVEL[%]] [for N(s|m|h)]`,
+    where METRIC is a metric name or glob (`docker.*.memory_percent`) and
+    OP is one of > >= < <= == !=.  A trailing % is accepted for readability.
+
+    Rules are compiled once.  The rules matching a metric name are looked up
+    on its first appearance and cached, so each batch costs one dict lookup
+    per metric plus the rules that actually reference it.  Alerts resolve
+    only once the value crosses back over the clear level (by default
+    HYSTERESIS of the threshold below/above it), so a value hovering at the
+    threshold doesn't flap.
+    """
+
+    RULE_RE = re.compile(
+        r'^(?P<pattern>\S+)\s+(?:(?P<rate>rate)\s+)?(?P<op>>=|<=|==|!=|>|<)\s*(?P<threshold>-?[\d.]+)\s*%?'
+        r'(?:\s+clear\s+(?P<clear>-?[\d.]+)\s*%?)?'
+        r'(?:\s+for\s+(?P<duration>[\d.]+)\s*(?P<unit>[smh]?))?$')
+    OPS = {">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le,
+           "==": operator.eq, "!=": operator.ne}
+    UNITS = {"": 1, "s": 1, "m": 60, "h": 3600}
+    HYSTERESIS = 0.05       # default clear margin, as a fraction of the threshold
+    MAX_INDEXED = 10000     # metric names whose matching rules are cached
+
+    # Used when no rules are given; the GPU one matches the red temperature band
+    DEFAULT_RULES = (
+        "gpu.*.temperature >= 80 for 30s",
+        "cpu.utilization >= 95 for 60s",
+        "docker.*.memory_percent >= 90% for 30s",
+        "net.*.rx_errors rate > 0",
+    )
+
+    def __init__(self, rules=DEFAULT_RULES):
+        self.rules = tuple(self.parse_rule(rule) for rule in rules)
+        self._exact = {}
+        self._globs = []
+        for rule in self.rules:
+            if any(char in rule.pattern for char in "*?["):
+                self._globs.append(rule)
+            else:
+                self._exact.setdefault(rule.pattern, []).append(rule)
+        self._index = {}        # metric name -> (matching rules, any of them a rate rule)
+        self._previous = {}     # metric name -> (time, value), for rate rules
+        self._pending = {}      # (rule, metric) -> time the condition started holding
+        self.firing = {}        # (rule, metric) -> Alert that fired
+        self._batches = {}      # source -> metrics with rules in its last batch
+
+    @classmethod
+    def parse_rule(cls, text):
+        """Compile one rule; raises ValueError on a syntax error"""
+        match = cls.RULE_RE.match(text.strip())
+        if match is None:
+            raise ValueError(f"invalid alert rule {text!r} (expected e.g. 'gpu.*.temperature > 80 for 30s')")
+        op, threshold = match.group("op"), float(match.group("threshold"))
+        if match.group("clear") is not None:
+            clear = float(match.group("clear"))
+        elif op in (">", ">="):
+            clear = threshold - abs(threshold) * cls.HYSTERESIS
+        elif op in ("<", "<="):
+            clear = threshold + abs(threshold) * cls.HYSTERESIS
+        else:
+            clear = threshold
+        duration = float(match.group("duration") or 0) * cls.UNITS[match.group("unit") or ""]
+        return AlertRule(text.strip(), match.group("pattern"), bool(match.group("rate")), op, threshold, clear, duration)
+
+    def _rules_for(self, metric):
+        if len(self._index) >= self.MAX_INDEXED:
+            self._index.clear()     # names churn (e.g. short-lived containers); start over
+        rules = tuple(self._exact.get(metric, []) + [rule for rule in self._globs if fnmatchcase(metric, rule.pattern)])
+        entry = self._index[metric] = (rules, any(rule.rate for rule in rules))
+        return entry
+
+    def evaluate(self, timestamp, samples, source=None):
+        """Check a {metric: value} batch; returns the Alerts that fired or resolved.
+
+        With a `source`, metrics in that source's previous batch that are
+        missing from this one (a removed container, a GPU that went away)
+        have their alerts resolved and their state dropped:
+
+        >>> engine = AlertEngine(["docker.*.memory_percent >= 90"])
+        >>> [alert.state for alert in engine.evaluate(0, {"docker.web.memory_percent": 95}, "docker")]
+        ['firing']
+        >>> [alert.state for alert in engine.evaluate(5, {}, "docker")], engine.firing
+        (['resolved'], {})
+        """
+        alerts = []
+        seen = set()
+        for metric, value in samples.items():
+            entry = self._index.get(metric)
+            rules, needs_rate = entry if entry is not None else self._rules_for(metric)
+            if not rules:
+                continue
+            seen.add(metric)
+            if value is None:
+                continue
+            rate = self._rate(metric, timestamp, value) if needs_rate else None
+            for rule in rules:
+                current = rate if rule.rate else value
+                if current is None:
+                    continue    # first reading of a counter; no rate yet
+                compare = self.OPS[rule.op]
+                key = (rule, metric)
+                if key in self.firing:
+                    if not compare(current, rule.clear):
+                        del self.firing[key]
+                        alerts.append(Alert("resolved", rule.text, metric, current, timestamp))
+                elif compare(current, rule.threshold):
+                    since = self._pending.setdefault(key, timestamp)
+                    if timestamp - since >= rule.duration:
+                        del self._pending[key]
+                        alert = self.firing[key] = Alert("firing", rule.text, metric, current, timestamp)
+                        alerts.append(alert)
+                else:
+                    self._pending.pop(key, None)
+        if source is not None:
+            gone = self._batches.get(source, seen) - seen
+            if gone:
+                self._forget(gone, timestamp, alerts)
+            self._batches[source] = seen
+        return alerts
+
+    def _forget(self, metrics, timestamp, alerts):
+        """Resolve alerts on metrics that stopped being published and drop their state"""
+        for key in [key for key in self.firing if key[1] in metrics]:
+            alert = self.firing.pop(key)
+            alerts.append(Alert("resolved", alert.rule, alert.metric, alert.value, timestamp))
+        for key in [key for key in self._pending if key[1] in metrics]:
+            del self._pending[key]
+        for metric in metrics:
+            self._previous.pop(metric, None)
+
+    def _rate(self, metric, timestamp, value):
+        """Per-second change since the metric's previous reading (None for the first)"""
+        previous, self._previous[metric] = self._previous.get(metric), (timestamp, value)
+        if previous is None or timestamp <= previous[0]:
+            return None
+        return (value - previous[1]) / (timestamp - previous[0])
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PROCESS SUPERVISION - Every external command the collectors run goes through here
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class SourceUnavailable(Exception):
+    """A source was skipped: a previous call is still running or its circuit is open"""
+
+class SourceBusy(SourceUnavailable):
+    """A source was skipped because its previous calls are still running.
+
+    Not a failure: callers keep their last reading and try again next tick.
+    """
+
+PAUSED = "; calls paused until"
+
+def error_kind(error):
+    """An error message without the circuit breaker's resume time.
+
+    While a source's circuit is open its calls fail with the failure that
+    tripped it plus PAUSED and a time, so collectors comparing kinds log a
+    failure once until it recovers rather than once per cooldown.
+    """
+    return error.partition(PAUSED)[0] if error else error
+
+class ProcessRunner:
+    """Runs collector commands with a hard deadline, concurrency caps and circuit breakers.
+
+    - Each command starts in its own session/process group.  On timeout the
+      whole group is SIGKILLed and the child reaped, so grandchildren
+      (e.g. helpers spawned by a wedged nvidia-smi) don't linger.
+    - At most MAX_IN_FLIGHT calls per source run at once; further calls
+      fail fast with SourceBusy instead of piling up threads.
+    - After FAILURE_THRESHOLD consecutive timeouts/spawn errors the source's
+      circuit opens and calls are skipped for a cooldown that doubles on
+      each re-trip (up to MAX_COOLDOWN).  The first call after the cooldown
+      is the trial: success closes the circuit.
+    """
+
+    MAX_IN_FLIGHT = 2
+    FAILURE_THRESHOLD = 3
+    BASE_COOLDOWN = 15      # seconds
+    MAX_COOLDOWN = 300
+
+    class _Source:
+        __slots__ = ("in_flight", "failures", "open_until", "cooldown", "last_error")
+
+        def __init__(self):
+            self.in_flight = 0
+            self.failures = 0
+            self.open_until = 0.0
+            self.cooldown = 0
+            self.last_error = None      # message of the failure that tripped the circuit
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sources = {}
+        self._running = set()       # live Popen objects, killed on shutdown()
+
+    def run(self, source, cmd, timeout):
+        """Run `cmd` for `source` and return a CompletedProcess (text output).
+
+        Raises subprocess.TimeoutExpired, OSError (e.g. FileNotFoundError)
+        or SourceUnavailable.
+        """
+        now = time.monotonic()
+        with self._lock:
+            state = self._sources.get(source)
+            if state is None:
+                state = self._sources[source] = self._Source()
+            if state.open_until > now:
+                resume = datetime.fromtimestamp(time.time() + state.open_until - now).strftime('%X')
+                raise SourceUnavailable(f"{state.last_error}{PAUSED} {resume}")
+            if state.in_flight >= self.MAX_IN_FLIGHT:
+                raise SourceBusy(f"{source}: previous calls still running")
+            state.in_flight += 1
+
+        try:
+            try:
+                proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                        text=True, start_new_session=True)
+            except OSError as e:
+                self._record(state, ok=False, error=e)
+                raise
+            with self._lock:
+                self._running.add(proc)
+            try:
+                stdout, stderr = proc.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired as e:
+                self._kill(proc)
+                self._record(state, ok=False, error=e)
+                raise
+            finally:
+                with self._lock:
+                    self._running.discard(proc)
+            self._record(state, ok=True)
+            return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+        finally:
+            with self._lock:
+                state.in_flight -= 1
+
+    def _record(self, state, ok, error=None):
+        with self._lock:
+            if ok:
+                state.failures = 0
+                state.cooldown = 0
+                return
+            state.failures += 1
+            state.last_error = str(error)
+            if state.failures >= self.FAILURE_THRESHOLD:
+                state.cooldown = min(state.cooldown * 2 or self.BASE_COOLDOWN, self.MAX_COOLDOWN)
+                state.open_until = time.monotonic() + state.cooldown
+                state.failures = self.FAILURE_THRESHOLD - 1    # one more failure re-trips after the trial
+
+    @staticmethod
+    def _kill(proc):
+        """SIGKILL the command's whole process group, then reap it"""
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+        try:
+            proc.communicate(timeout=1)
+        except subprocess.TimeoutExpired:
+            # A descendant escaped the group and still holds the pipes; stop reading
+            for pipe in (proc.stdout, proc.stderr):
+                if pipe:
+                    pipe.close()
+            proc.wait()
+
+    def shutdown(self):
+        """Kill every command still running (called on exit so worker threads can finish)"""
+        with self._lock:
+            running = list(self._running)
+        for proc in running:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                pass
+
+process_runner = ProcessRunner()
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PROFILING - --profile: timer lag, time per collector/render method, stack samples
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TimingStats:
+    """Count, total, max and approximate percentiles of a stream of durations (seconds)"""
+    __slots__ = ("count", "total", "max", "sketch")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.sketch = QuantileSketch()
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.sketch.add(seconds)
+
+class Profiler:
+    """Built-in profiler for --profile; answers "which part of the monitor is slow".
+
+    - Every Textual timer tick (set_interval callbacks, including the
+      collectors') is timed against the moment Textual scheduled it: the
+      difference is event-loop lag.  The callback's run time is recorded too.
+    - The collector and render methods in METHODS are wrapped to time each
+      call, on whichever thread runs it (workers included).
+    - A background thread samples every thread's stack SAMPLE_INTERVAL
+      apart.  Identical stacks are counted, not stored, so memory stays
+      bounded however long the run; on exit they are written as collapsed
+      stacks (flamegraph.pl, speedscope, inferno) or, for a .json path,
+      a speedscope profile.
+    """
+
+    SAMPLE_INTERVAL = 0.01      # seconds between stack samples (100 Hz)
+    # Class name -> methods timed per call
+    METHODS = {
+        "GPUStats": ("_sample_gpus_worker", "apply_gpus", "_gpu_processes_worker", "apply_gpu_processes", "render"),
+        "GPUProcessTable": ("update_processes",),
+        "GPUOverview": ("render",),
+        "CPUStats": ("update_host_data", "render"),
+        "DiskStats": ("update_disk_data", "render"),
+        "NetworkStats": ("_network_worker", "apply_network", "render"),
+        "NetworkGraph": ("render",),
+        "RdmaStats": ("_rdma_worker", "apply_rdma", "render"),
+        "ConnectionStats": ("_connections_worker", "apply_connections", "render"),
+        "DockerStats": ("_docker_worker", "apply_docker", "_sync_rows"),
+        "ContainerScreen": ("_sample_worker", "apply_sample"),
+        "CustomHeader": ("update_time",),
+        "FrameClock": ("flush",),
+    }
+
+    def __init__(self, path):
+        self.path = path
+        self.timer_lag = {}         # timer label -> TimingStats of lag
+        self.timer_run = {}         # timer label -> TimingStats of callback run time
+        self.methods = {}           # "Class.method" -> TimingStats
+        self._stacks = {}           # (thread name, frame labels outermost first) -> sample count
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler = None
+        self._started = None
+
+    def install(self):
+        """Wrap Textual's timer tick and the METHODS; call before the app is created"""
+        from textual.timer import Timer
+
+        profiler = self
+        original_tick = Timer._tick
+
+        async def _tick(timer, *, next_timer, count):
+            started = time.monotonic()      # Textual schedules timers on the monotonic clock
+            try:
+                await original_tick(timer, next_timer=next_timer, count=count)
+            finally:
+                profiler.record_timer(profiler.timer_label(timer), started - next_timer, time.monotonic() - started)
+
+        Timer._tick = _tick
+        for class_name, names in self.METHODS.items():
+            cls = globals()[class_name]
+            for name in names:
+                setattr(cls, name, self.timed(f"{class_name}.{name}", getattr(cls, name)))
+
+    @staticmethod
+    def timer_label(timer):
+        callback = timer._callback
+        owner = getattr(callback, "__self__", None)
+        if owner is not None:
+            return f"{type(owner).__name__}.{callback.__name__}"
+        return getattr(callback, "__qualname__", None) or f"timer {timer.name}"
+
+    def timed(self, label, method):
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.record(self.methods, label, time.perf_counter() - started)
+        return wrapper
+
+    def record(self, table, label, seconds):
+        with self._lock:
+            stats = table.get(label)
+            if stats is None:
+                stats = table[label] = TimingStats()
+            stats.add(seconds)
+
+    def record_timer(self, label, lag, run):
+        self.record(self.timer_lag, label, max(lag, 0.0))
+        self.record(self.timer_run, label, run)
+
+    def start(self):
+        self._started = time.perf_counter()
+        self._sampler = threading.Thread(target=self._sample_stacks, name="profiler", daemon=True)
+        self._sampler.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+
+    def _sample_stacks(self):
+        me = threading.get_ident()
+        labels = {}     # code object -> frame label
+        while not self._stop.wait(self.SAMPLE_INTERVAL):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    label = labels.get(code)
+                    if label is None:
+                        label = labels[code] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                    stack.append(label)
+                    frame = frame.f_back
+                key = (names.get(ident, f"thread-{ident}"), tuple(reversed(stack)))
+                self._stacks[key] = self._stacks.get(key, 0) + 1
+
+    def write(self):
+        """Write the stack samples to self.path; returns the number of samples"""
+        if self.path.endswith(".json"):
+            self._write_speedscope()
+        else:
+            with open(self.path, "w") as f:
+                for (thread, stack), count in sorted(self._stacks.items()):
+                    f.write(";".join((thread,) + stack) + f" {count}\n")
+        return sum(self._stacks.values())
+
+    def _write_speedscope(self):
+        import json
+
+        frames, index = [], {}
+        profiles = {}       # thread name -> (samples, weights)
+        for (thread, stack), count in self._stacks.items():
+            indices = []
+            for label in stack:
+                if label not in index:
+                    index[label] = len(frames)
+                    frames.append({"name": label})
+                indices.append(index[label])
+            samples, weights = profiles.setdefault(thread, ([], []))
+            samples.append(indices)
+            weights.append(count * self.SAMPLE_INTERVAL)
+        document = {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": "system-info-textual-tui",
+            "exporter": "system-info-textual-tui --profile",
+            "shared": {"frames": frames},
+            "profiles": [{"type": "sampled", "name": thread, "unit": "seconds", "startValue": 0,
+                          "endValue": sum(weights), "samples": samples, "weights": weights}
+                         for thread, (samples, weights) in sorted(profiles.items())],
+        }
+        with open(self.path, "w") as f:
+            json.dump(document, f)
+
+    def report(self):
+        """Summary tables for the terminal (milliseconds)"""
+        def row(label, stats, *extra):
+            return (f"{label:<44} {stats.count:>7} " + " ".join(f"{value:>9.2f}" for value in extra)
+                    + f" {stats.sketch.quantile(0.5) * 1000:>9.2f} {stats.sketch.quantile(0.99) * 1000:>9.2f}"
+                    + f" {stats.max * 1000:>9.2f}")
+
+        elapsed = time.perf_counter() - self._started if self._started else 0
+        lines = [f"Profiled {elapsed:.1f} s", "",
+                 f"{'Timer lag (actual - scheduled)':<44} {'ticks':>7} {'run ms':>9} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}"]
+        for label, lag in sorted(self.timer_lag.items(), key=lambda item: -item[1].max):
+            lines.append(row(label, lag, self.timer_run[label].total / self.timer_run[label].count * 1000))
+        lines += ["", f"{'Method':<44} {'calls':>7} {'total ms':>9} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}"]
+        for label, stats in sorted(self.methods.items(), key=lambda item: -item[1].total):
+            lines.append(row(label, stats, stats.total * 1000))
+        return lines
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# WARM START - Last-known panel data, shown until the collectors first report
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class SnapshotCache:
+    """Saves the latest samples on exit and loads them on the next start.
+
+    Panels paint the cached values (marked as last-known) on the first frame
+    instead of a blank screen, then switch to live data as each collector
+    reports.  Snapshots older than MAX_AGE are ignored.
+    """
+
+    DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "system-info-textual-tui", "snapshot.json")
+    MAX_AGE = 24 * 3600
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+
+    def load(self):
+        """Return the saved snapshot dict, or None if missing, stale or unreadable"""
+        import json
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(snapshot, dict):
+            return None     # valid JSON but not a snapshot, e.g. [] or null
+        saved = snapshot.get("time")
+        if not isinstance(saved, (int, float)) or time.time() - saved > self.MAX_AGE:
+            return None
+        return snapshot
+
+    def save(self, snapshot):
+        import json
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f)
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass  # a missing warm start is harmless
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# HOST - CPU, memory and disks straight from /proc, no subprocesses
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class ProcFile:
+    """A /proc file held open and re-read from offset 0 on every sample.
+
+    The kernel regenerates the contents on each read, so keeping the handle
+    saves the open/close and path lookup a fresh open() would cost per tick.
+    """
+    __slots__ = ("path", "_file")
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def read(self):
+        """Current contents as bytes (reopens after a failed read)"""
+        try:
+            if self._file is None:
+                self._file = open(self.path, "rb", buffering=0)
+            self._file.seek(0)
+            return self._file.readall()
+        except OSError:
+            self.close()
+            raise
+
+    def chunks(self, size):
+        """Current contents in pieces of about `size` bytes, each ending at a line break"""
+        try:
+            if self._file is None:
+                self._file = open(self.path, "rb", buffering=0)
+            self._file.seek(0)
+            rest = b""
+            while True:
+                block = self._file.read(size)
+                if not block:
+                    break
+                block = rest + block
+                cut = block.rfind(b"\n") + 1
+                rest = block[cut:]
+                if cut:
+                    yield block[:cut]
+            if rest:
+                yield rest
+        except OSError:
+            self.close()
+            raise
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+class HostSampler:
+    """CPU utilization from /proc/stat deltas and memory from /proc/meminfo"""
+
+    MEMINFO_FIELDS = (b"MemTotal:", b"MemAvailable:", b"SwapTotal:", b"SwapFree:")
+
+    def __init__(self, root="/proc"):
+        self._stat = ProcFile(os.path.join(root, "stat"))
+        self._meminfo = ProcFile(os.path.join(root, "meminfo"))
+        self._previous = None       # (busy, total, iowait) jiffy lists from the last read
+
+    def sample_cpu(self):
+        """Utilization since the previous call; None on the first call or when CPUs go on/offline"""
+        # The aggregate "cpu" line comes first, then cpu0..cpuN; all have the same
+        # number of fields, so split them in one go and slice out columns
+        lines = self._stat.read().split(b"\n")
+        count = 0
+        for line in lines:
+            if not line.startswith(b"cpu"):
+                break
+            count += 1
+        fields = b" ".join(lines[:count]).split()
+        width = len(fields) // count
+        # user nice system idle iowait irq softirq steal (guest time is already counted in user/nice)
+        columns = [list(map(int, fields[column::width])) for column in range(1, 9)]
+        total = list(map(sum, zip(*columns)))
+        iowait = columns[4]
+        busy = [jiffies - idle - wait for jiffies, idle, wait in zip(total, columns[3], iowait)]
+
+        previous, self._previous = self._previous, (busy, total, iowait)
+        if previous is None or len(previous[0]) != len(busy):
+            return None
+        usage = [(b - pb) * 100 / (t - pt) if t > pt else 0.0
+                 for b, pb, t, pt in zip(busy, previous[0], total, previous[1])]
+        elapsed = total[0] - previous[1][0]
+        wait = (iowait[0] - previous[2][0]) * 100 / elapsed if elapsed > 0 else 0.0
+        return CPUSample(usage[0], tuple(usage[1:]), wait)
+
+    def sample_memory(self):
+        values = {}
+        wanted = len(self.MEMINFO_FIELDS)
+        for line in self._meminfo.read().split(b"\n"):
+            fields = line.split()
+            if fields and fields[0] in self.MEMINFO_FIELDS:
+                values[fields[0]] = int(fields[1]) / 1024     # kB -> MB
+                if len(values) == wanted:
+                    break
+        return MemorySample(*(values.get(field, 0.0) for field in self.MEMINFO_FIELDS))
+
+    def close(self):
+        self._stat.close()
+        self._meminfo.close()
+
+class DiskSampler:
+    """Per-device I/O rates from /proc/diskstats deltas.
+
+    Only whole disks listed in /sys/block are kept; partitions never appear
+    there, and loop/ram devices (plus any the config's NameFilter rejects)
+    are dropped by name.  Lines for other
+    devices are rejected after splitting off just the name, so hosts with
+    hundreds of partitions or loop mounts cost little extra.
+    """
+
+    SECTOR_SIZE = 512            # /proc/diskstats counts 512-byte sectors regardless of the device
+    SKIP_PREFIXES = ("loop", "ram")
+
+    def __init__(self, proc="/proc", sysfs="/sys", names=None):
+        self._diskstats = ProcFile(os.path.join(proc, "diskstats"))
+        self._block_dir = os.path.join(sysfs, "block")
+        self._names = names          # NameFilter from the config, or None for every disk
+        self._devices = None         # names of whole disks to report
+        self._line_count = None      # /proc/diskstats lines when _devices was built
+        self._previous = {}          # name -> (time, reads, read_sectors, writes, write_sectors, io_ticks)
+
+    def _scan_devices(self):
+        try:
+            names = os.listdir(self._block_dir)
+        except OSError:
+            names = ()
+        self._devices = {name for name in names if not name.startswith(self.SKIP_PREFIXES)
+                         and (self._names is None or self._names(name))}
+
+    def set_filter(self, names):
+        """Use a new NameFilter; the disk list is rebuilt on the next sample"""
+        if names != self._names:
+            self._names = names
+            self._devices = None
+
+    def sample(self):
+        """Rates since the previous call, one DiskSample per disk; None on the first call.
+
+        Devices that appear between calls are reported from the call after.
+        """
+        now = time.monotonic()
+        lines = self._diskstats.read().split(b"\n")
+        primed = self._line_count is not None
+        if len(lines) != self._line_count or self._devices is None:
+            # A device appeared or went away (or the filter changed): rebuild the whole-disk list
+            self._scan_devices()
+            self._line_count = len(lines)
+        devices = self._devices
+        previous, current = self._previous, {}
+        disks = []
+        for line in lines:
+            # major minor name ... ; split off only the name until we know we want the line
+            head = line.split(None, 3)
+            if len(head) < 4:
+                continue
+            name = head[2].decode()
+            if name not in devices:
+                continue
+            fields = head[3].split()
+            # reads merged sectors ms  writes merged sectors ms  in-flight io_ticks ...
+            counters = (now, int(fields[0]), int(fields[2]), int(fields[4]), int(fields[6]), int(fields[9]))
+            current[name] = counters
+            before = previous.get(name)
+            if before is None:
+                continue
+            elapsed = now - before[0]
+            if elapsed <= 0:
+                continue
+            disks.append(DiskSample(
+                name,
+                (counters[2] - before[2]) * self.SECTOR_SIZE / elapsed,
+                (counters[4] - before[4]) * self.SECTOR_SIZE / elapsed,
+                (counters[1] - before[1]) / elapsed,
+                (counters[3] - before[3]) / elapsed,
+                min((counters[5] - before[5]) / (elapsed * 10), 100.0),    # io_ticks are ms busy
+            ))
+        self._previous = current
+        return tuple(disks) if primed else None
+
+    def close(self):
+        self._diskstats.close()
+
+class ConnectionSampler:
+    """TCP sockets by state, busiest local ports and top remote hosts from /proc/net/tcp{,6}.
+
+    The tables are streamed CHUNK_SIZE bytes at a time through held-open
+    handles and folded into per-state and per-port counts plus a TopK of
+    remote hosts, so memory stays bounded however many sockets there are.
+    The kernel pads every /proc/net/tcp line to the same width, so a chunk
+    is normally unpacked by one struct.iter_unpack() call; tcp6 (unpadded)
+    and the chunks where the slot number gains a digit go through a regex.
+
+    /proc/net/sockstat{,6} are read first.  While they are byte-for-byte
+    unchanged the previous summary is reused, at most MAX_REUSE times in a
+    row since a socket that only changes state doesn't show there.
+    """
+
+    CHUNK_SIZE = 1 << 20
+    TOP_HOSTS = 1024         # TopK capacity; the panel shows the first few
+    MAX_REUSE = 5
+    LISTEN = b"0A"
+    STATES = {b"01": "ESTABLISHED", b"02": "SYN_SENT", b"03": "SYN_RECV", b"04": "FIN_WAIT1",
+              b"05": "FIN_WAIT2", b"06": "TIME_WAIT", b"07": "CLOSE", b"08": "CLOSE_WAIT",
+              b"09": "LAST_ACK", b"0A": "LISTEN", b"0B": "CLOSING", b"0C": "NEW_SYN_RECV"}
+
+    def __init__(self, proc="/proc"):
+        net = os.path.join(proc, "net")
+        # (table, hex digits per address); tcp6 and sockstat6 are missing when IPv6 is disabled
+        self._tables = ((ProcFile(os.path.join(net, "tcp")), 8), (ProcFile(os.path.join(net, "tcp6")), 32))
+        self._sockstat = (ProcFile(os.path.join(net, "sockstat")), ProcFile(os.path.join(net, "sockstat6")))
+        self._patterns = {
+            digits: re.compile(rb": [0-9A-F]{%d}:([0-9A-F]{4}) ([0-9A-F]{%d}):[0-9A-F]{4} ([0-9A-F]{2})" % (digits, digits))
+            for _, digits in self._tables
+        }
+        self._last_sockstat = None
+        self._last = None
+        self._reused = 0
+
+    def sample(self):
+        """A ConnectionSample, reused (with scan_time None) while sockstat is unchanged"""
+        sockstat = self._sockstat[0].read() + self._read_optional(self._sockstat[1])
+        if sockstat == self._last_sockstat and self._reused < self.MAX_REUSE:
+            self._reused += 1
+            return self._last._replace(scan_time=None)
+        started = time.perf_counter()
+        states, ports, hosts = Counter(), Counter(), TopK(self.TOP_HOSTS)
+        for table, digits in self._tables:
+            try:
+                self._scan(table, digits, states, ports, hosts)
+            except FileNotFoundError:
+                if digits == 8:
+                    raise
+        named_hosts = Counter()
+        for address, count in hosts.most_common():
+            named_hosts[self.format_address(address)] += count  # IPv4-mapped tcp6 peers join their IPv4 entry
+        counters = self.parse_sockstat(sockstat)
+        self._last = ConnectionSample(
+            tuple((self.STATES.get(state, state.decode()), count) for state, count in states.most_common()),
+            tuple(named_hosts.most_common()),
+            hosts.error,
+            tuple((int(port, 16), count) for port, count in ports.most_common(self.TOP_HOSTS)),
+            counters.get(("sockets", "used"), 0),
+            counters.get(("TCP", "orphan"), 0),
+            counters.get(("UDP", "inuse"), 0) + counters.get(("UDP6", "inuse"), 0),
+            time.perf_counter() - started,
+        )
+        self._last_sockstat, self._reused = sockstat, 0
+        return self._last
+
+    def _scan(self, table, digits, states, ports, hosts):
+        pattern = self._patterns[digits]
+        header = True
+        for block in table.chunks(self.CHUNK_SIZE):
+            if header:
+                block = block[block.find(b"\n") + 1:]
+                header = False
+            rows = list(self._unpack(block, digits) or pattern.findall(block))
+            # Count whole columns at C speed; only the few (port, state) pairs loop in Python
+            for (port, state), count in Counter(map(operator.itemgetter(0, 2), rows)).items():
+                states[state] += count
+                if state != self.LISTEN:
+                    ports[port] += count
+            hosts.update(map(operator.itemgetter(1), rows))
+            hosts.discard(b"0" * digits)         # listening and unconnected sockets
+
+    @staticmethod
+    def _unpack(block, digits):
+        """(local port, remote address, state) per line, or None unless every line has the same layout"""
+        length = block.find(b"\n") + 1
+        colon = block.find(b":")       # ends the slot number
+        if length <= 0 or colon < 0:
+            return None
+        lines = len(block) // length
+        if (len(block) != lines * length or block[length - 1::length] != b"\n" * lines
+                or block[colon::length] != b":" * lines):
+            return None
+        # "sl: local:port remote:port st ..." with fixed-width hex fields after the colon
+        return struct.iter_unpack(f"{colon + 3 + digits}x4sx{digits}s6x2s{length - colon - 16 - 2 * digits}x", block)
+
+    @staticmethod
+    def _read_optional(proc_file):
+        try:
+            return proc_file.read()
+        except FileNotFoundError:
+            return b""
+
+    @staticmethod
+    def format_address(hex_address):
+        """Printable form of a /proc/net/tcp address (hex 32-bit words in host byte order)"""
+        raw = bytes.fromhex(hex_address.decode())
+        if sys.byteorder == "little":
+            raw = b"".join(raw[i:i + 4][::-1] for i in range(0, len(raw), 4))
+        if raw[:12] == b"\0" * 10 + b"\xff\xff":
+            raw = raw[12:]      # IPv4-mapped IPv6
+        return socket.inet_ntop(socket.AF_INET if len(raw) == 4 else socket.AF_INET6, raw)
+
+    @staticmethod
+    def parse_sockstat(text):
+        """{(protocol, field): value} from lines like "TCP: inuse 5 orphan 0 tw 2 alloc 7 mem 1" """
+        values = {}
+        for line in text.split(b"\n"):
+            protocol, _, fields = line.partition(b": ")
+            fields = fields.split()
+            for name, value in zip(fields[::2], fields[1::2]):
+                values[(protocol.decode(), name.decode())] = int(value)
+        return values
+
+    def close(self):
+        for table, _ in self._tables:
+            table.close()
+        for proc_file in self._sockstat:
+            proc_file.close()
+
+class ProcStat(NamedTuple):
+    """One read of /proc/<pid>/stat"""
+    key: Tuple[int, int]    # (pid, start time): tells a reused PID apart from its predecessor
+    comm: str
+    threads: int
+    rss: float              # MB
+    cpu: Optional[float]    # percent since the previous scan (100 = one core), None on the first
+
+class ProcStatParser:
+    """Parses /proc/<pid>/stat and turns successive CPU times into CPU%.
+
+    parse() each process of a scan, then end_scan(); CPU times of processes
+    not seen in the scan are dropped.
+    """
+
+    def __init__(self):
+        self._clock_ticks = os.sysconf("SC_CLK_TCK")
+        self._page_size = os.sysconf("SC_PAGE_SIZE")
+        self._cpu_times = {}    # (pid, start time) -> (monotonic time, utime + stime ticks)
+        self._scan = {}
+
+    def parse(self, pid, stat, now):
+        # Fields after "(comm)" start at field 3 (state); comm itself may contain spaces or ")"
+        end = stat.rindex(b")")
+        fields = stat[end + 2:].split()
+        cpu_ticks = int(fields[11]) + int(fields[12])       # utime + stime
+        key = (pid, int(fields[19]))                         # starttime
+        self._scan[key] = (now, cpu_ticks)
+        previous = self._cpu_times.get(key)
+        cpu = None
+        if previous is not None and now > previous[0]:
+            cpu = (cpu_ticks - previous[1]) / self._clock_ticks / (now - previous[0]) * 100
+        return ProcStat(key, stat[stat.index(b"(") + 1:end].decode(errors="replace"), int(fields[17]),
+                        int(fields[21]) * self._page_size / (1024 * 1024), cpu)
+
+    def end_scan(self):
+        self._cpu_times, self._scan = self._scan, {}
+
+class ProcessInspector:
+    """Owner, container, CPU% and RSS for host PIDs, read from /proc/<pid>.
+
+    A PID's user and cgroup can't change for the life of the process, so they
+    are resolved once per (pid, start time) - the start time tells a reused
+    PID apart from the process that held it before.  Only /proc/<pid>/stat is
+    read on every scan, for the CPU time and RSS.
+    """
+
+    # Docker's cgroup path ends in the full 64-hex container ID:
+    # ".../docker-<id>.scope" (systemd driver) or "/docker/<id>" (cgroupfs driver)
+    CONTAINER_ID_RE = re.compile(rb"[/-]([0-9a-f]{64})(?:\.scope)?$", re.MULTILINE)
+
+    def __init__(self, proc="/proc"):
+        self.proc = proc
+        self._stat = ProcStatParser()
+        self._identities = {}   # (pid, start time) -> (user, container ID or None)
+        self._users = {}        # uid -> user name
+
+    def _user_name(self, uid):
+        name = self._users.get(uid)
+        if name is None:
+            import pwd  # only needed once a GPU process is seen
+            try:
+                name = pwd.getpwuid(uid).pw_name
+            except KeyError:
+                name = str(uid)
+            self._users[uid] = name
+        return name
+
+    def _identity(self, pid):
+        """(user, container ID) for a PID; either is None when unreadable"""
+        try:
+            user = self._user_name(os.stat(f"{self.proc}/{pid}").st_uid)
+        except OSError:
+            user = None
+        try:
+            with open(f"{self.proc}/{pid}/cgroup", "rb") as f:
+                match = self.CONTAINER_ID_RE.search(f.read())
+            container_id = match.group(1).decode() if match else None
+        except OSError:
+            container_id = None
+        return user, container_id
+
+    def inspect(self, processes):
+        """Fill user, container_id, cpu and rss on each GPUProcess.
+
+        PIDs that aren't visible here (another PID namespace, already exited)
+        keep None.  Cache entries for processes not in `processes` are dropped.
+        """
+        now = time.monotonic()
+        identities = {}
+        enriched = []
+        for process in processes:
+            try:
+                with open(f"{self.proc}/{process.pid}/stat", "rb") as f:
+                    stat = self._stat.parse(process.pid, f.read(), now)
+            except OSError:
+                enriched.append(process)
+                continue
+            identity = self._identities.get(stat.key)
+            if identity is None:
+                identity = self._identity(process.pid)
+            identities[stat.key] = identity
+            enriched.append(process._replace(
+                user=identity[0],
+                container_id=identity[1],
+                cpu=stat.cpu,
+                rss=stat.rss,
+            ))
+        self._stat.end_scan()
+        self._identities = identities
+        return enriched
+
+class ContainerIOSampler:
+    """Per-container network and block I/O rates, read from the host's /proc and cgroup files.
+
+    Network counters come from /proc/<init pid>/net/dev (the container's
+    network namespace, loopback excluded) and block counters from the
+    cgroup v2 io.stat.  A container's init PID and cgroup directory are
+    looked up once - one batched `docker inspect` for every new container -
+    and dropped when the container stops or its files disappear.
+    """
+
+    def __init__(self, proc="/proc", cgroup_root="/sys/fs/cgroup"):
+        self.proc = proc
+        self.cgroup_root = cgroup_root
+        self._locations = {}    # container ID -> (init pid, cgroup v2 directory or None)
+        self._previous = {}     # container ID -> (monotonic time, rx, tx, read, written)
+
+    def _locate(self, container_ids):
+        """Resolve init PIDs for containers not seen before (one docker inspect call)"""
+        missing = [container_id for container_id in container_ids if container_id not in self._locations]
+        if not missing:
+            return
+        result = process_runner.run("docker", ["docker", "inspect", "--format", "{{.Id}} {{.State.Pid}}", *missing], timeout=10)
+        for line in result.stdout.splitlines():
+            parts = line.split()
+            if len(parts) != 2 or not parts[1].isdigit() or parts[1] == "0":
+                continue
+            pid = int(parts[1])
+            cgroup = None
+            try:
+                with open(f"{self.proc}/{pid}/cgroup") as f:
+                    for entry in f:
+                        if entry.startswith("0::"):   # cgroup v2 unified hierarchy
+                            cgroup = f"{self.cgroup_root}{entry[3:].strip()}"
+            except OSError:
+                continue
+            self._locations[parts[0]] = (pid, cgroup)
+
+    def cgroup_dir(self, container_id):
+        """cgroup v2 directory of a running container, or None until it has been located"""
+        location = self._locations.get(container_id)
+        return location[1] if location is not None else None
+
+    def _read_counters(self, pid, cgroup):
+        rx = tx = 0
+        with open(f"{self.proc}/{pid}/net/dev", "rb") as f:
+            for line in f.read().split(b"\n")[2:]:     # two header lines
+                name, sep, counters = line.partition(b":")
+                if not sep or name.strip() == b"lo":
+                    continue
+                fields = counters.split()
+                rx += int(fields[0])
+                tx += int(fields[8])
+        read = written = None
+        if cgroup:
+            try:
+                with open(f"{cgroup}/io.stat", "rb") as f:
+                    stat = f.read()
+            except OSError:
+                pass    # io controller not enabled for this cgroup
+            else:
+                read = written = 0
+                # "8:0 rbytes=1 wbytes=2 rios=3 wios=4 dbytes=0 dios=0" per device
+                for field in stat.split():
+                    if field.startswith(b"rbytes="):
+                        read += int(field[7:])
+                    elif field.startswith(b"wbytes="):
+                        written += int(field[7:])
+        return rx, tx, read, written
+
+    def sample(self, container_ids):
+        """{container ID: (rx, tx, block read, block write)} in bytes/s for running containers.
+
+        Values are None until a container has two samples, or when its
+        counters are unreadable or went backwards (restart).
+        """
+        try:
+            self._locate(container_ids)
+        except (subprocess.TimeoutExpired, OSError, SourceUnavailable):
+            pass    # retried next poll; containers already located still report
+        now = time.monotonic()
+        rates, current = {}, {}
+        for container_id in container_ids:
+            location = self._locations.get(container_id)
+            if location is None:
+                continue
+            try:
+                counters = self._read_counters(*location)
+            except (OSError, ValueError, IndexError):
+                del self._locations[container_id]    # exited or restarted: look it up again next time
+                continue
+            current[container_id] = (now, *counters)
+            before = self._previous.get(container_id)
+            if before is None or now <= before[0]:
+                continue
+            elapsed = now - before[0]
+            rates[container_id] = tuple(
+                (value - old) / elapsed if value is not None and old is not None and value >= old else None
+                for value, old in zip(counters, before[1:]))
+        for container_id in self._locations.keys() - set(container_ids):
+            del self._locations[container_id]
+        self._previous = current
+        return rates
+
+class ContainerProcessSampler:
+    """Processes of one container: PIDs from its cgroup.procs, CPU and memory from /proc.
+
+    The stat files of up to MAX_OPEN PIDs are held open while those PIDs
+    stay in the cgroup, so a poll of a typical container is one read per
+    process and no opens.  Beyond that, PIDs are opened and closed on each
+    poll, so a container with thousands of processes can't exhaust the
+    file descriptor limit the other collectors and nvidia-smi/docker
+    calls share.  The command line is read once per (pid, start time).
+    Nothing is read between calls to sample(), which the drilldown screen
+    only makes while it is open.
+    """
+
+    MAX_OPEN = 128
+
+    def __init__(self, cgroup_dir, proc="/proc"):
+        self.cgroup_dir = cgroup_dir
+        self.proc = proc
+        self._stat = ProcStatParser()
+        self._files = {}        # pid -> stat ProcFile, at most MAX_OPEN
+        self._commands = {}     # (pid, start time) -> command line
+
+    def pids(self):
+        """PIDs in the container's cgroup and any cgroups nested below it"""
+        with open(f"{self.cgroup_dir}/cgroup.procs", "rb") as f:
+            pids = f.read().split()
+        nested = os.walk(self.cgroup_dir)
+        next(nested, None)
+        for directory, _, files in nested:
+            if "cgroup.procs" in files:
+                try:
+                    with open(f"{directory}/cgroup.procs", "rb") as f:
+                        pids.extend(f.read().split())
+                except OSError:
+                    pass    # removed while walking
+        return [int(pid) for pid in pids]
+
+    def _command(self, pid, comm):
+        try:
+            with open(f"{self.proc}/{pid}/cmdline", "rb") as f:
+                command = f.read().replace(b"\0", b" ").strip().decode(errors="replace")
+        except OSError:
+            command = ""
+        return command or f"[{comm}]"    # kernel threads and zombies have no command line
+
+    def sample(self):
+        """One ContainerProcess per live PID; cpu is None until a PID has two samples.
+
+        Raises OSError when the cgroup is gone (container stopped).
+        """
+        pids = self.pids()
+        now = time.monotonic()
+        processes, files, commands = [], {}, {}
+        for pid in pids:
+            handle = self._files.pop(pid, None)
+            held = handle is not None
+            if not held:
+                handle = ProcFile(f"{self.proc}/{pid}/stat")
+            try:
+                stat = self._stat.parse(pid, handle.read(), now)
+            except OSError:
+                continue    # exited since cgroup.procs was read (read() closed the handle)
+            # Handles already held are kept; new ones only while under the cap
+            if pid not in files and (held or len(files) + len(self._files) < self.MAX_OPEN):
+                files[pid] = handle
+            else:
+                handle.close()
+            command = self._commands.get(stat.key)
+            if command is None:
+                command = self._command(pid, stat.comm)
+            commands[stat.key] = command
+            processes.append(ContainerProcess(pid, command, stat.threads, stat.cpu, stat.rss))
+        self._stat.end_scan()
+        self.close()    # handles of PIDs that left the cgroup
+        self._files, self._commands = files, commands
+        return processes
+
+    def close(self):
+        for handle in self._files.values():
+            handle.close()
+        self._files = {}
+
+class RdmaSampler:
+    """InfiniBand/RoCE port throughput, errors and link state from /sys/class/infiniband.
+
+    RDMA traffic bypasses the kernel's network stack, so it never shows in
+    /proc/net/dev.  Every port's state and counter files are held open and
+    re-read on each sample; the device and port directories are listed
+    again each time, so ports that appear or go away are picked up without
+    reopening the others.  port_rcv_data and port_xmit_data count 4-byte
+    words.
+    """
+
+    WORD = 4
+    DATA_COUNTERS = ("port_rcv_data", "port_xmit_data")
+    # Summed into one error count; drivers that lack some of these just skip them
+    ERROR_COUNTERS = ("symbol_error", "port_rcv_errors", "port_rcv_remote_physical_errors",
+                      "port_rcv_switch_relay_errors", "port_rcv_constraint_errors", "port_xmit_discards",
+                      "port_xmit_constraint_errors", "local_link_integrity_errors",
+                      "excessive_buffer_overrun_errors", "link_error_recovery", "link_downed", "VL15_dropped")
+
+    def __init__(self, root="/sys/class/infiniband"):
+        self.root = root
+        self._ports = {}        # name -> (state, rate, link layer, data ProcFiles, error ProcFiles)
+        self._previous = {}     # name -> (monotonic time, rx words, tx words, errors)
+
+    @staticmethod
+    def _read_text(path):
+        try:
+            with open(path) as f:
+                return f.read().strip()
+        except OSError:
+            return ""
+
+    def _open_port(self, path):
+        counters = f"{path}/counters"
+        errors = tuple(ProcFile(f"{counters}/{name}") for name in self.ERROR_COUNTERS
+                       if os.path.exists(f"{counters}/{name}"))
+        return (ProcFile(f"{path}/state"), self._read_text(f"{path}/rate"), self._read_text(f"{path}/link_layer"),
+                tuple(ProcFile(f"{counters}/{name}") for name in self.DATA_COUNTERS), errors)
+
+    def _discover(self, names):
+        """Open newly seen ports and close those that disappeared or are filtered out"""
+        found = set()
+        try:
+            devices = os.listdir(self.root)
+        except FileNotFoundError:
+            devices = []        # no RDMA driver loaded
+        for device in devices:
+            if names is not None and not names(device):
+                continue
+            try:
+                ports = os.listdir(f"{self.root}/{device}/ports")
+            except OSError:
+                continue
+            for port in ports:
+                name = f"{device}/{port}"
+                found.add(name)
+                if name not in self._ports:
+                    self._ports[name] = self._open_port(f"{self.root}/{device}/ports/{port}")
+        for name in self._ports.keys() - found:
+            self._close_port(name)
+
+    def _close_port(self, name):
+        state, _, _, data, errors = self._ports.pop(name)
+        for handle in (state, *data, *errors):
+            handle.close()
+
+    def sample(self, names=None):
+        """One RdmaPortSample per port whose device passes the `names` filter, sorted by name.
+
+        Rates are None until a port has two samples, or when a counter went
+        backwards (port or driver reset).
+        """
+        self._discover(names)
+        now = time.monotonic()
+        samples, current = [], {}
+        for name in sorted(self._ports):
+            state_file, rate, link_layer, data, errors = self._ports[name]
+            try:
+                state = state_file.read().decode().partition(":")[2].strip() or "UNKNOWN"   # "4: ACTIVE"
+                rx, tx = (int(handle.read()) for handle in data)
+                error_count = sum(int(handle.read()) for handle in errors)
+            except (OSError, ValueError):
+                self._close_port(name)      # reopened on the next sample if it is still there
+                continue
+            current[name] = (now, rx, tx, error_count)
+            rates = (None, None, None)
+            before = self._previous.get(name)
+            if before is not None and now > before[0]:
+                elapsed = now - before[0]
+                rates = tuple(
+                    (value - old) * scale / elapsed if value >= old else None
+                    for value, old, scale in zip((rx, tx, error_count), before[1:], (self.WORD, self.WORD, 1)))
+            samples.append(RdmaPortSample(name, state, rate, link_layer, rates[0], rates[1], error_count, rates[2]))
+        self._previous = current
+        return tuple(samples)
+
+    def close(self):
+        for name in list(self._ports):
+            self._close_port(name)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONFIG - Optional TOML file: which collectors run, how often and what they show
+# ═══════════════════════════════════════════════════════════════════════════════
+
+try:
+    import tomllib
+except ImportError:         # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+class ConfigError(Exception):
+    """The config file can't be read or has an invalid setting"""
+
+class NameFilter:
+    """Include/exclude globs for interface, disk or container names.
+
+    Each list is compiled once into a single regex.  A name passes if it
+    matches an include glob (or there are none) and no exclude glob.
+    """
+    __slots__ = ("include", "exclude", "_include", "_exclude")
+
+    def __init__(self, include=(), exclude=()):
+        self.include = tuple(include)
+        self.exclude = tuple(exclude)
+        self._include = re.compile("|".join(map(translate, self.include))) if self.include else None
+        self._exclude = re.compile("|".join(map(translate, self.exclude))) if self.exclude else None
+
+    def __call__(self, name):
+        if self._include is not None and not self._include.match(name):
+            return False
+        return self._exclude is None or not self._exclude.match(name)
+
+    def __eq__(self, other):
+        return isinstance(other, NameFilter) and (self.include, self.exclude) == (other.include, other.exclude)
+
+    def __hash__(self):
+        return hash((self.include, self.exclude))
+
+class CollectorConfig(NamedTuple):
+    """Settings for one collector (one [section] of the config file)"""
+    enabled: bool = True
+    interval: float = 1                     # seconds between samples
+    process_interval: Optional[float] = None  # GPU only: seconds between process scans
+    names: NameFilter = NameFilter()        # interfaces, disks or containers to show
+
+class Config:
+    """Per-collector settings: DEFAULTS overlaid with the sections of a TOML file.
+
+        [gpu]
+        enabled = false             # never create or schedule the collector
+
+        [network]
+        interval = 2
+        include = ["eth*", "en*"]
+        exclude = ["veth*", "docker*", "br-*", "virbr*"]
+    """
+
+    DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".config", "system-info-textual-tui", "config.toml")
+    DEFAULTS = {
+        "gpu": {"enabled": True, "interval": 1, "process_interval": 5},
+        "cpu": {"enabled": True, "interval": 1},
+        "disk": {"enabled": True, "interval": 1, "include": [], "exclude": []},
+        "network": {"enabled": True, "interval": 5, "include": [],
+                    "exclude": ["veth*", "docker*", "br-*", "virbr*"]},   # virtual interfaces
+        "docker": {"enabled": True, "interval": 10, "include": [], "exclude": []},
+        "connections": {"enabled": True, "interval": 5},
+        "rdma": {"enabled": True, "interval": 1, "include": [], "exclude": []},   # names are devices (mlx5_0)
+    }
+
+    def __init__(self, data=None):
+        """Build from parsed TOML data; raises ConfigError on unknown or invalid settings"""
+        data = data or {}
+        unknown = set(data) - set(self.DEFAULTS)
+        if unknown:
+            raise ConfigError(f"unknown section [{sorted(unknown)[0]}] (expected one of {', '.join(self.DEFAULTS)})")
+        self.collectors = {name: self._section(name, data.get(name, {})) for name in self.DEFAULTS}
+
+    @classmethod
+    def load(cls, path):
+        """Read a TOML config file; raises ConfigError"""
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+        except OSError as e:
+            raise ConfigError(f"can't read {path}: {e.strerror}") from e
+        if tomllib is None:
+            raise ConfigError(f"reading {path} needs Python 3.11+ or the tomli package")
+        try:
+            return cls(tomllib.loads(raw.decode()))
+        except (tomllib.TOMLDecodeError, UnicodeDecodeError) as e:
+            raise ConfigError(f"{path}: {e}") from e
+
+    @classmethod
+    def _section(cls, name, values):
+        defaults = cls.DEFAULTS[name]
+        if not isinstance(values, dict):
+            raise ConfigError(f"[{name}] must be a table")
+        for key, value in values.items():
+            if key not in defaults:
+                raise ConfigError(f"unknown setting {name}.{key}")
+            if isinstance(defaults[key], bool):
+                valid = isinstance(value, bool)
+            elif isinstance(defaults[key], list):
+                valid = isinstance(value, list) and all(isinstance(item, str) for item in value)
+            else:
+                valid = isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0
+            if not valid:
+                raise ConfigError(f"invalid value for {name}.{key}: {value!r}")
+        settings = {**defaults, **values}
+        return CollectorConfig(settings["enabled"], settings["interval"], settings.get("process_interval"),
+                               NameFilter(settings.get("include", ()), settings.get("exclude", ())))
+
+    def __getitem__(self, name):
+        return self.collectors[name]
+
+class Collector:
+    """Mixin for panels fed by a collector the config can reschedule, filter or pause.
+
+    Subclasses list their timers in schedule(); apply_config() swaps in new
+    settings at runtime (SIGHUP reload) by restarting those timers.
+    """
+
+    def schedule(self, config):
+        """(interval, callback) pairs to run while the collector is enabled"""
+        return ()
+
+    def apply_config(self, config):
+        self.config = config
+        for timer in getattr(self, "_collector_timers", ()):
+            timer.stop()
+        self._collector_timers = []
+        if config.enabled:
+            self._collector_timers = [self.set_interval(interval, callback) for interval, callback in self.schedule(config)]
+        self.display = config.enabled
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FRAME CLOCK - One repaint per tick for all panels, capped at a max FPS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class FrameClock:
+    """Coalesces panel refreshes into one frame per tick.
+
+    Panels poll on their own timers (clock every second, graph every 2 s,
+    collectors every 1-10 s), and each refresh used to become its own
+    repaint.  Paced widgets hand refresh() to request() instead, and at
+    most max_fps times a second flush() replays everything pending inside
+    one batch_update(), so the terminal gets a single frame however many
+    panels changed.  The app also flushes after each key action so input
+    never waits for a tick.
+    """
+
+    DEFAULT_FPS = 10
+    LOW_BANDWIDTH_FPS = 1
+
+    def __init__(self, app, max_fps=DEFAULT_FPS):
+        self.app = app
+        self.max_fps = max_fps      # 0 disables pacing: refreshes go straight through
+        self._pending = {}          # widget -> layout needed
+        self._timer = None
+
+    @property
+    def active(self):
+        return self._timer is not None
+
+    def start(self):
+        if self.max_fps > 0:
+            self._timer = self.app.set_interval(1 / self.max_fps, self.flush)
+
+    def stop(self):
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        self.flush()
+
+    def request(self, widget, layout=False):
+        """Repaint `widget` (and re-layout if asked) with the next frame"""
+        self._pending[widget] = self._pending.get(widget, False) or layout
+
+    def flush(self):
+        """Apply every pending refresh as one batched repaint"""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        with self.app.batch_update():
+            for widget, layout in pending.items():
+                if widget.is_attached:
+                    widget.refresh_now(layout=layout)
+
+
+class Paced:
+    """Mixin for widgets whose refreshes wait for the app's FrameClock.
+
+    Partial (region) refreshes become a full repaint of the widget at the
+    next tick; recompose requests and widgets not yet mounted are never
+    deferred.
+    """
+
+    def refresh(self, *regions, repaint=True, layout=False, recompose=False):
+        clock = getattr(self.app, "frame_clock", None) if self.is_attached else None
+        if clock is None or not clock.active or recompose:
+            return super().refresh(*regions, repaint=repaint, layout=layout, recompose=recompose)
+        clock.request(self, layout)
+        return self
+
+    def refresh_now(self, layout=False):
+        return super().refresh(layout=layout)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PANELS - One widget per collector, plus the header, log and history views
+# ═══════════════════════════════════════════════════════════════════════════════
 
-class GPUProcessTable(DataTable):
+class GPUProcessTable(Paced, DataTable):
     """DataTable widget for displaying GPU processes"""
     
     def __init__(self, **kwargs):
@@ -156,8 +2461,12 @@ class GPUProcessTable(DataTable):
     def on_mount(self):
         # Add columns
         self.add_column("PID", width=8)
-        self.add_column("Process Name", width=30)
-        self.add_column("Memory", width=12)
+        self.add_column("User", width=10)
+        self.add_column("Container", width=14)
+        self.add_column("Process Name", width=24)
+        self.add_column("CPU%", width=6)
+        self.add_column("RSS", width=8)
+        self.add_column("GPU Mem", width=9)
     
     def update_processes(self, processes):
         """Update the table with new process data"""
@@ -165,153 +2474,305 @@ class GPUProcessTable(DataTable):
         self.clear()
         
         if not processes:
-            self.add_row("No processes", "running on GPU", "-")
+            self.add_row("No processes", "", "", "running on GPU", "", "", "-")
             return
             
         # Sort processes by memory usage (descending)
-        sorted_processes = sorted(processes, 
-                                key=lambda x: self._extract_memory_mb(x.get('Memory', '0 MB')), 
-                                reverse=True)
+        sorted_processes = sorted(processes, key=lambda p: p.memory or 0, reverse=True)
         
         for proc in sorted_processes:
-            pid = proc.get('PID', 'N/A')
-            name = proc.get('Name', 'Unknown Process')
-            memory = proc.get('Memory', 'N/A MB')
+            name = proc.name
+            memory = f"{proc.memory} MB" if proc.memory is not None else "N/A MB"
             
-            # Truncate long process names (increased width since we removed Type column)
-            if len(name) > 27:
-                name = name[:24] + "..."
+            # Truncate long names to their column widths
+            if len(name) > 24:
+                name = name[:21] + "..."
+            container = proc.container or "-"
+            if len(container) > 14:
+                container = container[:13] + "…"
                 
-            self.add_row(pid, name, memory)
-    
-    def _extract_memory_mb(self, memory_str):
-        """Extract memory value in MB for sorting purposes"""
-        try:
-            match = re.search(r'(\d+)', memory_str)
-            if match:
-                return int(match.group(1))
-            return 0
-        except (ValueError, AttributeError):
-            return 0
+            self.add_row(
+                str(proc.pid),
+                (proc.user or "-")[:10],
+                container,
+                name,
+                f"{proc.cpu:.0f}" if proc.cpu is not None else "-",
+                format_size_mb(proc.rss) if proc.rss is not None else "-",
+                memory,
+            )
 
-class GPUStats(Static):
+class GPUStats(Collector, Paced, Static):
     gpu_id = reactive(0)
-    gpu_data = reactive({})
-    running_processes = reactive([])
+    gpus = reactive(())          # Tuple[GPUSample, ...] for every device
+    error = reactive(None)
+    running_processes = reactive(())
+
+    GPU_QUERY_BASIC = "index,name,temperature.gpu,memory.used,memory.total,utilization.gpu,power.draw,power.limit"
+    # Everything else per tick rides on the same call (older drivers reject these fields)
+    GPU_QUERY = (GPU_QUERY_BASIC + ",clocks.sm,clocks.max.sm,clocks.mem,pcie.link.gen.current,pcie.link.width.current,"
+                 "clocks_throttle_reasons.active,ecc.errors.corrected.volatile.total,ecc.errors.uncorrected.volatile.total")
+    GPU_SECTION_RE = re.compile(r'GPU [0-9A-Fa-f]+:[0-9A-Fa-f]+:[0-9A-Fa-f]+\.[0-9A-Fa-f]+$')   # nvidia-smi -q
+    PCIE_THROUGHPUT_RE = re.compile(r'([RT]x) Throughput\s*:\s*(\d+)\s*KB/s')                # nvidia-smi -q
+    # nvmlClocksThrottleReasons bit -> (label, panel line it is shown on)
+    THROTTLE_REASONS = {
+        0x1: ("idle", None), 0x2: ("app clocks", "clocks"), 0x4: ("power cap", "power"),
+        0x8: ("HW slowdown", "clocks"), 0x10: ("sync boost", "clocks"), 0x20: ("SW thermal", "temperature"),
+        0x40: ("HW thermal", "temperature"), 0x80: ("power brake", "power"), 0x100: ("display clocks", "clocks"),
+    }
+    HISTORY_LENGTH = 600     # samples kept per GPU metric (10 minutes at 1 Hz)
+    # metric -> (short name, value format) for the rolling summary lines
+    SUMMARY_FORMATS = {"utilization": ("Util", "{:.0f}%"), "memory": ("Mem", "{:.0f} MB"),
+                       "temperature": ("Temp", "{:.0f}°C"), "power": ("Pwr", "{:.0f} W")}
+
+    def __init__(self, config=None, **kwargs):
+        super().__init__(**kwargs)
+        self.config = config or Config()["gpu"]
+        self.history = GPUHistory(self.HISTORY_LENGTH, self.config.interval)
+        self.inspector = ProcessInspector()     # only used from the process-scan worker
+        self.query = self.GPU_QUERY
+        self.pcie = {}              # GPU index -> (rx, tx) KB/s from the last process scan
+        self.gpu_memory = {}        # pid -> MB on all GPUs, from the last process scan
+        self.process_error = None   # last process scan failure, logged once until it recovers
+        self.collected = False      # True once a live reading has arrived
+        self.cached_at = None       # timestamp of warm-start data still on screen
 
     def on_mount(self):
         self.update_gpu_data()
-        self.set_interval(5, self.update_gpu_data)
+        self.apply_config(self.config)
+
+    def schedule(self, config):
+        # --query-gpu samples feed the history; nvidia-smi -q process scans are slower
+        return ((config.interval, self.sample_gpus), (config.process_interval, self.update_gpu_processes))
+
+    def apply_config(self, config):
+        if config.interval != self.history.interval:
+            self.history.set_interval(config.interval)
+        super().apply_config(config)
+        self.parent.display = config.enabled    # the process table goes with the GPU panel
+        if self.app.gpu_overview is not None:
+            self.app.gpu_overview.apply_config(config)
+
+    @property
+    def gpu_sample(self):
+        """Sample for the selected GPU, or None if nothing has been read"""
+        for gpu in self.gpus:
+            if gpu.index == self.gpu_id:
+                return gpu
+        return None
+
+    @staticmethod
+    def parse_gpu_query(output):
+        """Parse --query-gpu CSV output into one GPUSample per device"""
+        gpus = []
+        for line in output.strip().split('\n'):
+            parts = [part.strip() for part in line.split(',')]
+            if len(parts) < 8:
+                raise ValueError("Invalid nvidia-smi output format")
+            index, name = parts[:2]
+            values = [parse_number(part) for part in parts[2:13]]
+            if len(parts) > 13:
+                values.append(GPUStats.parse_bitmask(parts[13]))
+                values.extend(parse_number(part) for part in parts[14:16])
+            gpus.append(GPUSample(int(index), name, *values))
+        return tuple(gpus)
+
+    @staticmethod
+    def parse_bitmask(value):
+        """Parse a hex bitmask such as "0x0000000000000004", or None for N/A markers"""
+        try:
+            return int(value, 16)
+        except ValueError:
+            return None
+
+    @classmethod
+    def throttle_reasons(cls, gpu, line=None):
+        """Labels of the active throttle reasons (all but idle, or those shown on `line`)"""
+        if not gpu.throttle:
+            return []
+        return [label for bit, (label, shown_on) in cls.THROTTLE_REASONS.items()
+                if gpu.throttle & bit and shown_on is not None and line in (None, shown_on)]
 
     def update_gpu_data(self):
+        """Take a full reading: device samples plus the process list"""
+        self.sample_gpus()
+        self.update_gpu_processes()
+
+    def sample_gpus(self):
+        """Read every GPU with one --query-gpu call on a worker thread"""
+        self.run_worker(self._sample_gpus_worker, thread=True, exclusive=True, group="gpu-sample")
+
+    def _sample_gpus_worker(self):
         try:
-            # Get GPU info using nvidia-smi
-            cmd = ["nvidia-smi", "--query-gpu=index,name,temperature.gpu,memory.used,memory.total,utilization.gpu", "--format=csv,noheader,nounits"]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-            
+            cmd = ["nvidia-smi", f"--query-gpu={self.query}", "--format=csv,noheader,nounits"]
+            result = process_runner.run("nvidia-smi", cmd, timeout=10)
+            if result.returncode != 0 and "valid field" in result.stdout + result.stderr and self.query != self.GPU_QUERY_BASIC:
+                # Driver too old for the extended fields: drop them for good
+                self.query = self.GPU_QUERY_BASIC
+                cmd = ["nvidia-smi", f"--query-gpu={self.query}", "--format=csv,noheader,nounits"]
+                result = process_runner.run("nvidia-smi", cmd, timeout=10)
+
             if result.returncode == 0 and result.stdout:
-                lines = result.stdout.strip().split('\n')
-                if self.gpu_id < len(lines):
-                    parts = [part.strip() for part in lines[self.gpu_id].split(',')]
-                    if len(parts) >= 6:
-                        gpu_index, gpu_name, temp, mem_used, mem_total, util = parts
-                        self.gpu_data = {
-                            "GPU ID": gpu_index,
-                            "Model": gpu_name,
-                            "Temperature": f"{temp} °C",
-                            "Memory Usage": f"{mem_used} MB / {mem_total} MB",
-                            "Utilization": f"{util} %",
-                        }
-                    else:
-                        raise ValueError("Invalid nvidia-smi output format")
-                else:
-                    # GPU ID not found, use first available GPU
-                    self.gpu_id = 0
-                    if lines:
-                        parts = [part.strip() for part in lines[0].split(',')]
-                        if len(parts) >= 6:
-                            gpu_index, gpu_name, temp, mem_used, mem_total, util = parts
-                            self.gpu_data = {
-                                "GPU ID": gpu_index,
-                                "Model": gpu_name,
-                                "Temperature": f"{temp} °C",
-                                "Memory Usage": f"{mem_used} MB / {mem_total} MB",
-                                "Utilization": f"{util} %",
-                            }
+                gpus, error = self.parse_gpu_query(result.stdout), None
             else:
                 raise subprocess.CalledProcessError(result.returncode, cmd)
-                
+        except SourceBusy:
+            return  # a slow nvidia-smi is still answering; keep the last reading
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, ValueError, OSError, SourceUnavailable) as e:
+            # Fallback if nvidia-smi is not available or fails
+            gpus, error = (), str(e)
+        self.app.call_from_thread(self.apply_gpus, gpus, error)
+
+    def apply_gpus(self, gpus, error):
+        """Store a GPU reading (UI thread): history, metrics and events"""
+        if error is None:
+            if self.error:
+                self.app.record_event("GPU query recovered")
+            elif len(gpus) != len(self.gpus) and self.gpus and self.cached_at is None:
+                self.app.record_event(f"GPU count changed from {len(self.gpus)} to {len(gpus)}", "warning")
+            gpus = self.with_pcie(gpus)
+            metrics = {}
+            for gpu in gpus:
+                self.history.add(gpu)
+                metrics[f"gpu.{gpu.index}.utilization"] = gpu.utilization
+                metrics[f"gpu.{gpu.index}.memory"] = gpu.memory_used
+                metrics[f"gpu.{gpu.index}.temperature"] = gpu.temperature
+                metrics[f"gpu.{gpu.index}.power"] = gpu.power_draw
+                metrics[f"gpu.{gpu.index}.sm_clock"] = gpu.sm_clock
+                metrics[f"gpu.{gpu.index}.throttle"] = gpu.throttle
+                metrics[f"gpu.{gpu.index}.ecc_uncorrected"] = gpu.ecc_uncorrected
+            self.app.publish_metrics(metrics, source="gpu")
+        elif error_kind(error) != error_kind(self.error):
+            self.app.record_event(f"GPU query failed: {error}", "error")
+        self.gpus = gpus
+        self.error = error
+        self.cached_at = None
+        self.collected = True
+        if gpus and self.gpu_sample is None:
+            # GPU ID not found, use first available GPU
+            self.gpu_id = gpus[0].index
+        self.refresh()
+
+    def with_pcie(self, gpus):
+        """Stamp the last scan's PCIe throughput onto device samples"""
+        return tuple(gpu._replace(pcie_rx=self.pcie[gpu.index][0], pcie_tx=self.pcie[gpu.index][1])
+                     if gpu.index in self.pcie else gpu for gpu in gpus)
+
+    def update_gpu_processes(self):
+        """Scan nvidia-smi -q for the selected GPU's processes on a worker thread"""
+        if self.error:
+            # nvidia-smi is failing; don't spawn a second call this tick
+            self.running_processes = ()
+            self._update_process_table()
+            return
+        gpu_id = self.gpu_id
+        self.run_worker(lambda: self._gpu_processes_worker(gpu_id), thread=True, exclusive=True, group="gpu-processes")
+
+    def _gpu_processes_worker(self, gpu_id):
+        error = None
+        processes = []
+        found = []          # (GPU index, GPUProcess) for every device
+        gpu_memory = {}     # pid -> MB summed over all GPUs
+        pcie = {}
+        try:
             # Get running processes on GPU using nvidia-smi -q
             proc_cmd = ["nvidia-smi", "-q"]
-            proc_result = subprocess.run(proc_cmd, capture_output=True, text=True, timeout=10)
+            proc_result = process_runner.run("nvidia-smi", proc_cmd, timeout=10)
             
-            self.running_processes = []
             if proc_result.returncode == 0 and proc_result.stdout.strip():
                 lines = proc_result.stdout.strip().split('\n')
-                current_gpu = None
+                current_gpu = -1
                 in_processes_section = False
-                current_process = {}
+                current_process = None
                 
                 for line in lines:
                     line = line.strip()
                     
-                    # Track which GPU we're looking at
-                    if line.startswith("GPU "):
-                        gpu_match = re.search(r'GPU (\d+)', line)
-                        if gpu_match:
-                            current_gpu = int(gpu_match.group(1))
-                            in_processes_section = False
-                    
-                    # Only process data for the current GPU
-                    if current_gpu == self.gpu_id:
-                        if line == "Processes":
-                            in_processes_section = True
-                            continue
-                        
-                        if in_processes_section:
-                            if line.startswith("Process ID"):
-                                pid_match = re.search(r'Process ID\s*:\s*(\d+)', line)
-                                if pid_match:
-                                    if current_process:  # Save previous process if exists
-                                        self.running_processes.append(current_process)
-                                    current_process = {"PID": pid_match.group(1)}
-                            
-                            elif line.startswith("Name") and "PID" in current_process:
-                                name_match = re.search(r'Name\s*:\s*(.+)', line)
-                                if name_match:
-                                    current_process["Name"] = name_match.group(1).strip()
-                            
-                            elif line.startswith("Used GPU Memory") and "PID" in current_process:
-                                mem_match = re.search(r'Used GPU Memory\s*:\s*(\d+)\s*MiB', line)
-                                if mem_match:
-                                    current_process["Memory"] = f"{mem_match.group(1)} MB"
+                    # Track which GPU we're looking at. Sections are headed by the PCI
+                    # bus ID ("GPU 00000000:01:00.0") in index order, so count them
+                    if self.GPU_SECTION_RE.match(line):
+                        if current_process:
+                            found.append((current_gpu, current_process))
+                            current_process = None
+                        current_gpu += 1
+                        in_processes_section = False
+
+                    # PCIe throughput is in every section; --query-gpu has no field for it
+                    if line.startswith(("Rx Throughput", "Tx Throughput")):
+                        match = self.PCIE_THROUGHPUT_RE.match(line)
+                        if match:
+                            rx, tx = pcie.get(current_gpu, (None, None))
+                            value = float(match.group(2))
+                            pcie[current_gpu] = (value, tx) if match.group(1) == "Rx" else (rx, value)
+                        continue
+
+                    # Processes of every GPU: the selected one fills the table, all of
+                    # them give the per-PID GPU memory the container drilldown shows
+                    if line == "Processes":
+                        in_processes_section = True
+                        continue
+
+                    if in_processes_section:
+                        if line.startswith("Process ID"):
+                            pid_match = re.search(r'Process ID\s*:\s*(\d+)', line)
+                            if pid_match:
+                                if current_process:  # Save previous process if exists
+                                    found.append((current_gpu, current_process))
+                                current_process = GPUProcess(int(pid_match.group(1)))
+
+                        elif line.startswith("Name") and current_process:
+                            name_match = re.search(r'Name\s*:\s*(.+)', line)
+                            if name_match:
+                                current_process = current_process._replace(name=name_match.group(1).strip())
+
+                        elif line.startswith("Used GPU Memory") and current_process:
+                            mem_match = re.search(r'Used GPU Memory\s*:\s*(\d+)\s*MiB', line)
+                            if mem_match:
+                                current_process = current_process._replace(memory=int(mem_match.group(1)))
                 
                 # Don't forget the last process
-                if current_process and "PID" in current_process:
-                    self.running_processes.append(current_process)
-                
-                # Ensure all processes have required fields
-                for proc in self.running_processes:
-                    if "Name" not in proc:
-                        proc["Name"] = "Unknown Process"
-                    if "Memory" not in proc:
-                        proc["Memory"] = "N/A MB"
+                if current_process:
+                    found.append((current_gpu, current_process))
+
+                for gpu, process in found:
+                    if gpu == gpu_id:
+                        processes.append(process)
+                    if process.memory is not None:
+                        gpu_memory[process.pid] = gpu_memory.get(process.pid, 0) + process.memory
+                processes = self.inspector.inspect(processes)
                         
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, ValueError, FileNotFoundError) as e:
-            # Fallback if nvidia-smi is not available or fails
-            self.gpu_data = {
-                "GPU ID": self.gpu_id,
-                "Model": "No GPU detected or nvidia-smi not available",
-                "Temperature": "N/A",
-                "Memory Usage": "N/A",
-                "Utilization": "N/A",
-                "Error": str(e)
-            }
-            self.running_processes = []
+        except SourceBusy:
+            return  # keep the last scan until nvidia-smi catches up
+        except (subprocess.TimeoutExpired, OSError, SourceUnavailable) as e:
+            # Keep the device samples; only the process list is unavailable
+            processes, error = [], str(e)
+        self.app.call_from_thread(self.apply_gpu_processes, gpu_id, tuple(processes), error, pcie, gpu_memory)
+
+    def apply_gpu_processes(self, gpu_id, processes, error, pcie=None, gpu_memory=None):
+        """Store a process scan (UI thread) unless the user has since switched GPU"""
+        if error_kind(error) != error_kind(self.process_error):
+            if error:
+                self.app.record_event(f"GPU process scan failed: {error}", "error")
+            else:
+                self.app.record_event("GPU process scan recovered")
+            self.process_error = error
+        self.gpu_memory = gpu_memory or {}
+        self.pcie = pcie or {}
+        if self.gpus:
+            self.gpus = self.with_pcie(self.gpus)
+            self.app.publish_metrics({f"gpu.{index}.pcie_{direction}": value
+                                      for index, rates in self.pcie.items()
+                                      for direction, value in zip(("rx", "tx"), rates)}, source="gpu-pcie")
+        if gpu_id != self.gpu_id:
+            return
+        docker = self.app.docker_stats
+        containers = docker.container_names if docker is not None else {}    # Docker collector disabled
+        self.running_processes = tuple(
+            process._replace(container=containers.get(process.container_id, process.container_id[:12]))
+            if process.container_id else process
+            for process in processes)
         
         # Update the process table if it exists
         self._update_process_table()
-        self.refresh()
     
     def _update_process_table(self):
         """Update the GPU process table through the app"""
@@ -324,70 +2785,6 @@ class GPUStats(Static):
             # If we can't update the table, that's okay
             pass
 
-    def _extract_memory_mb(self, memory_str):
-        """Extract memory value in MB for sorting purposes"""
-        try:
-            # Extract number from strings like "123 MB", "N/A MB", etc.
-            match = re.search(r'(\d+)', memory_str)
-            if match:
-                return int(match.group(1))
-            return 0
-        except (ValueError, AttributeError):
-            return 0
-
-    def create_progress_bar(self, value, max_value, width=30, label="", bar_type="generic"):
-        """Create a text-based progress bar with color support"""
-        if value == "N/A" or max_value == "N/A":
-            return f"{label}: N/A"
-        
-        try:
-            percentage = min(float(value) / float(max_value), 1.0)
-            filled = int(percentage * width)
-            
-            # Choose colors based on bar type and percentage
-            if bar_type == "temperature":
-                if percentage >= 0.89:  # 80°C+ for 90°C max
-                    fill_color = Colors.TEMP_CRITICAL
-                    status_icon = Symbols.STATUS_HIGH
-                elif percentage >= 0.67:  # 60°C+ for 90°C max
-                    fill_color = Colors.TEMP_WARNING
-                    status_icon = Symbols.STATUS_MEDIUM
-                else:
-                    fill_color = Colors.TEMP_NORMAL
-                    status_icon = Symbols.STATUS_LOW
-            elif bar_type == "memory":
-                if percentage >= 0.9:
-                    fill_color = Colors.MEM_CRITICAL
-                    status_icon = Symbols.STATUS_HIGH
-                elif percentage >= 0.7:
-                    fill_color = Colors.MEM_HIGH
-                    status_icon = Symbols.STATUS_HIGH
-                elif percentage >= 0.5:
-                    fill_color = Colors.MEM_MEDIUM
-                    status_icon = Symbols.STATUS_MEDIUM
-                else:
-                    fill_color = Colors.MEM_LOW
-                    status_icon = Symbols.STATUS_LOW
-            else:  # Generic progress bar
-                if percentage >= 0.8:
-                    fill_color = Colors.PROGRESS_HIGH
-                    status_icon = Symbols.STATUS_HIGH
-                elif percentage >= 0.6:
-                    fill_color = Colors.PROGRESS_MEDIUM
-                    status_icon = Symbols.STATUS_MEDIUM
-                else:
-                    fill_color = Colors.PROGRESS_LOW
-                    status_icon = Symbols.STATUS_LOW
-            
-            # Create colored progress bar using Textual rich markup
-            filled_bar = f"[{fill_color}]{Symbols.PROGRESS_FILLED * filled}[/{fill_color}]"
-            empty_bar = f"[{Colors.PROGRESS_BACKGROUND}]{Symbols.PROGRESS_EMPTY * (width - filled)}[/{Colors.PROGRESS_BACKGROUND}]"
-            bar = filled_bar + empty_bar
-            
-            return f"{label}: {bar} {status_icon} {percentage*100:.1f}%"
-        except (ValueError, ZeroDivisionError):
-            return f"{label}: N/A"
-
     def render(self):
         lines = [f"GPU Stats (GPU {self.gpu_id}):"]
         
@@ -397,60 +2794,106 @@ class GPUStats(Static):
         available_width = max(widget_width - 35, 15)  # Reserve space for labels and values, minimum 15
         bar_width = min(available_width, 30)  # Cap at reasonable maximum
         
+        if not self.collected and self.cached_at is None:
+            lines.append(f"{Symbols.PENDING_ICON} Collecting GPU data...")
+            return panel_text(lines)
+        if self.cached_at is not None:
+            lines.append(cached_note(self.cached_at))
+
+        gpu = self.gpu_sample
+        if gpu is None:
+            gpu = GPUSample(self.gpu_id, "No GPU detected or nvidia-smi not available")
+
         # Display GPU ID and Model first
-        if "GPU ID" in self.gpu_data:
-            lines.append(f"GPU ID: {self.gpu_data['GPU ID']}")
-        if "Model" in self.gpu_data:
-            lines.append(f"Model: {self.gpu_data['Model']}")
+        lines.append(f"GPU ID: {gpu.index}")
+        lines.append(f"Model: {gpu.name}")
         
         # Temperature with graphical representation
-        if "Temperature" in self.gpu_data and self.gpu_data["Temperature"] != "N/A":
-            temp_str = self.gpu_data["Temperature"].replace(" °C", "")
-            try:
-                temp_val = float(temp_str)
-                temp_bar = self.create_progress_bar(temp_val, 90, bar_width, "Temperature".ljust(11), "temperature")  # Max temp 90°C
-                lines.append(f"{temp_bar} ({temp_val}°C)")
-            except ValueError:
-                lines.append(f"Temperature: {self.gpu_data['Temperature']}")
+        if gpu.temperature is not None:
+            temp_bar = create_progress_bar(gpu.temperature, 90, bar_width, "Temperature".ljust(11), "temperature")  # Max temp 90°C
+            lines.append(temp_bar + f" ({gpu.temperature}°C)" + self.throttle_note(gpu, "temperature"))
         else:
-            lines.append(f"Temperature: {self.gpu_data.get('Temperature', 'N/A')}")
+            lines.append("Temperature: N/A")
         
         # Memory usage with graphical representation  
-        if "Memory Usage" in self.gpu_data and " / " in str(self.gpu_data["Memory Usage"]):
-            memory_str = self.gpu_data["Memory Usage"]
-            try:
-                used_str, total_str = memory_str.split(" / ")
-                used_val = float(used_str.replace(" MB", ""))
-                total_val = float(total_str.replace(" MB", ""))
-                memory_bar = self.create_progress_bar(used_val, total_val, bar_width, "Memory".ljust(11), "memory")
-                lines.append(f"{memory_bar} ({used_val:.0f}/{total_val:.0f} MB)")
-            except (ValueError, AttributeError):
-                lines.append(f"Memory Usage: {self.gpu_data['Memory Usage']}")
+        if gpu.memory_used is not None and gpu.memory_total is not None:
+            memory_bar = create_progress_bar(gpu.memory_used, gpu.memory_total, bar_width, "Memory".ljust(11), "memory")
+            lines.append(memory_bar + f" ({gpu.memory_used:.0f}/{gpu.memory_total:.0f} MB)")
         else:
-            lines.append(f"Memory Usage: {self.gpu_data.get('Memory Usage', 'N/A')}")
+            lines.append("Memory Usage: N/A")
         
         # Utilization with graphical representation
-        if "Utilization" in self.gpu_data and self.gpu_data["Utilization"] != "N/A":
-            util_str = self.gpu_data["Utilization"].replace(" %", "")
-            try:
-                util_val = float(util_str)
-                util_bar = self.create_progress_bar(util_val, 100, bar_width, "Utilization".ljust(11), "generic")
-                lines.append(f"{util_bar} ({util_val}%)")
-            except ValueError:
-                lines.append(f"Utilization: {self.gpu_data['Utilization']}")
+        if gpu.utilization is not None:
+            util_bar = create_progress_bar(gpu.utilization, 100, bar_width, "Utilization".ljust(11), "generic")
+            lines.append(util_bar + f" ({gpu.utilization}%)")
         else:
-            lines.append(f"Utilization: {self.gpu_data.get('Utilization', 'N/A')}")
+            lines.append("Utilization: N/A")
+        
+        # Power draw (bar against the board power limit when the GPU reports one)
+        if gpu.power_draw is not None and gpu.power_limit is not None:
+            power_bar = create_progress_bar(gpu.power_draw, gpu.power_limit, bar_width, "Power".ljust(11), "generic")
+            lines.append(power_bar + f" ({gpu.power_draw:.0f}/{gpu.power_limit:.0f} W)" + self.throttle_note(gpu, "power"))
+        elif gpu.power_draw is not None:
+            lines.append(f"Power      : {gpu.power_draw:.0f} W" + self.throttle_note(gpu, "power"))
+
+        # Clocks, throttling, PCIe link and ECC (drivers without the extended fields leave these out)
+        if gpu.sm_clock is not None:
+            sm_max = "" if gpu.sm_clock_max is None else f"/{gpu.sm_clock_max:.0f}"
+            memory_clock = "" if gpu.memory_clock is None else f"  Mem {gpu.memory_clock:.0f} MHz"
+            lines.append(f"{'Clocks'.ljust(11)}: SM {gpu.sm_clock:.0f}{sm_max} MHz{memory_clock}" + self.throttle_note(gpu, "clocks"))
+        if gpu.throttle is not None:
+            reasons = self.throttle_reasons(gpu)
+            if reasons:
+                state = f"{Symbols.THROTTLE_ICON} {', '.join(reasons)}"
+            else:
+                state = "idle" if gpu.throttle & 0x1 else "none"
+            lines.append(f"{'Throttle'.ljust(11)}: {state}")
+        if gpu.pcie_gen is not None or gpu.pcie_rx is not None:
+            link = "" if gpu.pcie_gen is None else f"Gen{gpu.pcie_gen:.0f} x{gpu.pcie_width or 0:.0f}  "
+            rx = None if gpu.pcie_rx is None else gpu.pcie_rx * 1024
+            tx = None if gpu.pcie_tx is None else gpu.pcie_tx * 1024
+            lines.append(f"{'PCIe'.ljust(11)}: {link}RX {format_rate(rx)}  TX {format_rate(tx)}")
+        if gpu.ecc_corrected is not None or gpu.ecc_uncorrected is not None:
+            corrected = "N/A" if gpu.ecc_corrected is None else f"{gpu.ecc_corrected:.0f}"
+            uncorrected = "N/A" if gpu.ecc_uncorrected is None else f"{gpu.ecc_uncorrected:.0f}"
+            icon = f"{Symbols.ERROR_ICON} " if gpu.ecc_uncorrected else ""
+            lines.append(f"{'ECC errors'.ljust(11)}: {icon}{corrected} corrected, {uncorrected} uncorrected")
+
+        # Recent history for the selected GPU (sparklines share the bar column)
+        if len(self.history.series(gpu.index, "utilization")) > 1:
+            spark_width = bar_width + 10
+            lines.append("")
+            lines.append(f"{'Util'.ljust(11)}: {sparkline(self.history.series(gpu.index, 'utilization').last(spark_width), spark_width, 100)}")
+            lines.append(f"{'Memory'.ljust(11)}: {sparkline(self.history.series(gpu.index, 'memory').last(spark_width), spark_width, gpu.memory_total)}")
+            lines.append(f"{'Temperature'.ljust(11)}: {sparkline(self.history.series(gpu.index, 'temperature').last(spark_width), spark_width, 90)}")
+            lines.append(f"{'Power'.ljust(11)}: {sparkline(self.history.series(gpu.index, 'power').last(spark_width), spark_width, gpu.power_limit)}")
+            lines.append(self.summary_line(gpu.index, "5m p95", "5m", lambda summary: summary.quantile(0.95)))
+            lines.append(self.summary_line(gpu.index, "1h peak", "1h", lambda summary: summary.max))
         
         # Display any errors
-        if "Error" in self.gpu_data:
-            lines.append(f"Error: {self.gpu_data['Error']}")
+        if self.error:
+            lines.append(f"Error: {self.error}")
         
-        return "\n".join(lines)
+        return panel_text(lines)
+
+    def throttle_note(self, gpu, line):
+        """Suffix naming the throttle reasons that belong next to one bar, or "" """
+        reasons = self.throttle_reasons(gpu, line)
+        return f"  {Symbols.THROTTLE_ICON} {', '.join(reasons)}" if reasons else ""
+
+    def summary_line(self, index, label, window, reduce):
+        """One line of rolling summaries (e.g. p95 or peak) for every GPU metric"""
+        parts = []
+        for metric, (name, template) in self.SUMMARY_FORMATS.items():
+            summary = self.history.summary(index, metric, window)
+            value = reduce(summary) if summary else None
+            parts.append(f"{name} {'N/A' if value is None else template.format(value)}")
+        return f"{label.ljust(11)}: {'  '.join(parts)}"
 
     def get_gpu_count(self):
         try:
             cmd = ["nvidia-smi", "--query-gpu=count", "--format=csv,noheader,nounits"]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+            result = process_runner.run("nvidia-smi", cmd, timeout=5)
             if result.returncode == 0 and result.stdout.strip():
                 # nvidia-smi returns the count for each GPU, so count lines
                 return len(result.stdout.strip().split('\n'))
@@ -459,637 +2902,1501 @@ class GPUStats(Static):
         return 1  # Default to 1 GPU
 
     def next_gpu(self):
-        gpu_count = self.get_gpu_count()
+        gpu_count = len(self.gpus) or self.get_gpu_count()
         self.gpu_id = (self.gpu_id + 1) % gpu_count
         self.update_gpu_data()
 
     def previous_gpu(self):
-        gpu_count = self.get_gpu_count()
+        gpu_count = len(self.gpus) or self.get_gpu_count()
         self.gpu_id = (self.gpu_id - 1) % gpu_count
         self.update_gpu_data()
 
-class NetworkStats(Static):
+class GPUOverview(Paced, Static):
+    """All-GPU overview: one row of sparklines per device"""
+
+    def __init__(self, gpu_stats_widget, **kwargs):
+        super().__init__(**kwargs)
+        self.gpu_stats = gpu_stats_widget
+        self._timer = None
+
+    def on_mount(self):
+        self.apply_config(self.gpu_stats.config)
+
+    def apply_config(self, config):
+        """Refresh at the GPU collector's interval; GPUStats calls this again on reload"""
+        if self._timer is not None:
+            self._timer.stop()
+        self._timer = self.set_interval(config.interval, self.update_overview) if config.enabled else None
+
+    def update_overview(self):
+        """Refresh only while the overview is visible"""
+        if self.display:
+            self.refresh()
+
+    def render(self):
+        gpus = self.gpu_stats.gpus
+        if not gpus:
+            return Text(f"{Symbols.NO_DATA_ICON} No GPU data")
+
+        # Four sparkline columns share what is left after the fixed-width labels
+        widget_width = getattr(self.size, 'width', 80)
+        spark_width = max((widget_width - 10 - 4 * 14) // 4, 5)
+        history = self.gpu_stats.history
+        lines = []
+        for gpu in gpus:
+            marker = "▶" if gpu.index == self.gpu_stats.gpu_id else " "
+            util = "N/A" if gpu.utilization is None else f"{gpu.utilization:.0f}%"
+            mem = "N/A" if gpu.memory_used is None or not gpu.memory_total else f"{gpu.memory_used / gpu.memory_total * 100:.0f}%"
+            temp = "N/A" if gpu.temperature is None else f"{gpu.temperature:.0f}°C"
+            power = "N/A" if gpu.power_draw is None else f"{gpu.power_draw:.0f}W"
+            throttled = f" {Symbols.THROTTLE_ICON}" if self.gpu_stats.throttle_reasons(gpu) else ""
+            lines.append(
+                f"{marker}GPU {gpu.index:<2} "
+                f"Util {sparkline(history.series(gpu.index, 'utilization').last(spark_width), spark_width, 100)} {util:>4}  "
+                f"Mem {sparkline(history.series(gpu.index, 'memory').last(spark_width), spark_width, gpu.memory_total)} {mem:>4}  "
+                f"Temp {sparkline(history.series(gpu.index, 'temperature').last(spark_width), spark_width, 90)} {temp:>5}  "
+                f"Pwr {sparkline(history.series(gpu.index, 'power').last(spark_width), spark_width, gpu.power_limit)} {power:>5}{throttled}"
+            )
+        return panel_text(lines)
+
+class CPUStats(Collector, Paced, Static):
+    """Host CPU and memory: usage bars, a utilization sparkline and a per-core heatmap"""
+    cpu = reactive(None)         # CPUSample, None until two /proc/stat reads exist
+    memory = reactive(None)      # MemorySample
+    error = reactive(None)
+
+    HISTORY_LENGTH = 600     # total-utilization samples kept for the sparkline
+
+    def __init__(self, config=None, **kwargs):
+        super().__init__(**kwargs)
+        self.config = config or Config()["cpu"]
+        self.sampler = HostSampler()
+        self.history = RingBuffer(self.HISTORY_LENGTH)
+        self.collected = False
+
+    def on_mount(self):
+        self.update_host_data()     # primes the /proc/stat deltas
+        self.apply_config(self.config)
+
+    def schedule(self, config):
+        return ((config.interval, self.update_host_data),)
+
+    def on_unmount(self):
+        self.sampler.close()
+
+    def watch_cpu(self, old, new):
+        # The panel grows when the heatmap appears; only then (or if the core count changes) re-layout
+        if old is None or new is None or len(old.cores) != len(new.cores):
+            self.refresh(layout=True)
+
+    def update_host_data(self):
+        """Sample /proc on the UI thread: two reads of already-open files, well under a millisecond"""
+        try:
+            cpu, memory, error = self.sampler.sample_cpu(), self.sampler.sample_memory(), None
+        except (OSError, ValueError) as e:
+            cpu, memory, error = None, None, str(e)
+        if error is None:
+            if self.error:
+                self.app.record_event("Host CPU/memory readings recovered")
+        elif error_kind(error) != error_kind(self.error):
+            self.app.record_event(f"Reading /proc for CPU/memory failed: {error}", "error")
+        self.error = error
+        if memory is not None:
+            self.memory = memory
+        if cpu is not None:
+            self.cpu = cpu
+            self.collected = True
+            self.history.append(cpu.total)
+            self.app.publish_metrics({
+                "cpu.utilization": cpu.total,
+                "cpu.iowait": cpu.iowait,
+                "memory.used": memory.total - memory.available,
+                "swap.used": memory.swap_total - memory.swap_free,
+            }, source="cpu")
+
+    @staticmethod
+    def core_color(percent):
+        if percent < 5:
+            return Colors.CORE_IDLE
+        return Thresholds.band("generic", percent / 100)[0]
+
+    def create_heatmap(self, cores, width):
+        """One cell per core as Text rows, wrapped to `width` with the first core number of each row.
+
+        Cells show load by block height and color; runs of the same color share
+        one span, so 256+ cores stay cheap to render.
+        """
+        label_width = len(str(len(cores) - 1))
+        columns = max(width - label_width - 1, 8)
+        spaced = len(cores) * 2 <= columns   # few cores: leave a gap between cells
+        per_row = columns // 2 if spaced else columns
+        levels = Symbols.SPARKLINE
+        rows = []
+        for first in range(0, len(cores), per_row):
+            row = Text(f"{str(first).rjust(label_width)} ")
+            color, cells = None, []
+            for percent in cores[first:first + per_row]:
+                cell_color = self.core_color(percent)
+                if cell_color != color and cells:
+                    row.append("".join(cells), color)
+                    cells = []
+                color = cell_color
+                cells.append(levels[min(int(percent / 100 * len(levels)), len(levels) - 1)])
+                if spaced:
+                    cells.append(" ")
+            if cells:
+                row.append("".join(cells), color)
+            rows.append(row)
+        return rows
+
+    def render(self):
+        lines = [f"CPU & Memory ({len(self.cpu.cores)} cores):" if self.cpu else "CPU & Memory:"]
+        if self.error:
+            lines.append(f"{Symbols.ERROR_ICON} Error: {self.error}")
+            return panel_text(lines)
+        if self.cpu is None or self.memory is None:
+            lines.append(f"{Symbols.PENDING_ICON} Collecting CPU data...")
+            return panel_text(lines)
+
+        widget_width = getattr(self.size, 'width', 80) or 80
+        bar_width = min(max(widget_width - 35, 15), 30)
+        cpu, memory = self.cpu, self.memory
+        lines.append(create_progress_bar(cpu.total, 100, bar_width, 'CPU'.ljust(11)) + f" (iowait {cpu.iowait:.1f}%)")
+        used = memory.total - memory.available
+        lines.append(create_progress_bar(used, memory.total, bar_width, 'Memory'.ljust(11), 'memory')
+                     + f" ({format_size_mb(used)}/{format_size_mb(memory.total)})")
+        if memory.swap_total:
+            swap_used = memory.swap_total - memory.swap_free
+            lines.append(create_progress_bar(swap_used, memory.swap_total, bar_width, 'Swap'.ljust(11), 'memory')
+                         + f" ({format_size_mb(swap_used)}/{format_size_mb(memory.swap_total)})")
+        if len(self.history) > 1:
+            spark_width = bar_width + 10
+            lines.append(f"{'History'.ljust(11)}: {sparkline(self.history.last(spark_width), spark_width, 100)}")
+        lines.append("")
+        lines.extend(self.create_heatmap(cpu.cores, widget_width))
+        return panel_text(lines)
+
+class DiskStats(Collector, Paced, Static):
+    """Disk I/O: per-device throughput, IOPS and utilization, and a read/write graph of all disks"""
+    disks = reactive(())         # Tuple[DiskSample, ...]
+    error = reactive(None)
+
+    HISTORY_LENGTH = 600     # samples kept per device metric
+    GRAPH_HEIGHT = 6
+
+    def __init__(self, config=None, **kwargs):
+        super().__init__(**kwargs)
+        self.config = config or Config()["disk"]
+        self.sampler = DiskSampler(names=self.config.names)
+        self.history = DiskHistory(self.HISTORY_LENGTH)
+        self.collected = False
+
+    def on_mount(self):
+        self.update_disk_data()     # primes the counters
+        self.apply_config(self.config)
+
+    def schedule(self, config):
+        return ((config.interval, self.update_disk_data),)
+
+    def watch_disks(self, old, new):
+        # Rows follow the device count; re-layout only when it changes
+        if len(old) != len(new):
+            self.refresh(layout=True)
+
+    def apply_config(self, config):
+        self.sampler.set_filter(config.names)
+        super().apply_config(config)
+
+    def on_unmount(self):
+        self.sampler.close()
+
+    def update_disk_data(self):
+        """Sample /proc/diskstats on the UI thread (one read of an open file)"""
+        try:
+            disks, error = self.sampler.sample(), None
+        except (OSError, ValueError, IndexError) as e:
+            disks, error = (), str(e)
+        if error is None:
+            if self.error:
+                self.app.record_event("Disk statistics recovered")
+        elif error_kind(error) != error_kind(self.error):
+            self.app.record_event(f"Reading /proc/diskstats failed: {error}", "error")
+        self.error = error
+        if disks is not None:
+            self.history.add(disks)
+            metrics = {}
+            for disk in disks:
+                metrics[f"disk.{disk.name}.read"] = disk.read_bytes
+                metrics[f"disk.{disk.name}.write"] = disk.write_bytes
+                metrics[f"disk.{disk.name}.iops"] = disk.reads + disk.writes
+                metrics[f"disk.{disk.name}.utilization"] = disk.utilization
+            self.app.publish_metrics(metrics, source="disk")
+            self.disks = disks
+            self.collected = True
+
+    def render(self):
+        lines = ["Disk I/O:"]
+        if self.error:
+            lines.append(f"{Symbols.ERROR_ICON} Error: {self.error}")
+            return panel_text(lines)
+        if not self.collected:
+            lines.append(f"{Symbols.PENDING_ICON} Collecting disk data...")
+            return panel_text(lines)
+        if not self.disks:
+            lines.append(f"{Symbols.NO_DATA_ICON} No block devices found")
+            return panel_text(lines)
+
+        name_width = max(len(disk.name) for disk in self.disks)
+        for disk in self.disks:
+            lines.append(f"{Symbols.DISK_ICON} {disk.name.ljust(name_width)}  "
+                         f"R {format_rate(disk.read_bytes).rjust(10)}  W {format_rate(disk.write_bytes).rjust(10)}  "
+                         f"{disk.reads + disk.writes:>6.0f} IOPS  {disk.utilization:>5.1f}% busy")
+
+        width = max(self.size.width - 2, 20)
+        box, maximum = io_graph(self.history.total_read.last(width), self.history.total_write.last(width),
+                                width, self.GRAPH_HEIGHT)
+        lines.extend(box)
+        lines.append(f"Max: {format_rate(maximum or 0)}")
+        lines.append(f"{Symbols.PROGRESS_FILLED} Read  {Symbols.PROGRESS_MEDIUM} Write  {Symbols.PROGRESS_EMPTY} Both")
+        return panel_text(lines)
+
+class NetworkStats(Collector, Paced, Static):
     interface = reactive("eth0")
-    all_interfaces_data = reactive({})
-    network_history = reactive([])  # Store historical data for graphing
+    interfaces = reactive(())       # Tuple[InterfaceSample, ...] (WiFi and Ethernet only)
+    total_rx = reactive(0)
+    total_tx = reactive(0)
+    error = reactive(None)
+    
+    def __init__(self, config=None, **kwargs):
+        super().__init__(**kwargs)
+        self.config = config or Config()["network"]
+        # Throughput history for graphing (bytes/s), raw plus rollups
+        self.rx_history = TieredHistory()
+        self.tx_history = TieredHistory()
+        # Rolling p95/peak throughput, updated per sample
+        self.rx_summary = RollingSummaries(self.config.interval)
+        self.tx_summary = RollingSummaries(self.config.interval)
+        self._last_totals = None    # NetworkSample of the previous poll
+        self.interface_names = []   # last `ip link` listing, active interfaces first
+        self.collected = False      # True once a live reading has arrived
+        self.cached_at = None       # timestamp of warm-start data still on screen
     
     def on_mount(self):
-        # Initialize network history for graphing (last 30 data points)
-        self.network_history = []
         self.update_all_interfaces_data()
-        self.set_interval(5, self.update_all_interfaces_data)
+        self.apply_config(self.config)
 
-    def get_interface_info(self, interface_name):
+    def schedule(self, config):
+        return ((config.interval, self.update_all_interfaces_data),)
+
+    def apply_config(self, config):
+        if config.interval != self.config.interval:
+            # Summary windows are sized in samples; start them over at the new rate
+            self.rx_summary = RollingSummaries(config.interval)
+            self.tx_summary = RollingSummaries(config.interval)
+        super().apply_config(config)
+        self.parent.display = config.enabled    # the activity graph goes with the interface panel
+
+    def get_interface_info(self, interface_name, rx_bytes=0, tx_bytes=0, rx_errors=0):
         """Get detailed information for a specific interface"""
+        # Determine interface type
+        if "wl" in interface_name or "wifi" in interface_name.lower():
+            kind = "WiFi"
+        elif "eth" in interface_name or "en" in interface_name:
+            kind = "Ethernet"
+        elif "lo" in interface_name:
+            kind = "Loopback"
+        else:
+            kind = "Unknown"
+
         try:
             # Get IP addresses
             ip_cmd = ["ip", "addr", "show", interface_name]
-            ip_result = subprocess.run(ip_cmd, capture_output=True, text=True, timeout=3)
+            ip_result = process_runner.run("ip", ip_cmd, timeout=3)
             
             # Get link status
             link_cmd = ["ip", "link", "show", interface_name]  
-            link_result = subprocess.run(link_cmd, capture_output=True, text=True, timeout=3)
-            
-            interface_info = {
-                "name": interface_name,
-                "type": "Unknown",
-                "status": "DOWN",
-                "ip_addresses": [],
-                "rx_bytes": 0,
-                "tx_bytes": 0,
-                "rx_errors": 0
-            }
-            
-            # Determine interface type
-            if "wl" in interface_name or "wifi" in interface_name.lower():
-                interface_info["type"] = "WiFi"
-            elif "eth" in interface_name or "en" in interface_name:
-                interface_info["type"] = "Ethernet"
-            elif "lo" in interface_name:
-                interface_info["type"] = "Loopback"
+            link_result = process_runner.run("ip", link_cmd, timeout=3)
             
             # Parse link status
+            status = "DOWN"
             if link_result.returncode == 0:
                 if "state UP" in link_result.stdout:
-                    interface_info["status"] = "UP"
+                    status = "UP"
                     
             # Parse IP addresses
+            addresses = []
             if ip_result.returncode == 0:
                 for line in ip_result.stdout.split('\n'):
                     if 'inet ' in line and 'scope global' in line:
                         match = re.search(r'inet (\d+\.\d+\.\d+\.\d+)/(\d+)', line)
                         if match:
-                            interface_info["ip_addresses"].append({
-                                "address": match.group(1),
-                                "cidr": match.group(2)
-                            })
-            
-            return interface_info
+                            addresses.append((match.group(1), match.group(2)))
             
+            return InterfaceSample(interface_name, kind, status, tuple(addresses),
+                                   rx_bytes, tx_bytes, rx_errors)
+
+        except SourceUnavailable:
+            # `ip` is busy or paused: keep the last link state and addresses, with fresh counters
+            for previous in self.interfaces:
+                if previous.name == interface_name:
+                    return previous._replace(rx_bytes=rx_bytes, tx_bytes=tx_bytes, rx_errors=rx_errors)
+            return InterfaceSample(interface_name, kind, "UNKNOWN", (), rx_bytes, tx_bytes, rx_errors)
         except Exception:
-            return {
-                "name": interface_name,
-                "type": "Error",
-                "status": "Error", 
-                "ip_addresses": [],
-                "rx_bytes": 0,
-                "tx_bytes": 0,
-                "rx_errors": 0
-            }
+            return InterfaceSample(interface_name, "Error", "Error")
 
     def update_all_interfaces_data(self):
-        """Update data for all network interfaces and collect stats for graphing"""
+        """Update data for all network interfaces on a worker thread"""
+        self.run_worker(self._network_worker, thread=True, exclusive=True, group="network")
+
+    def _network_worker(self):
         try:
             # Get all network interfaces
             available_interfaces = self.get_available_interfaces()
             
-            # Get network statistics for all interfaces
-            stats_cmd = ["cat", "/proc/net/dev"]
-            stats_result = subprocess.run(stats_cmd, capture_output=True, text=True, timeout=5)
+            # Get network statistics for all interfaces (read directly; no need to fork `cat`)
+            with open("/proc/net/dev") as f:
+                net_dev = f.read()
             
-            interfaces_data = {}
             total_rx = 0
             total_tx = 0
             
-            # Parse network statistics
+            # Parse network statistics: name -> (rx_bytes, tx_bytes, rx_errors)
             stats_by_interface = {}
-            if stats_result.returncode == 0:
-                for line in stats_result.stdout.split('\n'):
-                    for iface in available_interfaces:
-                        if iface + ':' in line:
-                            parts = line.split()
-                            if len(parts) >= 17:
-                                rx_bytes = int(parts[1])
-                                tx_bytes = int(parts[9])
-                                rx_errors = int(parts[3])
-                                stats_by_interface[iface] = {
-                                    "rx_bytes": rx_bytes,
-                                    "tx_bytes": tx_bytes, 
-                                    "rx_errors": rx_errors
-                                }
-                                total_rx += rx_bytes
-                                total_tx += tx_bytes
+            wanted = set(available_interfaces)
+            for line in net_dev.split('\n'):
+                name, sep, counters = line.partition(':')
+                name = name.strip()
+                if not sep or name not in wanted:
+                    continue
+                parts = counters.split()
+                if len(parts) >= 16:
+                    rx_bytes = int(parts[0])
+                    tx_bytes = int(parts[8])
+                    stats_by_interface[name] = (rx_bytes, tx_bytes, int(parts[2]))
+                    total_rx += rx_bytes
+                    total_tx += tx_bytes
             
             # Get detailed info for WiFi and Ethernet interfaces
-            wifi_interfaces = []
-            ethernet_interfaces = []
-            
+            interfaces = []
             for iface in available_interfaces:
                 if iface == "lo":  # Skip loopback
                     continue
                     
-                interface_info = self.get_interface_info(iface)
-                
-                # Add traffic stats
-                if iface in stats_by_interface:
-                    interface_info.update(stats_by_interface[iface])
-                
-                if interface_info["type"] == "WiFi":
-                    wifi_interfaces.append(interface_info)
-                elif interface_info["type"] == "Ethernet":
-                    ethernet_interfaces.append(interface_info)
-                    
-            # Store historical data for graphing (keep last 30 points)
-            current_time = time.time()
-            self.network_history.append({
-                "time": current_time,
-                "total_rx": total_rx,
-                "total_tx": total_tx
-            })
-            
-            # Keep only last 30 data points for graph
-            if len(self.network_history) > 30:
-                self.network_history = self.network_history[-30:]
-                
-            self.all_interfaces_data = {
-                "wifi_interfaces": wifi_interfaces,
-                "ethernet_interfaces": ethernet_interfaces,
-                "total_rx": total_rx,
-                "total_tx": total_tx,
-                "history": self.network_history
-            }
-            
+                interface_info = self.get_interface_info(iface, *stats_by_interface.get(iface, ()))
+                if interface_info.kind in ("WiFi", "Ethernet"):
+                    interfaces.append(interface_info)
+
+            result = (tuple(interfaces), NetworkSample(time.time(), total_rx, total_tx), None)
         except Exception as e:
-            self.all_interfaces_data = {
-                "wifi_interfaces": [],
-                "ethernet_interfaces": [],
-                "total_rx": 0,
-                "total_tx": 0,
-                "history": [],
-                "error": str(e)
-            }
-            
+            result = ((), None, str(e))
+        self.app.call_from_thread(self.apply_network, *result)
+
+    def apply_network(self, interfaces, totals, error):
+        """Store a network reading (UI thread): graph history, metrics and events"""
+        if error is None:
+            # Store throughput since the previous poll for graphing
+            rates = self.record_throughput(totals)
+            metrics = {f"net.{iface.name}.rx_errors": iface.rx_errors for iface in interfaces}
+            if rates:
+                metrics["net.rx_rate"], metrics["net.tx_rate"] = rates
+            self.app.publish_metrics(metrics, totals.time, source="net")
+            if self.cached_at is None:
+                self.report_changes(self.interfaces, interfaces)
+            self.total_rx = totals.total_rx
+            self.total_tx = totals.total_tx
+        else:
+            if error_kind(error) != error_kind(self.error):
+                self.app.record_event(f"Network collection failed: {error}", "error")
+            self.total_rx = 0
+            self.total_tx = 0
+        self.interfaces = interfaces
+        self.error = error
+        self.cached_at = None
+        self.collected = True
         self.refresh()
 
-    def create_network_graph(self, width=60, height=8):
-        """Create an enhanced ASCII graph of network activity"""
-        history = self.all_interfaces_data.get("history", [])
-        if len(history) < 2:
-            graph_lines = [""]  # Add empty line to match interface panel height
-            graph_lines.append(Symbols.BOX_TOP_LEFT + Symbols.BOX_HORIZONTAL * width + Symbols.BOX_TOP_RIGHT)
-            for _ in range(height):
-                content = Symbols.PROGRESS_EMPTY * width
-                graph_lines.append(Symbols.BOX_VERTICAL + content.ljust(width)[:width] + Symbols.BOX_VERTICAL)
-            graph_lines.append(Symbols.BOX_BOTTOM_LEFT + Symbols.BOX_HORIZONTAL * width + Symbols.BOX_BOTTOM_RIGHT)
+    def report_changes(self, old_interfaces, new_interfaces):
+        """Log interfaces that appeared, disappeared or changed link state"""
+        if not old_interfaces:
+            return  # first poll (or recovering from an error); nothing to compare against
+        old_status = {iface.name: iface.status for iface in old_interfaces}
+        new_status = {iface.name: iface.status for iface in new_interfaces}
+        for name, status in new_status.items():
+            if name not in old_status:
+                self.app.record_event(f"Interface {name} appeared ({status})")
+            elif old_status[name] != status:
+                level = "warning" if status != "UP" else "info"
+                self.app.record_event(f"Interface {name} is now {status}", level)
+        for name in old_status.keys() - new_status.keys():
+            self.app.record_event(f"Interface {name} disappeared", "warning")
+
+    def record_throughput(self, sample):
+        """Turn counter totals into rates and add them to the tiered history.
+
+        Returns (rx_rate, tx_rate) in bytes/s, or None if no rate was recorded.
+        """
+        previous, self._last_totals = self._last_totals, sample
+        if previous is None:
+            return None
+        time_delta = sample.time - previous.time
+        rx_delta = sample.total_rx - previous.total_rx
+        tx_delta = sample.total_tx - previous.total_tx
+        # Skip intervals where counters went backwards (interface removed or reset)
+        if time_delta > 0 and rx_delta >= 0 and tx_delta >= 0:
+            rates = (rx_delta / time_delta, tx_delta / time_delta)
+            self.rx_history.add(sample.time, rates[0])
+            self.tx_history.add(sample.time, rates[1])
+            self.rx_summary.add(rates[0])
+            self.tx_summary.add(rates[1])
+            return rates
+        return None
+
+    def create_network_graph(self, width=60, height=8, resolution=0):
+        """Create an enhanced ASCII graph of network activity.
+
+        `resolution` indexes TieredHistory.TIERS: 0 plots raw samples, higher
+        tiers plot per-bucket averages read straight from the rollups.
+        """
+        # Throughput (bytes per second) for the newest 'width' points
+        rx_rates = self.rx_history.series(resolution, width)
+        tx_rates = self.tx_history.series(resolution, width)
+        box, max_throughput = io_graph(rx_rates, tx_rates, width, height)
+        graph_lines = [""] + box  # Leading empty line matches the interface panel height
+
+        if max_throughput is None:
             graph_lines.append("[Collecting data...]")
             return graph_lines
-            
-        # Calculate throughput deltas (bytes per second)
-        throughputs = []
-        rx_rates = []
-        tx_rates = []
-        
-        for i in range(1, len(history)):
-            prev = history[i-1]
-            curr = history[i]
-            time_delta = curr["time"] - prev["time"]
-            if time_delta > 0:
-                rx_rate = (curr["total_rx"] - prev["total_rx"]) / time_delta
-                tx_rate = (curr["total_tx"] - prev["total_tx"]) / time_delta
-                total_rate = rx_rate + tx_rate
-                throughputs.append(total_rate)
-                rx_rates.append(rx_rate)
-                tx_rates.append(tx_rate)
-        
-        if not throughputs:
-            graph_lines = [""]  # Add empty line to match interface panel height
-            graph_lines.append(Symbols.BOX_TOP_LEFT + Symbols.BOX_HORIZONTAL * width + Symbols.BOX_TOP_RIGHT)
-            for _ in range(height):
-                content = Symbols.PROGRESS_EMPTY * width
-                graph_lines.append(Symbols.BOX_VERTICAL + content.ljust(width)[:width] + Symbols.BOX_VERTICAL)
-            graph_lines.append(Symbols.BOX_BOTTOM_LEFT + Symbols.BOX_HORIZONTAL * width + Symbols.BOX_BOTTOM_RIGHT) 
-            graph_lines.append("[No data available]")
-            return graph_lines
-            
-        # Normalize values for graph
-        max_throughput = max(throughputs) if throughputs else 1
-        if max_throughput == 0:
-            max_throughput = 1
-            
-        # Create multi-line graph  
-        graph_lines = [""]  # Add empty line to match interface panel height
-        
-        # Take last 'width' values
-        recent_throughputs = throughputs[-width:] if len(throughputs) >= width else throughputs
-        recent_rx = rx_rates[-width:] if len(rx_rates) >= width else rx_rates
-        recent_tx = tx_rates[-width:] if len(tx_rates) >= width else tx_rates
-        
-        # Add top border
-        graph_lines.append(Symbols.BOX_TOP_LEFT + Symbols.BOX_HORIZONTAL * width + Symbols.BOX_TOP_RIGHT)
-        
-        # Create the graph from top to bottom
-        for row in range(height):
-            line = Symbols.BOX_VERTICAL  # Start with left border
-            threshold = (height - row) / height
-            
-            # Build the graph content
-            graph_content = ""
-            for i, (total_rate, rx_rate, tx_rate) in enumerate(zip(recent_throughputs, recent_rx, recent_tx)):
-                normalized_total = min(total_rate / max_throughput, 1.0)
-                normalized_rx = min(rx_rate / max_throughput, 1.0) if max_throughput > 0 else 0
-                normalized_tx = min(tx_rate / max_throughput, 1.0) if max_throughput > 0 else 0
-                
-                if normalized_total >= threshold:
-                    if normalized_rx > normalized_tx:
-                        graph_content += Symbols.PROGRESS_FILLED  # RX dominant - solid block
-                    elif normalized_tx > normalized_rx:
-                        graph_content += Symbols.PROGRESS_MEDIUM  # TX dominant - medium shade
-                    else:
-                        graph_content += Symbols.PROGRESS_EMPTY  # Equal - light shade
-                else:
-                    graph_content += " "
-            
-            # Ensure exact width and add right border
-            graph_content = graph_content.ljust(width)[:width]  # Pad or truncate to exact width
-            line = line + graph_content + Symbols.BOX_VERTICAL
-                
-            graph_lines.append(line)
-        
-        # Add bottom border
-        graph_lines.append(Symbols.BOX_BOTTOM_LEFT + Symbols.BOX_HORIZONTAL * width + Symbols.BOX_BOTTOM_RIGHT)
-        
-        # Format max throughput for display
-        if max_throughput > 1024*1024:
-            max_str = f"{max_throughput/(1024*1024):.1f} MB/s"
-        elif max_throughput > 1024:
-            max_str = f"{max_throughput/1024:.1f} KB/s"
-        else:
-            max_str = f"{max_throughput:.0f} B/s"
-            
-        graph_lines.append(f"Max: {max_str}")
+
+        max_line = f"Max: {format_rate(max_throughput)}"
+        if resolution:
+            # Rollup columns are averages; also show the true peak in view
+            peaks = [rx + tx for rx, tx in zip(self.rx_history.series(resolution, width, "max"),
+                                               self.tx_history.series(resolution, width, "max"))
+                     if not math.isnan(rx + tx)]
+            max_line += f"  Peak: {format_rate(max(peaks))}"
+        graph_lines.append(max_line)
         graph_lines.append(f"{Symbols.PROGRESS_FILLED} RX  {Symbols.PROGRESS_MEDIUM} TX  {Symbols.PROGRESS_EMPTY} Both")
+        rx_recent, tx_recent = self.rx_summary["5m"], self.tx_summary["5m"]
+        rx_hour, tx_hour = self.rx_summary["1h"], self.tx_summary["1h"]
+        graph_lines.append(f"5m p95 {Symbols.DOWNLOAD_ARROW}{format_rate(rx_recent.quantile(0.95))} "
+                           f"{Symbols.UPLOAD_ARROW}{format_rate(tx_recent.quantile(0.95))}  "
+                           f"1h peak {Symbols.DOWNLOAD_ARROW}{format_rate(rx_hour.max)} "
+                           f"{Symbols.UPLOAD_ARROW}{format_rate(tx_hour.max)}")
         
         return graph_lines
 
     def render(self):
-        data = self.all_interfaces_data
-        
         # Prepare interface information (left column)
         interface_lines = ["Network Interfaces:"]
+        if not self.collected and self.cached_at is None:
+            interface_lines.append(f"{Symbols.PENDING_ICON} Collecting network data...")
+            return panel_text(interface_lines)
+        if self.cached_at is not None:
+            interface_lines.append(cached_note(self.cached_at))
         
-        # Display Ethernet interfaces
-        ethernet_interfaces = data.get("ethernet_interfaces", [])
-        if ethernet_interfaces:
-            interface_lines.append(f"{Symbols.ETHERNET_ICON} Ethernet:")
-            for iface in ethernet_interfaces:
-                status_icon = Symbols.STATUS_LOW if iface["status"] == "UP" else Symbols.STATUS_HIGH
-                interface_lines.append(f"  {status_icon} {iface['name']}")
-                
-                if iface["ip_addresses"]:
-                    for ip_info in iface["ip_addresses"]:
-                        interface_lines.append(f"   {Symbols.IP_ICON} {ip_info['address']}/{ip_info['cidr']}")
-                else:
-                    interface_lines.append(f"   {Symbols.IP_ICON} No IP")
-                    
-                # Traffic stats (compact format)
-                rx_mb = iface.get("rx_bytes", 0) / (1024*1024)
-                tx_mb = iface.get("tx_bytes", 0) / (1024*1024)
-                if rx_mb > 1024:
-                    rx_str = f"{rx_mb/1024:.1f}GB"
-                else:
-                    rx_str = f"{rx_mb:.0f}MB"
-                if tx_mb > 1024:
-                    tx_str = f"{tx_mb/1024:.1f}GB"
-                else:
-                    tx_str = f"{tx_mb:.0f}MB"
-                    
-                interface_lines.append(f"   {Symbols.TRAFFIC_ICON} {Symbols.DOWNLOAD_ARROW}{rx_str} {Symbols.UPLOAD_ARROW}{tx_str}")
-        
-        # Display WiFi interfaces
-        wifi_interfaces = data.get("wifi_interfaces", [])
-        if wifi_interfaces:
-            interface_lines.append(f"{Symbols.WIFI_ICON} WiFi:")
-            for iface in wifi_interfaces:
-                status_icon = Symbols.STATUS_LOW if iface["status"] == "UP" else Symbols.STATUS_HIGH
-                interface_lines.append(f"  {status_icon} {iface['name']}")
+        # Display Ethernet interfaces first, then WiFi
+        for kind, icon in (("Ethernet", Symbols.ETHERNET_ICON), ("WiFi", Symbols.WIFI_ICON)):
+            interfaces = [iface for iface in self.interfaces if iface.kind == kind]
+            if not interfaces:
+                continue
+            interface_lines.append(f"{icon} {kind}:")
+            for iface in interfaces:
+                status_icon = Symbols.STATUS_LOW if iface.status == "UP" else Symbols.STATUS_HIGH
+                interface_lines.append(f"  {status_icon} {iface.name}")
                 
-                if iface["ip_addresses"]:
-                    for ip_info in iface["ip_addresses"]:
-                        interface_lines.append(f"   {Symbols.IP_ICON} {ip_info['address']}/{ip_info['cidr']}")
+                if iface.addresses:
+                    for address, cidr in iface.addresses:
+                        interface_lines.append(f"   {Symbols.IP_ICON} {address}/{cidr}")
                 else:
                     interface_lines.append(f"   {Symbols.IP_ICON} No IP")
                     
                 # Traffic stats (compact format)
-                rx_mb = iface.get("rx_bytes", 0) / (1024*1024)
-                tx_mb = iface.get("tx_bytes", 0) / (1024*1024)
-                if rx_mb > 1024:
-                    rx_str = f"{rx_mb/1024:.1f}GB"
-                else:
-                    rx_str = f"{rx_mb:.0f}MB"
-                if tx_mb > 1024:
-                    tx_str = f"{tx_mb/1024:.1f}GB"
-                else:
-                    tx_str = f"{tx_mb:.0f}MB"
-                    
+                rx_str = format_size_mb(iface.rx_bytes / (1024*1024))
+                tx_str = format_size_mb(iface.tx_bytes / (1024*1024))
                 interface_lines.append(f"   {Symbols.TRAFFIC_ICON} {Symbols.DOWNLOAD_ARROW}{rx_str} {Symbols.UPLOAD_ARROW}{tx_str}")
         
-        if not ethernet_interfaces and not wifi_interfaces:
+        if not self.interfaces:
             interface_lines.append(f"{Symbols.NO_DATA_ICON} No network interfaces")
         
         # Add total traffic at bottom of left column
-        total_rx = data.get("total_rx", 0)
-        total_tx = data.get("total_tx", 0)
-        
-        if total_rx > 1024*1024*1024:
-            total_rx_str = f"{total_rx/(1024*1024*1024):.1f}GB"
-        else:
-            total_rx_str = f"{total_rx/(1024*1024):.0f}MB"
-            
-        if total_tx > 1024*1024*1024:
-            total_tx_str = f"{total_tx/(1024*1024*1024):.1f}GB"  
-        else:
-            total_tx_str = f"{total_tx/(1024*1024):.0f}MB"
-        
+        total_rx_str = format_size_mb(self.total_rx / (1024*1024))
+        total_tx_str = format_size_mb(self.total_tx / (1024*1024))
         interface_lines.append(f"{Symbols.TOTAL_ICON} Total: {Symbols.DOWNLOAD_ARROW}{total_rx_str} {Symbols.UPLOAD_ARROW}{total_tx_str}")
         
         # Display errors if any
-        if "error" in data:
+        if self.error:
             interface_lines.append("")
-            interface_lines.append(f"{Symbols.ERROR_ICON} Error: {data['error']}")
+            interface_lines.append(f"{Symbols.ERROR_ICON} Error: {self.error}")
         
-        return "\n".join(interface_lines)
+        return panel_text(interface_lines)
 
     def get_available_interfaces(self):
+        """Interface names from `ip link`, active ones first; the last listing while `ip` is busy or paused"""
         try:
             # Get real network interfaces and their status
             cmd = ["ip", "link", "show"]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-            interfaces = []
-            active_interfaces = []
-            
-            if result.returncode == 0:
-                current_interface = None
-                for line in result.stdout.split('\n'):
-                    # Look for interface names (format: "2: eth0: <BROADCAST...")
-                    match = re.search(r'^\d+: ([^:@]+)', line)
-                    if match:
-                        interface_name = match.group(1)
-                        # Skip virtual interfaces like veth, docker, etc.
-                        if not any(skip in interface_name for skip in ['veth', 'docker', 'br-', 'virbr']):
-                            current_interface = interface_name
-                            interfaces.append(interface_name)
-                            
-                            # Check if interface is UP
-                            if "state UP" in line:
-                                active_interfaces.append(interface_name)
-            
-            # Prioritize active interfaces, then all interfaces
-            if active_interfaces:
-                # Put active interfaces first, then inactive ones
-                inactive_interfaces = [iface for iface in interfaces if iface not in active_interfaces]
-                interfaces = active_interfaces + inactive_interfaces
-            
-            return interfaces if interfaces else ["lo", "eth0", "wlan0"]  # Fallback
-        except:
-            return ["lo", "eth0", "wlan0"]  # Fallback
+            result = process_runner.run("ip", cmd, timeout=5)
+        except SourceUnavailable:
+            return self.interface_names or [iface.name for iface in self.interfaces]
+        if result.returncode != 0:
+            raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
+        interfaces = []
+        active_interfaces = []
+        
+        current_interface = None
+        for line in result.stdout.split('\n'):
+            # Look for interface names (format: "2: eth0: <BROADCAST...")
+            match = re.search(r'^\d+: ([^:@]+)', line)
+            if match:
+                interface_name = match.group(1)
+                # Skip virtual interfaces like veth, docker, etc. (the config's exclude list)
+                if self.config.names(interface_name):
+                    current_interface = interface_name
+                    interfaces.append(interface_name)
+                        
+                    # Check if interface is UP
+                    if "state UP" in line:
+                        active_interfaces.append(interface_name)
+        
+        # Prioritize active interfaces, then all interfaces
+        if active_interfaces:
+            # Put active interfaces first, then inactive ones
+            inactive_interfaces = [iface for iface in interfaces if iface not in active_interfaces]
+            interfaces = active_interfaces + inactive_interfaces
+        
+        self.interface_names = interfaces
+        return interfaces
 
     def next_interface(self):
-        interfaces = self.get_available_interfaces()
+        interfaces = self.interface_names     # from the last poll; no `ip` call on the UI thread
         if self.interface in interfaces:
             current_index = interfaces.index(self.interface)
             self.interface = interfaces[(current_index + 1) % len(interfaces)]
         else:
             self.interface = interfaces[0] if interfaces else "lo"
-        self.update_net_data()
+        self.update_all_interfaces_data()
 
     def previous_interface(self):
-        interfaces = self.get_available_interfaces()
+        interfaces = self.interface_names
         if self.interface in interfaces:
             current_index = interfaces.index(self.interface)
             self.interface = interfaces[(current_index - 1) % len(interfaces)]
         else:
             self.interface = interfaces[0] if interfaces else "lo"
-        self.update_net_data()
+        self.update_all_interfaces_data()
 
-class NetworkGraph(Static):
+class NetworkGraph(Paced, Static):
     """Separate widget for displaying network activity graph"""
-    
-    def __init__(self, network_stats_widget, **kwargs):
+
+    resolution = reactive(0)    # index into TieredHistory.TIERS
+
+    RDMA_GRAPH_HEIGHT = 6       # rows per graph when the RDMA graph is shown too
+
+    def __init__(self, network_stats_widget, rdma_stats_widget=None, **kwargs):
         super().__init__(**kwargs)
         self.network_stats = network_stats_widget
+        self.rdma_stats = rdma_stats_widget     # RDMA traffic is graphed below when ports exist
+        self._rdma_shown = False
         self.set_interval(2.0, self.update_graph)
     
     def update_graph(self):
         """Update the graph display"""
-        self.refresh()
+        rdma_shown = self.rdma_stats is not None and bool(self.rdma_stats.ports)
+        # The RDMA graph adds lines; re-lay out when it comes or goes
+        self.refresh(layout=rdma_shown != self._rdma_shown)
+        self._rdma_shown = rdma_shown
+
+    def zoom(self, step):
+        """Move to a coarser (+1) or finer (-1) history resolution"""
+        tiers = len(TieredHistory.TIERS)
+        self.resolution = max(0, min(self.resolution + step, tiers - 1))
+
+    def watch_resolution(self, resolution):
+        label = TieredHistory.TIERS[resolution][0]
+        title = "Network Activity" if resolution == 0 else f"Network Activity ({label} avg)"
+        self.border_title = f"{Symbols.GRAPH_ICON} {title}"
     
     def render(self):
         """Render the network activity graph"""
         # Calculate available width and height based on widget size
         # Get widget dimensions, with fallbacks for minimum sizes
         available_width = max(self.size.width - 4, 20)  # Account for borders and minimum
-        available_height = max(6, min(self.size.height - 4, 12))  # Reasonable height range
+        available_height = max(6, min(self.size.height - 5, 12))  # Reasonable height range
         
+        rdma = self.rdma_stats
+        if rdma is not None and rdma.ports:
+            # IP traffic on top, RDMA (which /proc/net/dev never sees) below.  Fixed
+            # height, so the auto-sized panel only re-lays out when RDMA comes or goes
+            available_height = self.RDMA_GRAPH_HEIGHT
+
         # Use dynamic sizing based on available space
-        graph_lines = self.network_stats.create_network_graph(width=available_width, height=available_height)
-        return "\n".join(graph_lines)
+        graph_lines = self.network_stats.create_network_graph(width=available_width, height=available_height,
+                                                              resolution=self.resolution)
+        if rdma is not None and rdma.ports:
+            # Pad the "collecting" state to the full legend so the line count stays put
+            graph_lines += [""] * (available_height + 6 - len(graph_lines))
+            graph_lines += rdma.create_rdma_graph(width=available_width, height=available_height,
+                                                  resolution=self.resolution)
+        return panel_text(graph_lines)
+
+class RdmaStats(Collector, Paced, Static):
+    """InfiniBand/RoCE ports: link state, throughput and error counters.
+
+    Hidden until a port is found, so hosts without RDMA hardware don't
+    show an empty panel.
+    """
+
+    ports = reactive(())         # Tuple[RdmaPortSample, ...]
+    error = reactive(None)
+
+    HISTORY_LENGTH = 120         # per-port rate samples kept for the sparklines
+
+    def __init__(self, config=None, **kwargs):
+        super().__init__(**kwargs)
+        self.config = config or Config()["rdma"]
+        self.sampler = RdmaSampler()    # only used from the RDMA worker
+        # All ports together, graphed with the network activity
+        self.rx_history = TieredHistory()
+        self.tx_history = TieredHistory()
+        self.port_history = {}          # port name -> (rx RingBuffer, tx RingBuffer)
+        self.collected = False
+
+    def on_mount(self):
+        self.update_rdma_data()
+        self.apply_config(self.config)
+
+    def schedule(self, config):
+        return ((config.interval, self.update_rdma_data),)
+
+    def apply_config(self, config):
+        super().apply_config(config)
+        self.display = config.enabled and bool(self.ports or self.error)
+
+    def update_rdma_data(self):
+        """Read the port counters on a worker thread"""
+        self.run_worker(self._rdma_worker, thread=True, exclusive=True, group="rdma")
+
+    def _rdma_worker(self):
+        try:
+            ports, error = self.sampler.sample(self.config.names), None
+        except OSError as e:
+            ports, error = (), str(e)
+        self.app.call_from_thread(self.apply_rdma, ports, error, time.time())
+
+    def apply_rdma(self, ports, error, timestamp):
+        """Store a port reading (UI thread): history, metrics and events"""
+        if error is None:
+            if self.error:
+                self.app.record_event("RDMA collection recovered")
+            self.report_changes(ports)
+            metrics = {}
+            rx_total = tx_total = 0.0
+            complete = bool(ports)
+            for port in ports:
+                key = port.name.replace("/", ".")
+                metrics[f"rdma.{key}.rx_rate"] = port.rx_rate
+                metrics[f"rdma.{key}.tx_rate"] = port.tx_rate
+                metrics[f"rdma.{key}.errors"] = port.errors
+                history = self.port_history.get(port.name)
+                if history is None:
+                    history = self.port_history[port.name] = (RingBuffer(self.HISTORY_LENGTH), RingBuffer(self.HISTORY_LENGTH))
+                if port.rx_rate is None or port.tx_rate is None:
+                    complete = False
+                    continue
+                history[0].append(port.rx_rate)
+                history[1].append(port.tx_rate)
+                rx_total += port.rx_rate
+                tx_total += port.tx_rate
+            if complete:
+                self.rx_history.add(timestamp, rx_total)
+                self.tx_history.add(timestamp, tx_total)
+                metrics["rdma.rx_rate"], metrics["rdma.tx_rate"] = rx_total, tx_total
+            self.app.publish_metrics(metrics, timestamp, source="rdma")
+            names = {port.name for port in ports}
+            self.port_history = {name: history for name, history in self.port_history.items() if name in names}
+        elif error_kind(error) != error_kind(self.error):
+            self.app.record_event(f"RDMA collection failed: {error}", "error")
+        self.ports = ports
+        self.error = error
+        self.collected = True
+        self.display = self.config.enabled and bool(ports or error)
+
+    def report_changes(self, ports):
+        """Log ports that appeared, disappeared or changed link state"""
+        if not self.collected:
+            return
+        old_state = {port.name: port.state for port in self.ports}
+        for port in ports:
+            if port.name not in old_state:
+                self.app.record_event(f"RDMA port {port.name} appeared ({port.state})")
+            elif old_state[port.name] != port.state:
+                level = "info" if port.state == "ACTIVE" else "warning"
+                self.app.record_event(f"RDMA port {port.name} is now {port.state}", level)
+        for name in old_state.keys() - {port.name for port in ports}:
+            self.app.record_event(f"RDMA port {name} disappeared", "warning")
 
-class DockerStats(Static):
-    docker_data = reactive([])
+    def on_unmount(self):
+        self.sampler.close()
+
+    def create_rdma_graph(self, width=60, height=8, resolution=0):
+        """Graph lines of combined RDMA throughput, drawn under the network graph"""
+        rx_rates = self.rx_history.series(resolution, width)
+        tx_rates = self.tx_history.series(resolution, width)
+        box, max_throughput = io_graph(rx_rates, tx_rates, width, height)
+        lines = [f"RDMA ({len(self.ports)} port{'s' if len(self.ports) != 1 else ''})"] + box
+        if max_throughput is None:
+            lines.append("[Collecting data...]")
+        else:
+            lines.append(f"Max: {format_rate(max_throughput)}")
+        return lines
+
+    def render(self):
+        if self.error:
+            return panel_text([f"{Symbols.ERROR_ICON} Error: {self.error}"])
+        lines = []
+        name_width = max(len(port.name) for port in self.ports) if self.ports else 0
+        spark_width = max(getattr(self.size, 'width', 80) - name_width - 92, 5)
+        for port in self.ports:
+            status_icon = Symbols.STATUS_LOW if port.state == "ACTIVE" else Symbols.STATUS_HIGH
+            layer = "RoCE" if port.link_layer == "Ethernet" else "IB"
+            speed = port.rate.split(" (")[0]
+            history = self.port_history.get(port.name)
+            spark = ""
+            if history is not None:
+                totals = [rx + tx for rx, tx in zip(history[0].last(spark_width), history[1].last(spark_width))]
+                spark = sparkline(totals, spark_width)
+            errors = f"{Symbols.ERROR_ICON} {port.errors:,} errors" if port.error_rate else f"{port.errors:,} errors"
+            lines.append(f"{status_icon} {port.name.ljust(name_width)}  {layer:<4} {port.state:<6} {speed:>12}  "
+                         f"{Symbols.DOWNLOAD_ARROW}{format_rate(port.rx_rate):>11} "
+                         f"{Symbols.UPLOAD_ARROW}{format_rate(port.tx_rate):>11}  {errors:<16}  {spark}")
+        return panel_text(lines)
+
+class ConnectionStats(Collector, Paced, Static):
+    """TCP sockets by state, the busiest remote hosts and local ports"""
+
+    sample = reactive(None)      # ConnectionSample
+    error = reactive(None)
+
+    ROWS = 5                     # hosts and ports listed; the panel has a fixed height to match
+
+    def __init__(self, config=None, **kwargs):
+        super().__init__(**kwargs)
+        self.config = config or Config()["connections"]
+        self.sampler = ConnectionSampler()
+        self.collected = False
+
+    def on_mount(self):
+        self.update_connection_data()
+        self.apply_config(self.config)
+
+    def schedule(self, config):
+        return ((config.interval, self.update_connection_data),)
+
+    def update_connection_data(self):
+        """Summarize the socket tables on a worker thread (100k sockets take tens of milliseconds)"""
+        self.run_worker(self._connections_worker, thread=True, exclusive=True, group="connections")
+
+    def _connections_worker(self):
+        try:
+            sample, error = self.sampler.sample(), None
+        except (OSError, ValueError) as e:
+            sample, error = None, str(e)
+        self.app.call_from_thread(self.apply_connections, sample, error)
+
+    def apply_connections(self, sample, error):
+        """Store a connection summary (UI thread): metrics and events"""
+        if error is None:
+            if self.error:
+                self.app.record_event("Connection statistics recovered")
+            # Every state is published, so a rule like "tcp.close_wait > 1000" clears when it drains
+            metrics = {f"tcp.{state.lower()}": 0 for state in ConnectionSampler.STATES.values()}
+            metrics.update((f"tcp.{state.lower()}", count) for state, count in sample.states)
+            metrics["tcp.total"] = sum(count for _, count in sample.states)
+            metrics["sockets.used"] = sample.sockets
+            self.app.publish_metrics(metrics, source="connections")
+            self.sample = sample
+            self.collected = True
+        elif error_kind(error) != error_kind(self.error):
+            self.app.record_event(f"Reading /proc/net/tcp failed: {error}", "error")
+        self.error = error
+
+    def on_unmount(self):
+        self.sampler.close()
+
+    def render(self):
+        lines = []
+        if self.error:
+            lines.append(f"{Symbols.ERROR_ICON} Error: {self.error}")
+            return panel_text(lines)
+        if not self.collected:
+            lines.append(f"{Symbols.PENDING_ICON} Collecting connection data...")
+            return panel_text(lines)
+
+        sample = self.sample
+        total = sum(count for _, count in sample.states)
+        scan = "unchanged" if sample.scan_time is None else f"read in {sample.scan_time * 1000:.0f} ms"
+        lines.append(f"TCP: {total:,}    Sockets: {sample.sockets:,}    UDP: {sample.udp:,}    "
+                     f"Orphans: {sample.orphans:,}    ({scan})")
+        lines.append("  ".join(f"{state} {count:,}" for state, count in sample.states) or "No TCP sockets")
+
+        hosts, ports = sample.remote_hosts[:self.ROWS], sample.local_ports[:self.ROWS]
+        host_width = max([len(address) for address, _ in hosts] + [15])
+        hosts_title = "Top remote hosts" + (f" (±{sample.host_error:,})" if sample.host_error else "")
+        lines.append(f"{hosts_title.ljust(host_width + 12)}    Busiest local ports")
+        for row in range(max(len(hosts), len(ports))):
+            left = f"  {hosts[row][0].ljust(host_width)} {hosts[row][1]:>9,}" if row < len(hosts) else ""
+            right = f"  {ports[row][0]:<6} {ports[row][1]:>9,}" if row < len(ports) else ""
+            lines.append(f"{left.ljust(host_width + 12)}    {right}")
+        return panel_text(lines)
+
+class DockerStats(Collector, Paced, DataTable):
+    """Docker containers as a table: one row per container, keyed by container ID.
+
+    DataTable only renders the rows in view, and each poll touches just the
+    cells whose values changed, so hundreds of containers stay cheap.
+    """
+    containers = reactive(())   # Tuple[ContainerSample, ...]
+    error = reactive(None)
+    sort_index = reactive(0)    # index into SORT_ORDERS
+
+    COLUMNS = (   # label, key, width
+        ("", "state", 2),
+        ("Name", "name", 24),
+        ("Image", "image", 28),
+        ("Status", "status", 10),
+        ("CPU%", "cpu", 8),
+        ("Memory", "memory", 8),
+        ("Net ↓", "net_rx", 11),
+        ("Net ↑", "net_tx", 11),
+        ("Disk R", "block_read", 11),
+        ("Disk W", "block_write", 11),
+        ("Ports", "ports", None),
+    )
+    # Running containers first, then by the chosen value (largest first) or name
+    SORT_ORDERS = (
+        ("CPU", lambda c: (c.status != "running", -(c.cpu or 0), c.name)),
+        ("memory", lambda c: (c.status != "running", -(c.memory or 0), c.name)),
+        ("name", lambda c: (c.status != "running", c.name)),
+    )
+
+    def __init__(self, config=None, **kwargs):
+        super().__init__(**kwargs)
+        self.config = config or Config()["docker"]
+        self.zebra_stripes = True
+        self.cursor_type = "row"
+        self._known_states = None   # container id -> (name, status) from the last poll
+        self.io_sampler = ContainerIOSampler()  # only used from the Docker worker
+        self.collected = False      # True once a live reading has arrived
+        self.cached_at = None       # timestamp of warm-start data still on screen
+        self._row_cells = {}        # container id -> (sample, cells) currently shown in its row
+        self._port_cells = {}       # (container id, ports) -> formatted Ports cell
 
     def on_mount(self):
+        for label, key, width in self.COLUMNS:
+            self.add_column(label, key=key, width=width)
+        self.watch_sort_index(self.sort_index)
+        self._sync_rows()
         self.update_docker_data()
-        self.set_interval(10, self.update_docker_data)
+        self.apply_config(self.config)
+
+    def schedule(self, config):
+        return ((config.interval, self.update_docker_data),)
+
+    @property
+    def container_names(self):
+        """Full container ID -> name, for attributing host processes to containers"""
+        return {container.container_id: container.name for container in self.containers}
 
     def update_docker_data(self):
+        """Poll Docker on a worker thread"""
+        self.run_worker(self._docker_worker, thread=True, exclusive=True, group="docker")
+
+    def _docker_worker(self):
+        import json  # only needed once Docker data arrives; keeps startup imports light
+
         try:
             # Get Docker container information using docker ps -a
-            cmd = ["docker", "ps", "-a", "--format", "json"]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-            
-            self.docker_data = []
+            cmd = ["docker", "ps", "-a", "--no-trunc", "--format", "json"]
+            result = process_runner.run("docker", cmd, timeout=10)
             
+            listed = []
             if result.returncode == 0 and result.stdout.strip():
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
+                names = self.config.names
+                for line in result.stdout.strip().split('\n'):
                     try:
-                        container_info = json.loads(line)
-                        
-                        # Get additional stats for running containers
-                        cpu_usage = "0%"
-                        memory_usage = "0 MB"
-                        
-                        if container_info.get("State") == "running":
-                            try:
-                                stats_cmd = ["docker", "stats", "--no-stream", "--format", "json", container_info["ID"]]
-                                stats_result = subprocess.run(stats_cmd, capture_output=True, text=True, timeout=5)
-                                if stats_result.returncode == 0 and stats_result.stdout.strip():
-                                    stats_info = json.loads(stats_result.stdout.strip())
-                                    cpu_usage = stats_info.get("CPUPerc", "0%")
-                                    memory_usage = stats_info.get("MemUsage", "0 MB").split(' / ')[0]
-                            except (json.JSONDecodeError, subprocess.TimeoutExpired):
-                                pass  # Use default values
-                        
-                        container = {
-                            "Container ID": container_info["ID"][:12],
-                            "Name": container_info["Names"],
-                            "Image": container_info["Image"],
-                            "Status": container_info["State"],
-                            "CPU": cpu_usage,
-                            "Memory": memory_usage,
-                            "Ports": container_info.get("Ports", "-")
-                        }
-                        self.docker_data.append(container)
-                        
+                        info = json.loads(line)
                     except json.JSONDecodeError:
                         continue  # Skip invalid JSON lines
+                    if names(info.get("Names", "")):
+                        listed.append(info)
+
+            # CPU and memory for every running container from a single docker stats call
+            stats = {}
+            if any(info.get("State") == "running" for info in listed):
+                try:
+                    stats_cmd = ["docker", "stats", "--no-stream", "--no-trunc", "--format", "json"]
+                    stats_result = process_runner.run("docker", stats_cmd, timeout=10)
+                    if stats_result.returncode == 0:
+                        for line in stats_result.stdout.strip().split('\n'):
+                            try:
+                                stats_info = json.loads(line)
+                            except json.JSONDecodeError:
+                                continue
+                            stats[stats_info.get("ID")] = stats_info
+                except (subprocess.TimeoutExpired, SourceUnavailable):
+                    pass  # Use default values
+
+            containers = []
+            for container_info in listed:
+                stats_info = stats.get(container_info["ID"]) if container_info.get("State") == "running" else None
+                containers.append(ContainerSample(
+                    container_info["ID"],
+                    container_info["Names"],
+                    container_info["Image"],
+                    container_info["State"],
+                    parse_number(stats_info.get("CPUPerc", "").rstrip('%')) if stats_info else None,
+                    parse_size_mb(stats_info.get("MemUsage", "").split(' / ')[0]) if stats_info else None,
+                    container_info.get("Ports") or "-",
+                    memory_percent=parse_number(stats_info.get("MemPerc", "").rstrip('%')) if stats_info else None,
+                ))
+
+            # Network and block I/O for running containers, straight from /proc and the cgroup files
+            io_rates = self.io_sampler.sample([c.container_id for c in containers if c.status == "running"])
+            containers = [
+                container._replace(**dict(zip(("net_rx", "net_tx", "block_read", "block_write"), io_rates[container.container_id])))
+                if container.container_id in io_rates else container
+                for container in containers
+            ]
                         
-            if not self.docker_data:
-                # No containers found
-                self.docker_data = [{
-                    "Container ID": "N/A",
-                    "Name": "No containers found",
-                    "Image": "N/A",
-                    "Status": "N/A",
-                    "CPU": "N/A",
-                    "Memory": "N/A",
-                    "Ports": "N/A"
-                }]
+            result = (tuple(containers), None)
                 
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError) as e:
+        except SourceBusy:
+            return  # a slow docker daemon is still answering; keep the last reading
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError, SourceUnavailable) as e:
             # Docker not available or other error
-            self.docker_data = [{
-                "Container ID": "Error",
-                "Name": f"Docker error: {str(e)}",
-                "Image": "N/A",
-                "Status": "N/A", 
-                "CPU": "N/A",
-                "Memory": "N/A",
-                "Ports": "N/A"
-            }]
-            
-        self.refresh()
+            result = ((), str(e))
+        self.app.call_from_thread(self.apply_docker, *result)
 
-    def _format_clickable_ports(self, ports_str):
-        """Convert Docker port mappings to clickable links"""
-        if not ports_str or ports_str in ["-", "N/A"]:
-            return ports_str
-            
-        # For now, let's test with a simple approach to avoid markup errors
-        # Parse different port formats:
-        # "8080/tcp" -> "http://localhost:8080"
-        # "0.0.0.0:5678->5678/tcp" -> "http://localhost:5678"
-        
-        try:
-            clickable_ports = []
-            port_mappings = [p.strip() for p in ports_str.split(',')]
-            
-            for port_mapping in port_mappings:
-                port_match = None
-                
-                # Pattern 1: "0.0.0.0:5678->5678/tcp" or "[::]:5678->5678/tcp"
-                external_port_match = re.search(r'(?:0\.0\.0\.0|\[::\]):(\d+)->', port_mapping)
-                if external_port_match:
-                    port_match = external_port_match.group(1)
-                
-                # Pattern 2: Simple port "8080/tcp"
-                if not port_match:
-                    simple_port_match = re.search(r'^(\d+)/(tcp|udp)$', port_mapping.strip())
-                    if simple_port_match:
-                        port_match = simple_port_match.group(1)
-                
-                if port_match:
-                    # Create a simple clickable link
-                    url = f"http://localhost:{port_match}"
-                    # Use a safer link format
-                    clickable_link = f"[link={url}]{port_mapping}[/link]"
-                    clickable_ports.append(clickable_link)
-                else:
-                    # If no port found, keep original text
-                    clickable_ports.append(port_mapping)
-            
-            return ", ".join(clickable_ports)
-        except Exception:
-            # If any error occurs, return the original string
-            return ports_str
+    def apply_docker(self, containers, error):
+        """Store a Docker reading (UI thread): metrics and events"""
+        if error is None:
+            if self.error:
+                self.app.record_event("Docker collection recovered")
+            self.report_changes(containers)
+
+            metrics = {}
+            for container in containers:
+                if container.status == "running":
+                    metrics[f"docker.{container.name}.cpu"] = container.cpu
+                    metrics[f"docker.{container.name}.memory"] = container.memory
+                    metrics[f"docker.{container.name}.memory_percent"] = container.memory_percent
+                    metrics[f"docker.{container.name}.net_rx"] = container.net_rx
+                    metrics[f"docker.{container.name}.net_tx"] = container.net_tx
+                    metrics[f"docker.{container.name}.block_read"] = container.block_read
+                    metrics[f"docker.{container.name}.block_write"] = container.block_write
+            self.app.publish_metrics(metrics, source="docker")
+        elif error_kind(error) != error_kind(self.error):
+            self.app.record_event(f"Docker collection failed: {error}", "error")
+        self.cached_at = None
+        self.collected = True
+        self.containers = containers
+        self.error = error
+        self._update_subtitle()
+
+    def report_changes(self, containers):
+        """Log containers that were created, removed or changed state since the last poll"""
+        states = {container.container_id: (container.name, container.status) for container in containers}
+        if self._known_states is not None:
+            for container_id, (name, status) in states.items():
+                previous = self._known_states.get(container_id)
+                if previous is None:
+                    self.app.record_event(f"Container {name} created ({status})")
+                elif previous[1] != status:
+                    level = "info" if status == "running" else "warning"
+                    self.app.record_event(f"Container {name} {previous[1]} -> {status}", level)
+            for container_id in self._known_states.keys() - states.keys():
+                self.app.record_event(f"Container {self._known_states[container_id][0]} removed")
+        self._known_states = states
+
+    def port_cell(self, container):
+        """Ports with a localhost link per published port; built once per container"""
+        key = (container.container_id, container.ports)
+        cell = self._port_cells.get(key)
+        if cell is None:
+            cell = Text()
+            for index, mapping in enumerate(container.ports.split(", ") if container.ports != "-" else ()):
+                # "0.0.0.0:8080->80/tcp" and "[::]:8080->80/tcp" publish host port 8080
+                published = re.search(r':(\d+)->', mapping)
+                if index:
+                    cell.append(", ")
+                cell.append(mapping, Style(link=f"http://localhost:{published.group(1)}") if published else None)
+            if not cell:
+                cell.append("-")
+            self._port_cells[key] = cell
+        return cell
+
+    def row_cells(self, container):
+        running = container.status == "running"
+        if running:
+            state = Symbols.CONTAINER_RUNNING
+        else:
+            state = Symbols.CONTAINER_STOPPED if container.status == "stopped" else Symbols.CONTAINER_ERROR
+        return (
+            state,
+            container.name,
+            container.image,
+            container.status,
+            Text(f"{container.cpu:.2f}" if running and container.cpu is not None else "-", justify="right"),
+            Text(format_size_mb(container.memory) if running else "-", justify="right"),
+            Text(format_rate(container.net_rx) if running else "-", justify="right"),
+            Text(format_rate(container.net_tx) if running else "-", justify="right"),
+            Text(format_rate(container.block_read) if running else "-", justify="right"),
+            Text(format_rate(container.block_write) if running else "-", justify="right"),
+            self.port_cell(container),
+        )
+
+    def watch_containers(self, containers):
+        if self.is_mounted:
+            self._sync_rows()
+
+    def watch_error(self, error):
+        self._update_subtitle()
+
+    def watch_sort_index(self, sort_index):
+        self.border_title = f"{Symbols.DOCKER_ICON} Docker Containers (by {self.SORT_ORDERS[sort_index][0]})"
+        if self.is_mounted:
+            self._sort_rows()
+
+    def cycle_sort(self):
+        self.sort_index = (self.sort_index + 1) % len(self.SORT_ORDERS)
+
+    def _sync_rows(self):
+        """Bring the table in line with self.containers, touching only rows and cells that changed"""
+        containers = {container.container_id: container for container in self.containers}
+        for container_id in self._row_cells.keys() - containers.keys():
+            self.remove_row(container_id)
+            del self._row_cells[container_id]
+        for container_id, container in containers.items():
+            shown = self._row_cells.get(container_id)
+            if shown is not None and shown[0] == container:
+                continue    # unchanged since the last poll
+            cells = self.row_cells(container)
+            if shown is None:
+                self.add_row(*cells, key=container_id)
+            else:
+                for (_, column, _), old, new in zip(self.COLUMNS, shown[1], cells):
+                    if old != new:
+                        self.update_cell(container_id, column, new)
+            self._row_cells[container_id] = (container, cells)
+        self._port_cells = {key: cell for key, cell in self._port_cells.items() if key[0] in containers}
+        self._sort_rows()
+        self._update_subtitle()
+
+    def _sort_rows(self):
+        # Names are unique per Docker host, so the name column identifies the row
+        order = self.SORT_ORDERS[self.sort_index][1]
+        rank = {container.name: order(container) for container in self.containers}
+        if rank:
+            self.sort("name", key=lambda name: rank.get(name, ()))
+
+    def _update_subtitle(self):
+        """Collection state, errors and counts go in the bottom border"""
+        if self.error:
+            subtitle = f"{Symbols.CONTAINER_ERROR} Docker error: {escape(self.error)}"
+        elif not self.collected and self.cached_at is None:
+            subtitle = f"{Symbols.PENDING_ICON} Collecting container data..."
+        elif not self.containers:
+            subtitle = f"{Symbols.CONTAINER_ERROR} No containers found"
+        else:
+            running = sum(container.status == "running" for container in self.containers)
+            subtitle = f"{running} running, {len(self.containers) - running} stopped"
+            if self.cached_at is not None:
+                subtitle = f"{cached_note(self.cached_at)} {subtitle}"
+        self.border_subtitle = subtitle
+
+    def on_data_table_row_selected(self, event):
+        """Enter on a container opens its process drilldown"""
+        for container in self.containers:
+            if container.container_id == event.row_key.value:
+                self.app.push_screen(ContainerScreen(container, self.io_sampler))
+                return
 
-    def render(self):
-        lines = ["Docker Containers:"]
-        
-        running_containers = [c for c in self.docker_data if c["Status"] == "running"]
-        stopped_containers = [c for c in self.docker_data if c["Status"] != "running"]
-        
-        if running_containers:
-            lines.append("Running Containers:")
-            for container in running_containers:
-                lines.append(f"  {Symbols.CONTAINER_RUNNING} {container['Name']}")
-                lines.append(f"     Image: {container['Image']}")
-                lines.append(f"     CPU: {container['CPU']} | Mem: {container['Memory']}")
-                
-                # Make ports clickable (temporarily disabled due to markup issue)
-                # clickable_ports = self._format_clickable_ports(container['Ports'])
-                # For now, show ports with simple formatting and add instruction
-                ports_display = container['Ports']
-                if ports_display and ports_display not in ["-", "N/A"]:
-                    # Extract port numbers for user reference
-                    port_matches = re.findall(r'(\d+)', ports_display)
-                    if port_matches:
-                        unique_ports = list(set(port_matches))
-                        port_hint = f" (try: http://localhost:{unique_ports[0]})" if len(unique_ports) == 1 else f" (try ports: {', '.join(unique_ports)})"
-                        lines.append(f"     Ports: {ports_display}{port_hint}")
-                    else:
-                        lines.append(f"     Ports: {ports_display}")
-                else:
-                    lines.append(f"     Ports: {ports_display}")
-        
-        if stopped_containers:
-            lines.append("Stopped/Exited Containers:")
-            for container in stopped_containers:
-                status_icon = Symbols.CONTAINER_STOPPED if container['Status'] == "stopped" else Symbols.CONTAINER_ERROR
-                lines.append(f"  {status_icon} {container['Name']} ({container['Status']})")
-        
-        return "\n".join(lines)
-    
     def toggle_container(self, container_id):
-        for container in self.docker_data:
-            if container["Container ID"] == container_id:
-                container["Status"] = "running" if container["Status"] == "stopped" else "stopped"
-        self.refresh()
+        self.containers = tuple(
+            container._replace(status="running" if container.status == "stopped" else "stopped")
+            if container.container_id == container_id else container
+            for container in self.containers
+        )
         self.update_docker_data()
 
-class CustomHeader(Static):
+class CustomHeader(Paced, Static):
     """Custom header showing system monitor title and current date/time"""
     
     def on_mount(self):
+        self.shown = None
         self.set_interval(1, self.update_time)  # Update every second
         self.update_time()
     
     def update_time(self):
         current_time = datetime.now()
         date_str = current_time.strftime("%A, %B %d, %Y")
-        time_str = current_time.strftime("%H:%M:%S")
-        self.update(f"{Symbols.GPU_ICON} System Monitor    {Symbols.CALENDAR_ICON} {date_str}    {Symbols.CLOCK_ICON} {time_str}")
+        # Low-bandwidth mode drops the seconds, so the header repaints once a minute
+        time_str = current_time.strftime("%H:%M" if self.app.low_bandwidth else "%H:%M:%S")
+        header = f"{Symbols.GPU_ICON} System Monitor    {Symbols.CALENDAR_ICON} {date_str}    {Symbols.CLOCK_ICON} {time_str}"
+        if header != self.shown:
+            self.shown = header
+            self.update(Text(header))
 
-class LogPanel(Log):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.log_counter = 0
+class LogSpill:
+    """Copies log entries to a size-rotated file from a background thread.
+
+    write() only enqueues; a QueueListener thread does the file I/O and the
+    RotatingFileHandler keeps `backup_count` files of at most `max_bytes`.
+    """
+
+    MAX_BYTES = 1024 * 1024
+    BACKUP_COUNT = 3
+
+    def __init__(self, path, max_bytes=MAX_BYTES, backup_count=BACKUP_COUNT):
+        # Only pay for logging.handlers (and what it pulls in) when spilling is enabled
+        import logging
+        import logging.handlers
+        import queue
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count,
+                                                       encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+        records = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(records, handler)
+        self._logger = logging.getLogger(f"{__name__}.spill.{id(self)}")
+        self._logger.propagate = False
+        self._logger.setLevel(logging.INFO)
+        self._logger.addHandler(logging.handlers.QueueHandler(records))
+        self._levels = {"info": logging.INFO, "warning": logging.WARNING, "error": logging.ERROR}
+        self._listener.start()
+
+    def write(self, message, level="info"):
+        self._logger.log(self._levels.get(level, self._levels["info"]), message)
+
+    def close(self):
+        """Drain the queue and close the file"""
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+
+class LogPanel(Paced, Log):
+    """System log of real events (collector errors, timeouts, state changes).
+
+    The widget keeps at most `max_lines` lines in memory, dropping the
+    oldest, so it stays cheap however long the monitor runs.  With a
+    `log_file`, every entry is also spilled to a rotating file.
+    """
+
+    MAX_LINES = 1000
+
+    def __init__(self, max_lines=MAX_LINES, log_file=None, **kwargs):
+        super().__init__(max_lines=max_lines, **kwargs)
+        self.spill = LogSpill(log_file) if log_file else None
         
     def on_mount(self):
-        self.write(f"[{time.strftime('%X')}] System Monitor started\n")
-        self.set_interval(10, self.add_periodic_log_entry)  # Reduced frequency
-        self.scroll_end(animate=False)
+        self.add_log_entry("System Monitor started")
 
-    def add_log_entry(self, message):
+    def on_unmount(self):
+        if self.spill is not None:
+            self.spill.close()
+
+    def add_log_entry(self, message, level="info"):
         """Add a custom log entry with timestamp"""
         timestamp = time.strftime('%X')
-        self.write(f"[{timestamp}] {message}\n")
+        prefix = "" if level == "info" else f"{level.upper()}: "
+        self.write(f"[{timestamp}] {prefix}{message}\n")
         self.scroll_end(animate=False)
+        if self.spill is not None:
+            self.spill.write(message, level)
 
-    def add_periodic_log_entry(self):
-        """Add periodic status updates"""
-        self.log_counter += 1
-        timestamp = time.strftime('%X')
-        
-        # Add different types of log messages periodically
-        if self.log_counter % 3 == 1:
-            self.write(f"[{timestamp}] System monitoring active - Update #{self.log_counter}\n")
-        elif self.log_counter % 3 == 2:
-            self.write(f"[{timestamp}] GPU and network stats refreshed\n")
-        else:
-            self.write(f"[{timestamp}] All systems operational\n")
-            
-        self.scroll_end(animate=False)
+class HistoryView(Static):
+    """Graph of one stored metric over a time window (filled: average, shaded: up to max)"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.metric = None
+        self.start = self.end = 0
+        self.buckets = []       # (min, avg, max) or None per column
+        self.message = "Loading history..."
+
+    def render(self):
+        if self.metric is None or not any(self.buckets):
+            return panel_text([self.metric or "", "", f"{Symbols.NO_DATA_ICON} {self.message}"])
+
+        width = len(self.buckets)
+        height = max(self.size.height - 6, 4)
+        present = [bucket for bucket in self.buckets if bucket]
+        top = max(high for _, _, high in present) or 1
+
+        start_str = datetime.fromtimestamp(self.start).strftime("%m-%d %H:%M")
+        end_str = datetime.fromtimestamp(self.end).strftime("%m-%d %H:%M")
+        lines = [f"{self.metric}    {start_str} → {end_str}"]
+        lines.append(Symbols.BOX_TOP_LEFT + Symbols.BOX_HORIZONTAL * width + Symbols.BOX_TOP_RIGHT)
+        for row in range(height):
+            threshold = (height - row) / height
+            content = ""
+            for bucket in self.buckets:
+                if bucket is None:
+                    content += " "
+                elif bucket[1] / top >= threshold:
+                    content += Symbols.PROGRESS_FILLED
+                elif bucket[2] / top >= threshold:
+                    content += Symbols.PROGRESS_EMPTY
+                else:
+                    content += " "
+            lines.append(Symbols.BOX_VERTICAL + content + Symbols.BOX_VERTICAL)
+        lines.append(Symbols.BOX_BOTTOM_LEFT + Symbols.BOX_HORIZONTAL * width + Symbols.BOX_BOTTOM_RIGHT)
+
+        low = min(bucket[0] for bucket in present)
+        mean = sum(bucket[1] for bucket in present) / len(present)
+        lines.append(f"Min: {low:.1f}  Avg: {mean:.1f}  Max: {top:.1f}    "
+                     f"{Symbols.PROGRESS_FILLED} avg  {Symbols.PROGRESS_EMPTY} max")
+        return panel_text(lines)
+
+class HistoryScreen(Screen):
+    """Browse the on-disk metrics history: pick a metric, then pan and zoom in time"""
+
+    SPANS = (900, 3600, 6 * 3600, 24 * 3600)     # selectable window sizes (seconds)
+
+    BINDINGS = [
+        ("escape", "app.pop_screen", "Close"),
+        ("up", "select_metric(-1)", "Prev Metric"),
+        ("down", "select_metric(1)", "Next Metric"),
+        ("left", "pan(-1)", "Back"),
+        ("right", "pan(1)", "Forward"),
+        ("z", "zoom(1)", "Zoom Out"),
+        ("Z", "zoom(-1)", "Zoom In"),
+        ("end", "latest", "Latest"),
+    ]
+
+    def __init__(self, metrics_store, **kwargs):
+        super().__init__(**kwargs)
+        self.metrics_store = metrics_store
+        self.metric_names = []
+        self.metric_index = 0
+        self.span_index = 1
+        self.window_end = None      # None follows the present
+
+    def compose(self) -> ComposeResult:
+        self.view = HistoryView(id="history-view")
+        self.view.border_title = f"{Symbols.GRAPH_ICON} History"
+        yield self.view
+        yield Footer()
+
+    def on_mount(self):
+        self.run_worker(self._load_metric_names, thread=True, exclusive=True, group="history")
+
+    def _load_metric_names(self):
+        names = self.metrics_store.metric_names()
+        self.app.call_from_thread(self._set_metric_names, names)
+
+    def _set_metric_names(self, names):
+        self.metric_names = names
+        if not names:
+            self.view.message = "No history recorded yet"
+            self.view.refresh()
+            return
+        self.reload()
+
+    def reload(self):
+        """Query the selected window on a worker thread"""
+        if not self.metric_names:
+            return
+        metric = self.metric_names[self.metric_index]
+        span = self.SPANS[self.span_index]
+        end = self.window_end if self.window_end is not None else time.time()
+        columns = max(self.view.size.width - 2, 20)
+        self.run_worker(lambda: self._query(metric, end - span, end, columns),
+                        thread=True, exclusive=True, group="history")
+
+    def _query(self, metric, start, end, columns):
+        buckets = self.metrics_store.query(metric, start, end, columns)
+        self.app.call_from_thread(self._show, metric, start, end, buckets)
+
+    def _show(self, metric, start, end, buckets):
+        self.view.metric = metric
+        self.view.start, self.view.end = start, end
+        self.view.buckets = buckets
+        self.view.message = "No samples in this window"
+        self.view.border_title = f"{Symbols.GRAPH_ICON} History ({self.metric_index + 1}/{len(self.metric_names)})"
+        self.view.refresh()
+
+    def action_select_metric(self, step):
+        if self.metric_names:
+            self.metric_index = (self.metric_index + step) % len(self.metric_names)
+            self.reload()
+
+    def action_pan(self, direction):
+        span = self.SPANS[self.span_index]
+        end = (self.window_end if self.window_end is not None else time.time()) + direction * span / 2
+        self.window_end = None if end >= time.time() else end
+        self.reload()
+
+    def action_zoom(self, step):
+        self.span_index = max(0, min(self.span_index + step, len(self.SPANS) - 1))
+        self.reload()
+
+    def action_latest(self):
+        self.window_end = None
+        self.reload()
+
+class ContainerProcessTable(Paced, DataTable):
+    """One container's processes, keyed by PID; only changed cells are updated each poll"""
+
+    COLUMNS = (   # label, key, width
+        ("PID", "pid", 8),
+        ("Threads", "threads", 7),
+        ("CPU%", "cpu", 7),
+        ("RSS", "rss", 8),
+        ("GPU Mem", "gpu_memory", 9),
+        ("Command", "command", None),
+    )
+    # Largest first; PID breaks ties so rows don't jump between polls
+    SORT_ORDERS = (
+        ("CPU", lambda p: (-(p.cpu or 0), p.pid)),
+        ("memory", lambda p: (-(p.rss or 0), p.pid)),
+        ("GPU memory", lambda p: (-(p.gpu_memory or 0), p.pid)),
+        ("PID", lambda p: (p.pid,)),
+    )
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.zebra_stripes = True
+        self.cursor_type = "row"
+        self.sort_index = 0
+        self.processes = ()
+        self._row_cells = {}        # pid -> (process, cells) currently shown in its row
+
+    def on_mount(self):
+        for label, key, width in self.COLUMNS:
+            self.add_column(label, key=key, width=width)
+
+    @staticmethod
+    def row_cells(process):
+        return (
+            str(process.pid),
+            Text(str(process.threads), justify="right"),
+            Text(f"{process.cpu:.1f}" if process.cpu is not None else "-", justify="right"),
+            Text(format_size_mb(process.rss), justify="right"),
+            Text(f"{process.gpu_memory} MB" if process.gpu_memory is not None else "-", justify="right"),
+            Text(process.command),     # not markup: kernel threads show as "[kworker/0:1]"
+        )
+
+    def update_processes(self, processes):
+        """Bring the table in line with `processes`, touching only rows and cells that changed"""
+        self.processes = processes
+        current = {process.pid: process for process in processes}
+        for pid in self._row_cells.keys() - current.keys():
+            self.remove_row(str(pid))
+            del self._row_cells[pid]
+        for pid, process in current.items():
+            shown = self._row_cells.get(pid)
+            if shown is not None and shown[0] == process:
+                continue
+            cells = self.row_cells(process)
+            if shown is None:
+                self.add_row(*cells, key=str(pid))
+            else:
+                for (_, column, _), old, new in zip(self.COLUMNS, shown[1], cells):
+                    if old != new:
+                        self.update_cell(str(pid), column, new)
+            self._row_cells[pid] = (process, cells)
+        self.sort_rows()
+
+    def sort_rows(self):
+        order = self.SORT_ORDERS[self.sort_index][1]
+        rank = {str(process.pid): order(process) for process in self.processes}
+        if rank:
+            self.sort("pid", key=lambda pid: rank.get(pid, ()))
+
+class ContainerScreen(Screen):
+    """Drilldown into one container's processes, read from its cgroup.
+
+    The sampler only runs while this screen is open; closing it stops the
+    timer and releases the per-process file handles.
+    """
+
+    INTERVAL = 2    # seconds between samples
+
+    BINDINGS = [
+        ("escape", "app.pop_screen", "Close"),
+        ("s", "cycle_sort", "Sort"),
+    ]
+
+    def __init__(self, container, io_sampler, **kwargs):
+        super().__init__(**kwargs)
+        self.container = container
+        self.io_sampler = io_sampler    # knows the cgroup of every running container
+        self.sampler = None
+        self.error = None
+
+    def compose(self) -> ComposeResult:
+        self.table = ContainerProcessTable(id="container-processes")
+        self.update_title()
+        self.table.border_subtitle = f"{Symbols.PENDING_ICON} Reading processes..."
+        yield self.table
+        yield Footer()
+
+    def on_mount(self):
+        self.sample()
+        self.set_interval(self.INTERVAL, self.sample)
+
+    def on_unmount(self):
+        if self.sampler is not None:
+            self.sampler.close()
+
+    def update_title(self):
+        order = ContainerProcessTable.SORT_ORDERS[self.table.sort_index][0]
+        self.table.border_title = f"{Symbols.DOCKER_ICON} {self.container.name} processes (by {order})"
+
+    def sample(self):
+        """Read the container's processes on a worker thread"""
+        if self.sampler is None:
+            cgroup = self.io_sampler.cgroup_dir(self.container.container_id)
+            if cgroup is None:
+                # Located by the Docker collector on its next poll if the container is running
+                self.show((), "Container is not running (or its cgroup v2 directory isn't known yet)")
+                return
+            self.sampler = ContainerProcessSampler(cgroup)
+        self.run_worker(self._sample_worker, thread=True, exclusive=True, group="container-processes")
+
+    def _sample_worker(self):
+        try:
+            processes, error = self.sampler.sample(), None
+        except (OSError, ValueError) as e:
+            processes, error = [], f"Container stopped or cgroup unreadable: {e}"
+        self.app.call_from_thread(self.apply_sample, processes, error)
+
+    def apply_sample(self, processes, error):
+        """Add GPU memory from the GPU collector's last scan and show the sample (UI thread)"""
+        if not self.is_mounted:
+            return
+        gpu_stats = self.app.gpu_stats
+        gpu_memory = gpu_stats.gpu_memory if gpu_stats is not None else {}
+        self.show(tuple(process._replace(gpu_memory=gpu_memory.get(process.pid)) for process in processes), error)
+
+    def show(self, processes, error):
+        self.error = error
+        self.table.update_processes(processes)
+        if error:
+            self.table.border_subtitle = f"{Symbols.CONTAINER_ERROR} {escape(error)}"
+            return
+        cpu = sum(process.cpu or 0 for process in processes)
+        rss = sum(process.rss or 0 for process in processes)
+        self.table.border_subtitle = f"{len(processes)} processes, CPU {cpu:.1f}%, RSS {format_size_mb(rss)}"
+
+    def action_cycle_sort(self):
+        self.table.sort_index = (self.table.sort_index + 1) % len(ContainerProcessTable.SORT_ORDERS)
+        self.update_title()
+        self.table.sort_rows()
 
 class SystemMonitorApp(App):
     CSS_PATH = "styles.css"
@@ -1106,42 +4413,255 @@ class SystemMonitorApp(App):
         ("d", "toggle_docker_1", "Toggle Docker 1"),
         ("D", "toggle_docker_2", "Toggle Docker 2"),
         ("l", "toggle_log_panel", "Toggle Log Panel"),
+        ("o", "toggle_gpu_overview", "GPU Overview"),
+        ("z", "zoom_out_graph", "Zoom Out Graph"),
+        ("Z", "zoom_in_graph", "Zoom In Graph"),
+        ("h", "show_history", "History"),
+        ("s", "sort_docker", "Sort Containers"),
     ]
 
+    def __init__(self, metrics_store=None, log_lines=LogPanel.MAX_LINES, log_file=None,
+                 snapshot=None, bench_startup=False, alert_engine=None, alert_command=None,
+                 alert_webhook=None, config=None, config_path=None, max_fps=FrameClock.DEFAULT_FPS,
+                 low_bandwidth=False, **kwargs):
+        super().__init__(**kwargs)
+        self.frame_clock = FrameClock(self, max_fps)
+        self.low_bandwidth = low_bandwidth  # no seconds in the header clock
+        self.config = config or Config()
+        self.config_path = config_path      # re-read on SIGHUP
+        self.metrics_store = metrics_store
+        self.history_failed = False         # the store's writer error has been logged
+        self.alert_engine = alert_engine
+        self.alert_command = alert_command  # argv list; the alert's state, rule, metric and value are appended
+        self.alert_webhook = alert_webhook  # URL that gets each alert POSTed as JSON
+        self.log_lines = log_lines
+        self.log_file = log_file
+        self.snapshot = snapshot            # warm-start data from SnapshotCache.load()
+        self.bench_startup = bench_startup
+        self.startup_report = []            # (milestone, seconds since PROCESS_START)
+        self.gpu_overview = None            # built on first toggle
+        # Panels of disabled collectors are never created; these stay None
+        self.gpu_stats = self.gpu_process_table = self.cpu_stats = self.disk_stats = None
+        self.net_stats = self.net_graph = self.rdma_stats = self.conn_stats = self.docker_stats = None
+
+    def record_event(self, message, level="info"):
+        """Send a collector event (error, timeout, state change) to the system log"""
+        if hasattr(self, 'log_panel'):
+            self.log_panel.add_log_entry(message, level)
+
+    def publish_metrics(self, samples, timestamp=None, source=None):
+        """Hand a {metric: value} batch from a collector to the history store and alert rules.
+
+        `source` names the collector's batch; alerts on its metrics that are
+        missing from a later batch are resolved.
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        if samples and self.metrics_store is not None:
+            self.metrics_store.record(timestamp, samples)
+            if self.metrics_store.error is not None and not self.history_failed:
+                self.history_failed = True
+                self.record_event(f"History recording stopped: {self.metrics_store.error}", "error")
+        if self.alert_engine is not None:
+            for alert in self.alert_engine.evaluate(timestamp, samples, source=source):
+                self.report_alert(alert)
+
+    def report_alert(self, alert):
+        """Log a firing/resolved alert and pass it to the command and webhook hooks"""
+        if alert.state == "firing":
+            self.record_event(f"Alert: {alert.rule} ({alert.metric} = {alert.value:g})", "warning")
+        else:
+            self.record_event(f"Resolved: {alert.rule} ({alert.metric} = {alert.value:g})")
+        if self.alert_command or self.alert_webhook:
+            self.run_worker(partial(self._send_alert, alert), thread=True, group="alert-hooks")
+
+    def _send_alert(self, alert):
+        import json
+        import urllib.request
+
+        if self.alert_command:
+            cmd = [*self.alert_command, alert.state, alert.rule, alert.metric, f"{alert.value:g}"]
+            try:
+                result = process_runner.run("alert-command", cmd, timeout=10)
+                if result.returncode != 0:
+                    raise subprocess.CalledProcessError(result.returncode, cmd)
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError, SourceUnavailable) as e:
+                self.call_from_thread(self.record_event, f"Alert command failed: {e}", "error")
+        if self.alert_webhook:
+            request = urllib.request.Request(self.alert_webhook, data=json.dumps(alert._asdict()).encode(),
+                                             headers={"Content-Type": "application/json"}, method="POST")
+            try:
+                with urllib.request.urlopen(request, timeout=10):
+                    pass
+            except (OSError, ValueError) as e:
+                self.call_from_thread(self.record_event, f"Alert webhook failed: {e}", "error")
+
     def compose(self) -> ComposeResult:
+        config = self.config
         yield CustomHeader(id="header")
         with Container():
             # GPU Stats and Processes side by side at the top
-            with Horizontal():
-                self.gpu_stats = GPUStats(id="gpu-panel")
-                self.gpu_stats.border_title = f"{Symbols.GPU_ICON}  GPU Statistics"
-                yield self.gpu_stats
-                
-                self.gpu_process_table = GPUProcessTable(id="gpu-process-table")
-                yield self.gpu_process_table
+            if config["gpu"].enabled:
+                with Horizontal(id="gpu-row"):
+                    self.gpu_stats = GPUStats(config["gpu"], id="gpu-panel")
+                    self.gpu_stats.border_title = f"{Symbols.GPU_ICON}  GPU Statistics"
+                    yield self.gpu_stats
+
+                    self.gpu_process_table = GPUProcessTable(id="gpu-process-table")
+                    yield self.gpu_process_table
             
+            # Host CPU, memory and disks below the GPUs that they feed
+            if config["cpu"].enabled or config["disk"].enabled:
+                with Horizontal(id="host-row"):
+                    if config["cpu"].enabled:
+                        self.cpu_stats = CPUStats(config["cpu"], id="cpu-panel")
+                        self.cpu_stats.border_title = f"{Symbols.CPU_ICON} CPU & Memory"
+                        yield self.cpu_stats
+
+                    if config["disk"].enabled:
+                        self.disk_stats = DiskStats(config["disk"], id="disk-panel")
+                        self.disk_stats.border_title = f"{Symbols.DISK_ICON} Disk I/O"
+                        yield self.disk_stats
+
+            if config["rdma"].enabled:
+                self.rdma_stats = RdmaStats(config["rdma"], id="rdma-panel")
+                self.rdma_stats.border_title = f"{Symbols.RDMA_ICON} RDMA Ports"
+
             # Create network panels side by side below GPU stats
-            with Horizontal():
-                self.net_stats = NetworkStats(id="network-panel")
-                self.net_stats.border_title = f"{Symbols.NETWORK_ICON} Network Interfaces"
-                self.net_graph = NetworkGraph(self.net_stats, id="network-graph-panel")
-                self.net_graph.border_title = f"{Symbols.GRAPH_ICON} Network Activity"
-                yield self.net_stats
-                yield self.net_graph
+            if config["network"].enabled:
+                with Horizontal():
+                    self.net_stats = NetworkStats(config["network"], id="network-panel")
+                    self.net_stats.border_title = f"{Symbols.NETWORK_ICON} Network Interfaces"
+                    self.net_graph = NetworkGraph(self.net_stats, self.rdma_stats, id="network-graph-panel")
+                    self.net_graph.border_title = f"{Symbols.GRAPH_ICON} Network Activity"
+                    yield self.net_stats
+                    yield self.net_graph
+
+            # InfiniBand/RoCE ports under the interface panels (hidden without RDMA hardware)
+            if self.rdma_stats is not None:
+                yield self.rdma_stats
             
+            # Socket summary under the interface panels
+            if config["connections"].enabled:
+                self.conn_stats = ConnectionStats(config["connections"], id="connections-panel")
+                self.conn_stats.border_title = f"{Symbols.CONNECTIONS_ICON} Connections"
+                yield self.conn_stats
+
             # Docker stats below network panels
-            self.docker_stats = DockerStats(id="docker-panel")
-            self.docker_stats.border_title = f"{Symbols.DOCKER_ICON} Docker Containers"
-            yield self.docker_stats
+            if config["docker"].enabled:
+                self.docker_stats = DockerStats(config["docker"], id="docker-panel")
+                yield self.docker_stats
             
             # Create log panel but don't yield it yet (it starts hidden)
-            self.log_panel = LogPanel(id="log-panel")
+            self.log_panel = LogPanel(max_lines=self.log_lines, log_file=self.log_file, id="log-panel")
             self.log_panel.border_title = f"{Symbols.LOG_ICON} System Log"
             self.log_panel.display = False  # Start hidden
             yield self.log_panel  # Always yield it, but control visibility via display property
         yield Footer()
 
+        if self.snapshot:
+            self.apply_snapshot(self.snapshot)
+
+    @property
+    def collectors(self):
+        """Config section name -> panel, for the collectors that were created"""
+        panels = {"gpu": self.gpu_stats, "cpu": self.cpu_stats, "disk": self.disk_stats,
+                  "network": self.net_stats, "rdma": self.rdma_stats, "connections": self.conn_stats,
+                  "docker": self.docker_stats}
+        return {name: panel for name, panel in panels.items() if panel is not None}
+
+    def on_mount(self):
+        self.frame_clock.start()
+        if self.config_path is not None and hasattr(signal, "SIGHUP"):
+            asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, self.reload_config)
+
+    def on_unmount(self):
+        self.frame_clock.stop()
+        if self.config_path is not None and hasattr(signal, "SIGHUP"):
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+
+    async def run_action(self, *args, **kwargs):
+        """Run a (key) action, then paint its effect without waiting for the next frame tick"""
+        try:
+            return await super().run_action(*args, **kwargs)
+        finally:
+            self.frame_clock.flush()
+
+    def reload_config(self):
+        """Re-read the config file (SIGHUP): new intervals and filters apply right away"""
+        try:
+            config = Config.load(self.config_path) if os.path.exists(self.config_path) else Config()
+        except ConfigError as e:
+            self.record_event(f"Config reload failed, keeping the current settings: {e}", "error")
+            return
+        collectors = self.collectors
+        for name, settings in config.collectors.items():
+            panel = collectors.get(name)
+            if panel is None:
+                if settings.enabled:
+                    self.record_event(f"The {name} collector was disabled at startup; restart to enable it", "warning")
+            elif settings != panel.config:
+                panel.apply_config(settings)
+        self.config = config
+        self.record_event(f"Reloaded {self.config_path}")
+
+    def apply_snapshot(self, snapshot):
+        """Seed the panels with cached data so the first frame isn't empty"""
+        cached_at = snapshot["time"]
+        try:
+            if self.gpu_stats is not None:
+                self.gpu_stats.gpus = tuple(GPUSample(*gpu) for gpu in snapshot.get("gpus", ()))
+                self.gpu_stats.cached_at = cached_at
+            if self.net_stats is not None:
+                self.net_stats.interfaces = tuple(
+                    InterfaceSample(*iface[:3], tuple(tuple(address) for address in iface[3]), *iface[4:])
+                    for iface in snapshot.get("interfaces", ()))
+                self.net_stats.total_rx = snapshot.get("total_rx", 0)
+                self.net_stats.total_tx = snapshot.get("total_tx", 0)
+                self.net_stats.cached_at = cached_at
+            if self.docker_stats is not None:
+                self.docker_stats.containers = tuple(ContainerSample(*container) for container in snapshot.get("containers", ()))
+                self.docker_stats.cached_at = cached_at
+        except (TypeError, ValueError):
+            pass  # snapshot from an incompatible version; panels fall back to placeholders
+
+    def take_snapshot(self):
+        """Latest live samples as a JSON-friendly dict for SnapshotCache.save()"""
+        snapshot = {"time": time.time()}
+        if self.gpu_stats is not None:
+            snapshot["gpus"] = [list(gpu) for gpu in self.gpu_stats.gpus]
+        if self.net_stats is not None:
+            snapshot["interfaces"] = [list(iface) for iface in self.net_stats.interfaces]
+            snapshot["total_rx"] = self.net_stats.total_rx
+            snapshot["total_tx"] = self.net_stats.total_tx
+        if self.docker_stats is not None:
+            snapshot["containers"] = [list(container) for container in self.docker_stats.containers]
+        return snapshot
+
+    def on_ready(self):
+        if self.bench_startup:
+            self.call_after_refresh(self._bench_first_frame)
+
+    def _bench_first_frame(self):
+        self.startup_report.append(("first frame", time.perf_counter() - PROCESS_START))
+        labels = {"gpu": "GPU", "cpu": "CPU", "disk": "disk", "network": "network", "rdma": "RDMA",
+                  "connections": "connections", "docker": "Docker"}
+        self._bench_pending = {labels[name]: panel for name, panel in self.collectors.items()}
+        self._bench_deadline = time.perf_counter() + 15
+        self.set_interval(0.01, self._bench_poll)
+
+    def _bench_poll(self):
+        """Note when each collector first reports; exit once all have (or on timeout)"""
+        for name, panel in list(self._bench_pending.items()):
+            if panel.collected:
+                self.startup_report.append((f"{name} data", time.perf_counter() - PROCESS_START))
+                del self._bench_pending[name]
+        if not self._bench_pending or time.perf_counter() > self._bench_deadline:
+            self.startup_report.extend((f"{name} data", None) for name in self._bench_pending)
+            self.exit()
+
     def action_next_gpu(self):
+        if self.gpu_stats is None:
+            return
         old_gpu = self.gpu_stats.gpu_id
         self.gpu_stats.next_gpu()
         new_gpu = self.gpu_stats.gpu_id
@@ -1153,6 +4673,8 @@ class SystemMonitorApp(App):
             self.log_panel.add_log_entry(f"Switched from GPU {old_gpu} to GPU {new_gpu}")
 
     def action_previous_gpu(self):
+        if self.gpu_stats is None:
+            return
         old_gpu = self.gpu_stats.gpu_id
         self.gpu_stats.previous_gpu()
         new_gpu = self.gpu_stats.gpu_id
@@ -1164,6 +4686,8 @@ class SystemMonitorApp(App):
             self.log_panel.add_log_entry(f"Switched from GPU {old_gpu} to GPU {new_gpu}")
 
     def action_next_interface(self):
+        if self.net_stats is None:
+            return
         old_interface = self.net_stats.interface
         self.net_stats.next_interface()
         new_interface = self.net_stats.interface
@@ -1172,6 +4696,8 @@ class SystemMonitorApp(App):
             self.log_panel.add_log_entry(f"Switched network interface from {old_interface} to {new_interface}")
 
     def action_previous_interface(self):
+        if self.net_stats is None:
+            return
         old_interface = self.net_stats.interface
         self.net_stats.previous_interface()
         new_interface = self.net_stats.interface
@@ -1179,11 +4705,48 @@ class SystemMonitorApp(App):
         if hasattr(self, 'log_panel') and old_interface != new_interface:
             self.log_panel.add_log_entry(f"Switched network interface from {old_interface} to {new_interface}")
 
+    def action_zoom_out_graph(self):
+        if self.net_graph is not None:
+            self.net_graph.zoom(+1)
+
+    def action_zoom_in_graph(self):
+        if self.net_graph is not None:
+            self.net_graph.zoom(-1)
+
+    def action_show_history(self):
+        """Open the on-disk history browser"""
+        if self.metrics_store is None:
+            self.notify("History is not being recorded (start with --history-db)", severity="warning")
+            return
+        self.push_screen(HistoryScreen(self.metrics_store))
+
+    def action_sort_docker(self):
+        """Cycle the Docker table between sorting by CPU, memory and name"""
+        if self.docker_stats is not None:
+            self.docker_stats.cycle_sort()
+
     def action_toggle_docker_1(self):
-        self.docker_stats.toggle_container("1")
+        if self.docker_stats is not None:
+            self.docker_stats.toggle_container("1")
 
     def action_toggle_docker_2(self):
-        self.docker_stats.toggle_container("2")
+        if self.docker_stats is not None:
+            self.docker_stats.toggle_container("2")
+
+    def action_toggle_gpu_overview(self):
+        """Toggle the all-GPU sparkline overview"""
+        if self.gpu_stats is None:
+            return
+        if self.gpu_overview is None:
+            # Built on first use, below the GPU row
+            self.gpu_overview = GPUOverview(self.gpu_stats, id="gpu-overview-panel")
+            self.gpu_overview.border_title = f"{Symbols.GRAPH_ICON} GPU Overview"
+            gpu_row = self.query_one("#gpu-row")
+            gpu_row.parent.mount(self.gpu_overview, after=gpu_row)
+            return
+        self.gpu_overview.display = not self.gpu_overview.display
+        if self.gpu_overview.display:
+            self.gpu_overview.refresh()
 
     def action_toggle_log_panel(self):
         """Toggle the visibility of the log panel"""
@@ -1202,7 +4765,93 @@ class SystemMonitorApp(App):
                 self.call_after_refresh(self.log_panel.scroll_visible)
 
 if __name__ == "__main__":
-    app = SystemMonitorApp()
-    app.run()
+    parser = argparse.ArgumentParser(description="GPU, network and Docker monitor")
+    parser.add_argument("--history-db", nargs="?", const=MetricsStore.DEFAULT_PATH, metavar="PATH",
+                        help=f"record metrics to a SQLite file (default: {MetricsStore.DEFAULT_PATH})")
+    parser.add_argument("--log-lines", type=int, default=LogPanel.MAX_LINES, metavar="N",
+                        help="lines kept in the in-app system log (default: %(default)s)")
+    parser.add_argument("--log-file", metavar="PATH",
+                        help="also write the system log to PATH, rotated at 1 MB with 3 backups")
+    parser.add_argument("--no-warm-start", action="store_true",
+                        help="don't show or save the last-known data snapshot")
+    parser.add_argument("--bench-startup", action="store_true",
+                        help="report time to first frame and to each panel's first live data, then exit")
+    parser.add_argument("--profile", nargs="?", const="monitor-profile.txt", metavar="PATH",
+                        help="measure timer lag and collector/render times, print a summary on exit and write "
+                             "stack samples to PATH: collapsed stacks, or speedscope JSON for a .json path "
+                             "(default: %(const)s)")
+    parser.add_argument("--max-fps", type=float, metavar="N",
+                        help=f"repaint at most N times a second; 0 repaints on every change "
+                             f"(default: {FrameClock.DEFAULT_FPS}, or {FrameClock.LOW_BANDWIDTH_FPS} with --low-bandwidth)")
+    parser.add_argument("--low-bandwidth", action="store_true",
+                        help="for slow SSH/tmux links: repaint once a second and show the clock without seconds")
+    parser.add_argument("--config", metavar="PATH",
+                        help=f"TOML config file, re-read on SIGHUP (default: {Config.DEFAULT_PATH} if it exists)")
+    parser.add_argument("--alert", action="append", default=[], metavar="RULE",
+                        help="alert rule such as 'gpu.*.temperature > 80 for 30s' (repeatable; replaces the defaults)")
+    parser.add_argument("--alert-rules", metavar="PATH",
+                        help="file of alert rules, one per line (# starts a comment)")
+    parser.add_argument("--alert-command", metavar="CMD",
+                        help="run CMD for each alert with its state, rule, metric and value as arguments")
+    parser.add_argument("--alert-webhook", metavar="URL",
+                        help="POST each alert to URL as JSON")
+    args = parser.parse_args()
+
+    max_fps = args.max_fps
+    if max_fps is None:
+        max_fps = FrameClock.LOW_BANDWIDTH_FPS if args.low_bandwidth else FrameClock.DEFAULT_FPS
+    elif max_fps < 0:
+        parser.error("--max-fps can't be negative")
+
+    config_path = args.config or Config.DEFAULT_PATH
+    try:
+        config = Config.load(config_path) if args.config or os.path.exists(config_path) else Config()
+    except ConfigError as e:
+        parser.error(str(e))
+
+    rules = list(args.alert)
+    if args.alert_rules:
+        try:
+            with open(args.alert_rules) as rules_file:
+                rules.extend(line.split('#', 1)[0].strip() for line in rules_file)
+        except OSError as e:
+            parser.error(f"can't read --alert-rules: {e}")
+    try:
+        alert_engine = AlertEngine([rule for rule in rules if rule] if args.alert or args.alert_rules
+                                   else AlertEngine.DEFAULT_RULES)
+    except ValueError as e:
+        parser.error(str(e))
+
+    profiler = Profiler(args.profile) if args.profile else None
+    if profiler is not None:
+        profiler.install()      # before the panels exist, so their methods are wrapped
+
+    snapshot_cache = None if args.no_warm_start else SnapshotCache()
+    metrics_store = MetricsStore(args.history_db) if args.history_db else None
+    app = SystemMonitorApp(metrics_store=metrics_store, log_lines=args.log_lines, log_file=args.log_file,
+                           snapshot=snapshot_cache.load() if snapshot_cache else None,
+                           bench_startup=args.bench_startup, alert_engine=alert_engine,
+                           alert_command=shlex.split(args.alert_command) if args.alert_command else None,
+                           alert_webhook=args.alert_webhook, config=config, config_path=config_path,
+                           max_fps=max_fps, low_bandwidth=args.low_bandwidth)
+    if profiler is not None:
+        profiler.start()
+    try:
+        app.run()
+    finally:
+        if profiler is not None:
+            profiler.stop()
+        process_runner.shutdown()
+        if metrics_store is not None:
+            metrics_store.close()
+        if snapshot_cache is not None and any(panel.collected for panel in (app.gpu_stats, app.net_stats, app.docker_stats) if panel is not None):
+            snapshot_cache.save(app.take_snapshot())
+
+    for milestone, seconds in app.startup_report:
+        print(f"{milestone:<14} {'timed out' if seconds is None else f'{seconds * 1000:.0f} ms'}")
+
+    if profiler is not None:
+        print("\n".join(profiler.report()))
+        print(f"\n{profiler.write()} stack samples written to {profiler.path}")
 
    